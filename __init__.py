@@ -4,8 +4,13 @@
 # Author: Brett Fedack
 
 
+from .backends import CursesBackend, FakeClock, GridBackend, HeadlessBackend
 from .core import UI, Widget, ContentWidget, DatasigTranslator, Form, Group
+from .metrics import Metrics
 from .signals import Signal, SignalRouter
+from .sources import (
+    ArraySource, ListSource, OptionList, OptionSource, RowSource, SpillSource
+)
 from .widgets import (
     Button, FlipSwitch, NavList, NumericField, SelectField, StatusLine, Tab,
     Table, Text, TextBox, TextField, VertTab
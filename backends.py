@@ -0,0 +1,940 @@
+# Filename: backends.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import collections
+import curses
+import curses.ascii
+import os
+import sys
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class CursesBackend():
+    '''
+    Render backend that encapsulates a curses window in each widget
+
+    Attributes:
+        window_calls (int): Number of calls made to windows created while
+            counting calls
+        _count_calls (bool): Flag indicating that created windows count the
+            calls made to them
+    '''
+    def __init__(self, count_calls = False):
+        '''
+        Parameters:
+            count_calls (bool): _count_calls attribute initializer (Optional)
+        '''
+        self.window_calls = 0
+        self._count_calls = count_calls
+
+
+    @property
+    def counts_calls(self):
+        ''' Getter for "counts_calls" property '''
+        return self._count_calls
+
+
+    def start(self):
+        ''' Initializes the terminal '''
+        # Initialize curses library.
+        curses.initscr()
+        curses.noecho()          # Hidden input
+        curses.curs_set(0)       # Hidden cursor
+        curses.cbreak()          # Non-buffered input
+        if curses.has_colors():  # Color enabled
+            curses.start_color()
+
+
+    def stop(self):
+        ''' Restores the terminal '''
+        if not curses.isendwin():
+            curses.endwin()
+
+
+    def clock(self):
+        ''' Gets the current time (sec) from a monotonic clock '''
+        return time.monotonic()
+
+
+    def fileno(self):
+        '''
+        Gets the file descriptor from which user input is read
+
+        Returns:
+            int: File descriptor; None if input readiness cannot be polled
+        '''
+        return sys.stdin.fileno()
+
+
+    def resize(self):
+        '''
+        Resizes curses to match the terminal after a window size change; the
+        next key read is curses.KEY_RESIZE
+        '''
+        size = os.get_terminal_size(self.fileno())
+        curses.resizeterm(size.lines, size.columns)
+
+
+    def keyname(self, n):
+        '''
+        Gets the name of the given keyboard key
+
+        Parameters:
+            n (int): Numeric representation of keyboard key
+
+        Returns:
+            bytes: Key name
+        '''
+        return curses.keyname(n)
+
+
+    def newwin(self, height, width, y = 0, x = 0):
+        '''
+        Creates a window; zero dimensions extend to the edges of the screen
+
+        Parameters:
+            height (int): Height in rows
+            width (int): Width in columns
+            y (int): Row of upper-left corner (Optional)
+            x (int): Column of upper-left corner (Optional)
+
+        Returns:
+            curses.window: New window
+        '''
+        return self._wrap(curses.newwin(height, width, y, x))
+
+
+    def begin_draw(self, win, spans):
+        '''
+        Prepares the given window to be drawn
+
+        Parameters:
+            win (curses.window): Window to draw
+            spans (list<2-tuple>): Rows, as (start, stop) pairs, that are
+                copied to the screen; None copies every row
+        '''
+        return
+
+
+    def end_draw(self, win, spans):
+        '''
+        Copies the given window to the virtual screen once drawn
+
+        Parameters:
+            win (curses.window): Drawn window
+            spans (list<2-tuple>): Rows, as (start, stop) pairs, that are
+                copied to the screen; None copies every row
+        '''
+        # Only copy the given rows to the virtual screen.
+        if spans is not None:
+            win.touchline(0, win.getmaxyx()[0], False)
+            for start, stop in spans:
+                win.touchline(start, stop - start, True)
+        win.noutrefresh()
+
+
+    def doupdate(self):
+        ''' Updates the terminal to match the virtual screen '''
+        curses.doupdate()
+
+
+    def _wrap(self, win):
+        ''' Counts calls made to the given window, if enabled '''
+        return CountingWindow(win, self) if self._count_calls else win
+
+
+class GridBackend(CursesBackend):
+    '''
+    Render backend that composites all widgets into a single cell grid,
+    backed by NumPy arrays, and only sends changed cells to the terminal; the
+    grid follows terminal resizes, but, as with curses windows, widgets keep
+    their layout
+
+    Attributes:
+        _stdscr (curses.window): Window spanning the terminal
+        _chars (numpy.ndarray): Code points of the frame being drawn
+        _attrs (numpy.ndarray): Curses attributes of the frame being drawn
+        _shown_chars (numpy.ndarray): Code points on the terminal
+        _shown_attrs (numpy.ndarray): Curses attributes on the terminal
+    '''
+    def __init__(self, count_calls = False):
+        if numpy is None:
+            raise ImportError('GridBackend requires NumPy')
+        super().__init__(count_calls)
+        self._stdscr = None
+        self._chars = None
+        self._attrs = None
+
+
+    def start(self):
+        # Initialize curses library.
+        super().start()
+
+        # Read input through a single window spanning the terminal.
+        stdscr = curses.newwin(0, 0)
+        stdscr.keypad(1)
+        self._stdscr = stdscr
+
+        self._allocate(*stdscr.getmaxyx())
+
+
+    def newwin(self, height, width, y = 0, x = 0):
+        screen_height, screen_width = self._chars.shape
+        height = height if height else screen_height - y
+        width = width if width else screen_width - x
+        return self._wrap(GridWindow(self, height, width, y, x))
+
+
+    def begin_draw(self, win, spans):
+        win._spans = spans
+
+
+    def end_draw(self, win, spans):
+        win._spans = None
+
+
+    def doupdate(self):
+        chars = self._chars
+        attrs = self._attrs
+        stdscr = self._stdscr
+
+        # Find changed cells.
+        changed = (chars != self._shown_chars) | (attrs != self._shown_attrs)
+        for y in numpy.flatnonzero(changed.any(axis = 1)):
+            cols = numpy.flatnonzero(changed[y])
+            row_attrs = attrs[y, cols]
+
+            # Split changed cells into runs of adjacent, uniformly styled
+            # cells.
+            breaks = numpy.flatnonzero(
+                (numpy.diff(cols) != 1) | (numpy.diff(row_attrs) != 0)
+            ) + 1
+            starts = numpy.concatenate(([0], breaks))
+            stops = numpy.concatenate((breaks, [len(cols)]))
+
+            # Send each run to the terminal.
+            text = chars[y].tobytes().decode('utf-32-le', 'replace')
+            for i, j in zip(starts, stops):
+                x0, x1 = int(cols[i]), int(cols[j - 1]) + 1
+                try:
+                    stdscr.addstr(int(y), x0, text[x0:x1], int(row_attrs[i]))
+                except curses.error:
+                    pass # Writing the last cell cannot advance the cursor
+
+        # Remember what the terminal shows.
+        self._shown_chars[:] = chars
+        self._shown_attrs[:] = attrs
+
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+
+    def _allocate(self, height, width):
+        '''
+        Allocates cell grids, keeping the drawn cells that still fit; code
+        point zero never matches a drawn cell, so the next frame is sent in
+        full
+
+        Parameters:
+            height (int): Screen height in rows
+            width (int): Screen width in columns
+        '''
+        chars = numpy.full((height, width), ord(' '), '<u4')
+        attrs = numpy.zeros((height, width), numpy.int64)
+        if self._chars is not None:
+            h, w = min(height, self._chars.shape[0]), min(width, self._chars.shape[1])
+            chars[:h, :w] = self._chars[:h, :w]
+            attrs[:h, :w] = self._attrs[:h, :w]
+        self._chars, self._attrs = chars, attrs
+        self._shown_chars = numpy.zeros((height, width), '<u4')
+        self._shown_attrs = numpy.zeros((height, width), numpy.int64)
+
+
+    def _resize(self):
+        ''' Resizes the cell grids to match the terminal '''
+        curses.update_lines_cols()
+        height, width = curses.LINES, curses.COLS
+        self._stdscr.resize(height, width)
+        self._stdscr.erase()
+        self._allocate(height, width)
+
+
+class CountingWindow():
+    '''
+    Proxy that counts calls made to a window; other attributes are read from
+    and written to the window
+
+    Attributes:
+        _proxied (curses.window): Proxied window
+        _counter (CursesBackend): Backend receiving the count
+    '''
+    def __init__(self, win, backend):
+        object.__setattr__(self, '_proxied', win)
+        object.__setattr__(self, '_counter', backend)
+
+
+    def __getattr__(self, name):
+        attr = getattr(self._proxied, name)
+        if not callable(attr):
+            return attr
+
+        # Count each call to the window.
+        counter = self._counter
+        def counted(*args, **kwargs):
+            counter.window_calls += 1
+            return attr(*args, **kwargs)
+        return counted
+
+
+    def __setattr__(self, name, value):
+        setattr(self._proxied, name, value)
+
+
+class GridWindow():
+    '''
+    Curses window substitute that draws directly into a backend's cell grid
+
+    Attributes:
+        _backend (GridBackend): Backend owning the cell grid
+        _y, _x (int): Upper-left corner in screen coordinates
+        _height, _width (int): Dimensions
+        _attr (int): Attributes enabled with attron
+        _bkgd (int): Background attributes
+        _spans (list<2-tuple>): Rows, as (start, stop) pairs, that may be
+            drawn; None allows every row
+    '''
+    def __init__(self, backend, height, width, y, x):
+        self._backend = backend
+        self._y, self._x = y, x
+        self._height, self._width = height, width
+        self._attr = 0
+        self._bkgd = 0
+        self._spans = None
+
+
+    def getmaxyx(self):
+        return self._height, self._width
+
+
+    def getbegyx(self):
+        return self._y, self._x
+
+
+    def mvwin(self, y, x):
+        screen_height, screen_width = self._backend._chars.shape
+        if (y < 0 or x < 0
+            or y + self._height > screen_height
+            or x + self._width > screen_width
+        ):
+            raise curses.error('mvwin() returned ERR')
+        self._y, self._x = y, x
+
+
+    def resize(self, height, width):
+        self._height, self._width = height, width
+
+
+    def keypad(self, flag):
+        return
+
+
+    def timeout(self, delay):
+        self._backend._stdscr.timeout(delay)
+
+
+    def getch(self):
+        c = self._backend._stdscr.getch()
+        if c == curses.KEY_RESIZE:
+            self._backend._resize()
+        return c
+
+
+    def attron(self, attr):
+        self._attr |= attr
+
+
+    def attroff(self, attr):
+        self._attr &= ~attr
+
+
+    def bkgdset(self, ch, attr = 0):
+        self._bkgd = (ch | attr) & curses.A_ATTRIBUTES
+
+
+    def erase(self):
+        for start, stop in self._clip(0, self._height):
+            self._fill(start, stop, 0, self._width, ord(' '), self._bkgd)
+
+
+    def addch(self, y, x, ch, attr = 0):
+        self._check(y, x)
+        ch, attr = self._split(ch, attr)
+        self._fill(y, y + 1, x, x + 1, ch, attr)
+
+
+    def insch(self, y, x, ch, attr = 0):
+        self._check(y, x)
+
+        # Shift the remainder of the row to the right.
+        if self._is_drawable(y) and x < self._width - 1:
+            rows, cols = self._screen_slices(y, y + 1, x, self._width)
+            chars = self._backend._chars
+            attrs = self._backend._attrs
+            if cols.stop - cols.start > 1:
+                row, left, right = rows.start, cols.start, cols.stop
+                chars[row, left + 1:right] = chars[row, left:right - 1].copy()
+                attrs[row, left + 1:right] = attrs[row, left:right - 1].copy()
+        self.addch(y, x, ch, attr)
+
+
+    def addstr(self, y, x, text, attr = 0):
+        self._check(y, x)
+
+        # Given attributes replace window attributes for the call.
+        attr = self._merge(attr, self._attr if not attr else 0)
+        width = self._width
+
+        # Wrap text onto subsequent rows.
+        while text:
+            if y >= self._height:
+                raise curses.error('addstr() returned ERR')
+            line, text = text[:width - x], text[width - x:]
+            if self._is_drawable(y):
+                rows, cols = self._screen_slices(y, y + 1, x, x + len(line))
+                offset = cols.start - (self._x + x)
+                visible = line[offset:offset + cols.stop - cols.start]
+                codes = numpy.frombuffer(visible.encode('utf-32-le'), '<u4')
+                self._backend._chars[rows, cols] = codes
+                self._backend._attrs[rows, cols] = attr
+            x += len(line)
+            if x == width:
+                y, x = y + 1, 0
+
+        # Writing the last cell cannot advance the cursor.
+        if y >= self._height:
+            raise curses.error('addstr() returned ERR')
+
+
+    def hline(self, y, x, ch, n):
+        self._check(y, x)
+        ch, attr = self._split(ch, 0)
+        self._fill(y, y + 1, x, min(x + n, self._width), ch, attr)
+
+
+    def vline(self, y, x, ch, n):
+        self._check(y, x)
+        ch, attr = self._split(ch, 0)
+        for start, stop in self._clip(y, min(y + n, self._height)):
+            self._fill(start, stop, x, x + 1, ch, attr)
+
+
+    def chgat(self, y, x, num, attr):
+        self._check(y, x)
+        if self._is_drawable(y):
+            stop = self._width if num < 0 else min(x + num, self._width)
+            self._backend._attrs[self._screen_slices(y, y + 1, x, stop)] = attr
+
+
+    def noutrefresh(self):
+        return
+
+
+    def touchline(self, start, count, changed = True):
+        return
+
+
+    def _check(self, y, x):
+        '''
+        Raises a curses error if given coordinates are outside this window
+        '''
+        if not (0 <= y < self._height and 0 <= x < self._width):
+            raise curses.error('Coordinates ({}, {}) are out of bounds'.format(y, x))
+
+
+    def _screen_slices(self, start, stop, left, right):
+        '''
+        Converts a rectangle of this window to screen coordinates, clipped to
+        the screen
+
+        Returns:
+            2-tuple: Row and column slices of the cell grids; empty if the
+                rectangle is off screen
+        '''
+        screen_height, screen_width = self._backend._chars.shape
+        top, left = self._y + start, self._x + left
+        bottom, right = self._y + stop, self._x + right
+        return (
+            slice(min(max(top, 0), screen_height), min(max(bottom, 0), screen_height)),
+            slice(min(max(left, 0), screen_width), min(max(right, 0), screen_width))
+        )
+
+
+    def _clip(self, start, stop):
+        '''
+        Clips the given rows to the rows that may be drawn
+
+        Returns:
+            list<2-tuple>: Drawable rows as (start, stop) pairs
+        '''
+        if self._spans is None:
+            return [(start, stop)]
+        return [
+            (max(start, s0), min(stop, s1))
+            for s0, s1 in self._spans
+            if s0 < stop and start < s1
+        ]
+
+
+    def _is_drawable(self, y):
+        ''' Determines if the given row may be drawn '''
+        return 0 <= y < self._height and bool(self._clip(y, y + 1))
+
+
+    def _fill(self, start, stop, left, right, ch, attr):
+        ''' Fills a rectangle of this window with a single styled character '''
+        if self._is_drawable(start):
+            rows, cols = self._screen_slices(start, stop, left, right)
+            self._backend._chars[rows, cols] = ch
+            self._backend._attrs[rows, cols] = attr
+
+
+    def _merge(self, attr, window_attr = None):
+        ''' Combines given attributes with window and background attributes '''
+        attr |= self._attr if window_attr is None else window_attr
+        bkgd = self._bkgd
+        if attr & curses.A_COLOR:
+            bkgd &= ~curses.A_COLOR
+        return attr | bkgd
+
+
+    def _split(self, ch, attr):
+        '''
+        Separates a curses character into a code point and merged attributes
+        '''
+        if isinstance(ch, str):
+            ch = ord(ch)
+        return ch & curses.A_CHARTEXT, self._merge(attr | (ch & curses.A_ATTRIBUTES))
+
+
+class FakeClock():
+    '''
+    Manually advanced clock for deterministic timing
+
+    Attributes:
+        _now (float): Current time (sec)
+    '''
+    def __init__(self, start = 0.0):
+        '''
+        Parameters:
+            start (float): _now attribute initializer (Optional)
+        '''
+        self._now = start
+
+
+    def __call__(self):
+        return self._now
+
+
+    def advance(self, seconds):
+        '''
+        Moves this clock forward
+
+        Parameters:
+            seconds (float): Elapsed time (sec)
+        '''
+        self._now += seconds
+
+
+class HeadlessBackend(CursesBackend):
+    '''
+    Render backend that emulates curses windows in memory, reads input from a
+    scripted queue, and keeps time with a fake clock; requires no terminal
+
+    Attributes:
+        calls (Counter): Number of window operations performed, keyed by name
+        fake_clock (FakeClock): Time source that advances only while the
+            script pauses
+        _height, _width (int): Screen dimensions
+        _script (deque): Pending input; ints are key codes, strings are typed
+            character by character, and floats are pauses (sec)
+        _chars (list<list<str>>): Characters of the virtual screen
+        _attrs (list<list<int>>): Curses attributes of the virtual screen
+        _is_started (bool): Flag indicating that this backend is started
+        _acs_provided (dict<str:int>): Line drawing characters that started
+            headless backends provide to the curses module, keyed by name
+        _acs_users (int): Number of started headless backends
+    '''
+    _acs_provided = {}
+
+
+    _acs_users = 0
+
+
+    _acs = {
+        'ACS_BTEE': 'v', 'ACS_HLINE': 'q', 'ACS_LLCORNER': 'm',
+        'ACS_LRCORNER': 'j', 'ACS_LTEE': 't', 'ACS_PLUS': 'n',
+        'ACS_RTEE': 'u', 'ACS_TTEE': 'w', 'ACS_ULCORNER': 'l',
+        'ACS_URCORNER': 'k', 'ACS_VLINE': 'x',
+    }
+
+
+    _keynames = {
+        getattr(curses, name): name.encode()
+        for name in dir(curses)
+        if name.startswith('KEY_') and isinstance(getattr(curses, name), int)
+    }
+
+
+    def __init__(self, width = 80, height = 24, script = (), clock = None):
+        '''
+        Parameters:
+            width (int): Screen width in columns (Optional)
+            height (int): Screen height in rows (Optional)
+            script (iterable): Initial input script (Optional)
+            clock (FakeClock): fake_clock attribute initializer (Optional)
+        '''
+        self.calls = collections.Counter()
+        self.fake_clock = clock if clock else FakeClock()
+        self._height, self._width = height, width
+        self._script = collections.deque()
+        self._chars = [[' '] * width for i in range(height)]
+        self._attrs = [[0] * width for i in range(height)]
+        self._is_started = False
+        self.feed(*script)
+
+
+    def start(self):
+        if self._is_started:
+            return
+        self._is_started = True
+        HeadlessBackend._acs_users += 1
+
+        # Provide the line drawing characters that curses defines upon
+        # initialization, using the VT100 alternate character set.
+        provided = HeadlessBackend._acs_provided
+        for name, ch in self._acs.items():
+            if not hasattr(curses, name):
+                provided[name] = curses.A_ALTCHARSET | ord(ch)
+                setattr(curses, name, provided[name])
+
+
+    def stop(self):
+        if not self._is_started:
+            return
+        self._is_started = False
+        HeadlessBackend._acs_users -= 1
+
+        # Withdraw the provided line drawing characters once no headless
+        # backend is started, unless curses has since defined its own, which
+        # may be equal but are not the same objects.
+        if not HeadlessBackend._acs_users:
+            provided = HeadlessBackend._acs_provided
+            for name, value in provided.items():
+                if getattr(curses, name, None) is value:
+                    delattr(curses, name)
+            provided.clear()
+
+
+    def clock(self):
+        return self.fake_clock()
+
+
+    def fileno(self):
+        return None
+
+
+    def resize(self):
+        return
+
+
+    def keyname(self, n):
+        if n in self._keynames:
+            return self._keynames[n]
+        return curses.ascii.unctrl(n).encode()
+
+
+    def newwin(self, height, width, y = 0, x = 0):
+        height = height if height else self._height - y
+        width = width if width else self._width - x
+        return HeadlessWindow(self, height, width, y, x)
+
+
+    def doupdate(self):
+        self.calls['doupdate'] += 1
+
+
+    @property
+    def counts_calls(self):
+        ''' Getter for "counts_calls" property '''
+        return True
+
+
+    @property
+    def window_calls(self):
+        ''' Getter for "window_calls" property '''
+        return sum(self.calls.values()) - self.calls['doupdate']
+
+
+    def feed(self, *script):
+        '''
+        Appends input to the script
+
+        Parameters:
+            *script: Key codes (int), typed text (str), and pauses (float)
+        '''
+        for item in script:
+            if isinstance(item, str):
+                self._script.extend(ord(c) for c in item)
+            else:
+                self._script.append(item)
+
+
+    def get_lines(self):
+        '''
+        Gets the text of the virtual screen
+
+        Returns:
+            list<str>: Rows of text
+        '''
+        return [''.join(row) for row in self._chars]
+
+
+    def _getch(self, delay):
+        '''
+        Reads the next key code from the script, advancing the fake clock;
+        raises EOFError once the script is exhausted
+
+        Parameters:
+            delay (int): Input timeout (ms) in curses format
+
+        Returns:
+            int: Key code; curses.ERR if the timeout expires first
+        '''
+        script = self._script
+        while script:
+
+            # Return scripted keys immediately.
+            if isinstance(script[0], int):
+                return script.popleft()
+
+            # Wait out scripted pauses, unless the timeout expires first.
+            pause = script[0]
+            if 0 <= delay / 1000 < pause:
+                self.fake_clock.advance(delay / 1000)
+                script[0] = pause - delay / 1000
+                return curses.ERR
+            self.fake_clock.advance(pause)
+            script.popleft()
+
+        # End the session, since no further input is scripted.
+        raise EOFError('Input script is exhausted')
+
+
+class HeadlessWindow():
+    '''
+    In-memory emulation of a curses window
+
+    Attributes:
+        _backend (HeadlessBackend): Backend owning the virtual screen
+        _y, _x (int): Upper-left corner in screen coordinates
+        _height, _width (int): Dimensions
+        _chars (list<list<str>>): Characters
+        _attrs (list<list<int>>): Curses attributes
+        _touched (list<bool>): Flags marking rows that differ from the
+            virtual screen
+        _attr (int): Attributes enabled with attron
+        _bkgd (int): Background attributes
+        _delay (int): Input timeout (ms) in curses format
+    '''
+    def __init__(self, backend, height, width, y, x):
+        self._backend = backend
+        self._y, self._x = y, x
+        self._height, self._width = height, width
+        self._chars = [[' '] * width for i in range(height)]
+        self._attrs = [[0] * width for i in range(height)]
+        self._touched = [True] * height
+        self._attr = 0
+        self._bkgd = 0
+        self._delay = -1
+
+
+    def getmaxyx(self):
+        self._backend.calls['getmaxyx'] += 1
+        return self._height, self._width
+
+
+    def getbegyx(self):
+        self._backend.calls['getbegyx'] += 1
+        return self._y, self._x
+
+
+    def mvwin(self, y, x):
+        self._backend.calls['mvwin'] += 1
+        if (y < 0 or x < 0
+            or y + self._height > self._backend._height
+            or x + self._width > self._backend._width
+        ):
+            raise curses.error('mvwin() returned ERR')
+        self._y, self._x = y, x
+
+
+    def resize(self, height, width):
+        self._backend.calls['resize'] += 1
+
+        # Truncate or pad existing content.
+        chars = [row[:width] + [' '] * (width - len(row)) for row in self._chars[:height]]
+        attrs = [row[:width] + [0] * (width - len(row)) for row in self._attrs[:height]]
+        chars += [[' '] * width for i in range(height - len(chars))]
+        attrs += [[0] * width for i in range(height - len(attrs))]
+        self._chars, self._attrs = chars, attrs
+        self._touched = [True] * height
+        self._height, self._width = height, width
+
+
+    def keypad(self, flag):
+        return
+
+
+    def timeout(self, delay):
+        self._delay = delay
+
+
+    def getch(self):
+        self._backend.calls['getch'] += 1
+        return self._backend._getch(self._delay)
+
+
+    def attron(self, attr):
+        self._attr |= attr
+
+
+    def attroff(self, attr):
+        self._attr &= ~attr
+
+
+    def bkgdset(self, ch, attr = 0):
+        self._bkgd = (ch | attr) & curses.A_ATTRIBUTES
+
+
+    def erase(self):
+        self._backend.calls['erase'] += 1
+        for y in range(self._height):
+            self._chars[y] = [' '] * self._width
+            self._attrs[y] = [self._bkgd] * self._width
+        self._touched = [True] * self._height
+
+
+    def addch(self, y, x, ch, attr = 0):
+        self._backend.calls['addch'] += 1
+        self._put(y, x, ch, attr)
+
+
+    def insch(self, y, x, ch, attr = 0):
+        self._backend.calls['insch'] += 1
+        self._check(y, x)
+
+        # Shift the remainder of the row to the right.
+        self._chars[y].insert(x, ' ')
+        self._attrs[y].insert(x, 0)
+        del self._chars[y][-1]
+        del self._attrs[y][-1]
+        self._put(y, x, ch, attr)
+
+
+    def addstr(self, y, x, text, attr = 0):
+        self._backend.calls['addstr'] += 1
+        self._check(y, x)
+
+        # Given attributes replace window attributes for the call.
+        attr = self._merge(attr, self._attr if not attr else 0)
+
+        # Wrap text onto subsequent rows.
+        for c in text:
+            if y >= self._height:
+                raise curses.error('addstr() returned ERR')
+            self._chars[y][x] = c
+            self._attrs[y][x] = attr
+            self._touched[y] = True
+            x += 1
+            if x == self._width:
+                y, x = y + 1, 0
+
+        # Writing the last cell cannot advance the cursor.
+        if y >= self._height:
+            raise curses.error('addstr() returned ERR')
+
+
+    def hline(self, y, x, ch, n):
+        self._backend.calls['hline'] += 1
+        self._check(y, x)
+        for i in range(x, min(x + n, self._width)):
+            self._put(y, i, ch, 0)
+
+
+    def vline(self, y, x, ch, n):
+        self._backend.calls['vline'] += 1
+        self._check(y, x)
+        for i in range(y, min(y + n, self._height)):
+            self._put(i, x, ch, 0)
+
+
+    def chgat(self, y, x, num, attr):
+        self._backend.calls['chgat'] += 1
+        self._check(y, x)
+        stop = self._width if num < 0 else min(x + num, self._width)
+        self._attrs[y][x:stop] = [attr] * (stop - x)
+        self._touched[y] = True
+
+
+    def touchline(self, start, count, changed = True):
+        self._backend.calls['touchline'] += 1
+        for y in range(start, min(start + count, self._height)):
+            self._touched[y] = changed
+
+
+    def noutrefresh(self):
+        self._backend.calls['noutrefresh'] += 1
+
+        # Copy changed rows to the virtual screen, clipped to its bounds.
+        backend = self._backend
+        width = min(self._width, backend._width - self._x)
+        for y in range(min(self._height, backend._height - self._y)):
+            if self._touched[y]:
+                row = self._y + y
+                backend._chars[row][self._x:self._x + width] = self._chars[y][:width]
+                backend._attrs[row][self._x:self._x + width] = self._attrs[y][:width]
+        self._touched = [False] * self._height
+
+
+    def _check(self, y, x):
+        '''
+        Raises a curses error if given coordinates are outside this window
+        '''
+        if not (0 <= y < self._height and 0 <= x < self._width):
+            raise curses.error('Coordinates ({}, {}) are out of bounds'.format(y, x))
+
+
+    def _merge(self, attr, window_attr = None):
+        ''' Combines given attributes with window and background attributes '''
+        attr |= self._attr if window_attr is None else window_attr
+        bkgd = self._bkgd
+        if attr & curses.A_COLOR:
+            bkgd &= ~curses.A_COLOR
+        return attr | bkgd
+
+
+    def _put(self, y, x, ch, attr):
+        ''' Writes a single curses character '''
+        self._check(y, x)
+        if isinstance(ch, str):
+            ch = ord(ch)
+        self._chars[y][x] = chr(ch & curses.A_CHARTEXT)
+        self._attrs[y][x] = self._merge(attr | (ch & curses.A_ATTRIBUTES))
+        self._touched[y] = True
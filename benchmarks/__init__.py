@@ -0,0 +1,7 @@
+# Filename: __init__.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+from .suite import run_suite
+from .trees import build_deep_groups, build_many_pages, build_tables, build_wide_form
@@ -0,0 +1,29 @@
+# Filename: __main__.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import argparse
+import json
+import sys
+from .suite import run_suite
+
+
+parser = argparse.ArgumentParser(description = 'Benchmarks widget trees without a terminal')
+parser.add_argument('-o', '--output', help = 'JSON results file (default: stdout)')
+parser.add_argument('--scale', type = float, default = 1.0, help = 'Multiplier for tree sizes')
+parser.add_argument(
+    '--repeat', type = int, default = 3, help = 'Trees built per construction benchmark'
+)
+parser.add_argument(
+    '--frames', type = int, default = 20, help = 'Frames drawn per frame benchmark'
+)
+args = parser.parse_args()
+
+results = run_suite(args.scale, args.repeat, args.frames)
+if args.output:
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent = 2)
+else:
+    json.dump(results, sys.stdout, indent = 2)
+    print()
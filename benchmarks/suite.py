@@ -0,0 +1,277 @@
+# Filename: suite.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import curses
+import platform
+import statistics
+import time
+from ..backends import HeadlessBackend
+from ..core import UI
+from ..signals import SignalRouter
+from .trees import build_deep_groups, build_many_pages, build_tables, build_wide_form
+
+
+class LatencyBackend(HeadlessBackend):
+    '''
+    Headless backend that measures the time from each keystroke to the screen
+    update that follows it
+
+    Attributes:
+        latencies (list<float>): Keystroke-to-update latencies (sec)
+        _received (float): Time (sec) at which the pending keystroke was read
+    '''
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = []
+        self._received = None
+
+
+    def doupdate(self):
+        super().doupdate()
+        if self._received is not None:
+            self.latencies.append(time.perf_counter() - self._received)
+            self._received = None
+
+
+    def _getch(self, delay):
+        c = super()._getch(delay)
+        if c != curses.ERR:
+            self._received = time.perf_counter()
+        return c
+
+
+def summarize(samples):
+    '''
+    Summarizes timing samples
+
+    Parameters:
+        samples (list<float>): Measured times (sec)
+
+    Returns:
+        dict: Sample count along with min, median, mean, and max times (sec)
+    '''
+    return {
+        'count': len(samples),
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.mean(samples),
+        'max': max(samples),
+    }
+
+
+def count_widgets(widget):
+    '''
+    Counts the widgets of the tree rooted at the given widget
+
+    Parameters:
+        widget (Widget): Root of the tree
+
+    Returns:
+        int: Number of widgets
+    '''
+    return 1 + sum(count_widgets(child) for child in widget._children)
+
+
+def new_ui(width, height, backend = None):
+    '''
+    Creates a user interface rendered without a terminal
+
+    Parameters:
+        width (int): Screen width in columns
+        height (int): Screen height in rows
+        backend (HeadlessBackend): Render backend (Optional)
+
+    Returns:
+        UI: Created user interface
+    '''
+    return UI(SignalRouter(), backend = backend if backend else HeadlessBackend(width, height))
+
+
+def bench_construction(build, repeat, width, height):
+    '''
+    Measures the time to build a synthetic tree
+
+    Parameters:
+        build (function): Builds a synthetic tree given a parent widget
+        repeat (int): Number of trees to build
+        width, height (int): Screen dimensions
+
+    Returns:
+        dict: Timing summary
+    '''
+    samples = []
+    for i in range(repeat):
+        ui = new_ui(width, height)
+        start = time.perf_counter()
+        build(ui.root)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_frames(ui, leaves, fraction, frames):
+    '''
+    Measures the time to draw frames in which a share of widgets is tagged
+
+    Parameters:
+        ui (UI): User interface holding a synthetic tree
+        leaves (list<Widget>): Leaf widgets of the synthetic tree
+        fraction (float): Share of leaf widgets to tag per frame; every widget
+            is tagged if None
+        frames (int): Number of frames to draw
+
+    Returns:
+        dict: Timing summary
+    '''
+    root = ui.root
+    root._draw()
+
+    # Tag an evenly spaced subset of leaves, or the whole tree.
+    if fraction is None:
+        tagged = []
+        stack = [root]
+        while stack:
+            widget = stack.pop()
+            tagged.append(widget)
+            stack.extend(widget._children)
+    else:
+        step = max(1, round(1 / fraction)) if fraction else len(leaves) + 1
+        tagged = leaves[::step] or leaves[:1]
+
+    samples = []
+    for i in range(frames):
+        for widget in tagged:
+            widget.tag_redraw()
+        start = time.perf_counter()
+        root._draw_tagged()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_signals(ui, leaves, count):
+    '''
+    Measures bubble and flush throughput across a synthetic tree
+
+    Parameters:
+        ui (UI): User interface holding a synthetic tree
+        leaves (list<Widget>): Leaf widgets of the synthetic tree
+        count (int): Number of signals to emit in each direction
+
+    Returns:
+        dict: Signals per second for bubbling and flushing
+    '''
+    root = ui.root
+    received = []
+    handler = lambda **kwargs: received.append(None)
+
+    # Handle signals at both ends of the tree.
+    root.add_signal_handler('BENCH_SIGNAL', handler)
+    for leaf in leaves:
+        leaf.add_signal_handler('BENCH_SIGNAL', handler)
+
+    # Bubble from the deepest leaf.
+    leaf = max(leaves, key = lambda widget: len(list(_ancestry(widget))))
+    start = time.perf_counter()
+    for i in range(count):
+        leaf.bubble(_name = 'BENCH_SIGNAL')
+    bubble_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(count):
+        root.flush(_name = 'BENCH_SIGNAL')
+    flush_time = time.perf_counter() - start
+
+    return {
+        'bubble_per_sec': count / bubble_time,
+        'flush_per_sec': count / flush_time,
+        'handled': len(received),
+    }
+
+
+def bench_latency(build, keys, width, height):
+    '''
+    Measures the time from each keystroke to the following screen update
+    while running the event loop
+
+    Parameters:
+        build (function): Builds a synthetic tree given a parent widget
+        keys (iterable): Input script; see HeadlessBackend
+        width, height (int): Screen dimensions
+
+    Returns:
+        dict: Timing summary
+    '''
+    backend = LatencyBackend(width, height, keys)
+    ui = new_ui(width, height, backend)
+    build(ui.root)
+    ui.run()
+
+    # The event loop ends once the input script is exhausted.
+    errors = [e for e in ui._error_log if not isinstance(e, EOFError)]
+    ui._error_log.clear()
+    if errors:
+        raise errors[0]
+    return summarize(backend.latencies)
+
+
+def run_suite(scale = 1.0, repeat = 3, frames = 20, width = 200, height = 60):
+    '''
+    Runs every benchmark against synthetic widget trees
+
+    Parameters:
+        scale (float): Multiplier for the size of synthetic trees (Optional)
+        repeat (int): Number of trees built per construction benchmark
+            (Optional)
+        frames (int): Number of frames drawn per frame benchmark (Optional)
+        width, height (int): Screen dimensions (Optional)
+
+    Returns:
+        dict: Benchmark results keyed by scenario, along with metadata
+    '''
+    size = lambda n: max(1, int(n * scale))
+    typing = [ord('a')] + [ord('x')] * size(100)
+    scrolling = [ord('a')] + [curses.KEY_DOWN] * size(100)
+    scenarios = {
+        'deep_groups': (lambda parent: build_deep_groups(parent, size(200)), typing),
+        'wide_form': (lambda parent: build_wide_form(parent, size(1000)), typing),
+        'tables': (lambda parent: build_tables(parent, 4, size(5000)), scrolling),
+        'many_pages': (lambda parent: build_many_pages(parent, size(50), 10), scrolling),
+    }
+
+    results = {}
+    for name, (build, keys) in scenarios.items():
+        result = results[name] = {}
+        result['construction'] = bench_construction(build, repeat, width, height)
+
+        # Draw frames and emit signals against a single tree.
+        ui = new_ui(width, height)
+        leaves = build(ui.root)
+        result['widgets'] = count_widgets(ui.root)
+        result['frame_all_tagged'] = bench_frames(ui, leaves, None, frames)
+        result['frame_some_tagged'] = bench_frames(ui, leaves, 0.01, frames)
+        result['frame_one_tagged'] = bench_frames(ui, leaves, 0, frames)
+        result['signals'] = bench_signals(ui, leaves, size(1000))
+
+        # Operate the widget that the first focus key selects.
+        result['keystroke_latency'] = bench_latency(build, keys, width, height)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'scale': scale,
+            'repeat': repeat,
+            'frames': frames,
+            'screen': [width, height],
+        },
+        'results': results,
+    }
+
+
+def _ancestry(widget):
+    ''' Iterates over the given widget's ancestors '''
+    while widget._parent:
+        widget = widget._parent
+        yield widget
@@ -0,0 +1,136 @@
+# Filename: trees.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import math
+from ..core import Group
+from ..widgets import NavList, SelectField, Tab, Table, TextField
+
+
+def build_deep_groups(parent, depth):
+    '''
+    Builds a chain of nested groups ending in a text field
+
+    Parameters:
+        parent (Widget): Root of the synthetic tree
+        depth (int): Number of nested groups
+
+    Returns:
+        list<Widget>: Leaf widgets of the synthetic tree
+    '''
+    for i in range(depth):
+        parent = Group(parent)
+
+    field = TextField('Field', parent, ord('a'))
+    field.resize(20)
+    return [field]
+
+
+def build_wide_form(parent, count):
+    '''
+    Builds a form of alternating text and select fields laid out in a grid
+
+    Parameters:
+        parent (Widget): Root of the synthetic tree
+        count (int): Number of fields
+
+    Returns:
+        list<Widget>: Leaf widgets of the synthetic tree
+    '''
+    width, height = parent.get_size()
+    columns = max(1, width // 20)
+    rows = max(1, height // 3)
+    fields = []
+
+    # Overlap fields that do not fit on screen.
+    for i in range(count):
+        focus_key = ord('a') if i == 0 else None
+        if i % 2:
+            field = SelectField('Select {}'.format(i), parent, focus_key)
+            field.load_options(['Option {}'.format(j) for j in range(10)])
+        else:
+            field = TextField('Text {}'.format(i), parent, focus_key)
+        field.resize(20)
+        field.move(i % columns * 20, i // columns % rows * 3)
+        fields.append(field)
+
+    return fields
+
+
+def build_tables(parent, count, rows):
+    '''
+    Builds tables filled with generated data
+
+    Parameters:
+        parent (Widget): Root of the synthetic tree
+        count (int): Number of tables
+        rows (int): Number of rows per table
+
+    Returns:
+        list<Widget>: Leaf widgets of the synthetic tree
+    '''
+    width, height = parent.get_size()
+    header = ['ID', 'Name', 'Quantity', 'Price']
+    body = [
+        [i, 'Item {}'.format(i), i * 7 % 1000, '{:.2f}'.format(i * 0.37)]
+        for i in range(rows)
+    ]
+    tables = []
+
+    # Tile tables side by side.
+    table_width = max(10, width // count)
+    for i in range(count):
+        table = Table('Table {}'.format(i), parent, ord('a') + i)
+        table.resize(table_width, height)
+        table.move(min(i * table_width, width - table_width), 0)
+        table.decompose(table = [header] + body)
+        tables.append(table)
+
+    return tables
+
+
+def build_many_pages(parent, pages, fields):
+    '''
+    Builds a navigation list and stacked sets of tabs, each page holding text
+    fields; only the first page of each is shown
+
+    Parameters:
+        parent (Widget): Root of the synthetic tree
+        pages (int): Number of pages in both the navigation list and tab sets
+        fields (int): Number of text fields per page
+
+    Returns:
+        list<Widget>: Leaf widgets of the synthetic tree
+    '''
+    width, height = parent.get_size()
+    leaves = []
+
+    # Split the screen between the navigation list and the tabs.
+    nav_list = NavList('Pages', parent, ord('a'))
+    nav_list.resize(width // 2, height)
+    regions = [nav_list.new_page('Page {}'.format(i)) for i in range(pages)]
+
+    # Stack as many tab sets as are needed to fit every tab label.
+    label_width = len('Tab {}'.format(pages)) + 6
+    per_set = max(1, (width - width // 2 - 4) // label_width)
+    sets = math.ceil(pages / per_set)
+    set_height = max(6, height // sets)
+    for i in range(pages):
+        if i % per_set == 0:
+            tabs = Group(parent)
+            tabs.resize(width - width // 2, set_height)
+            tabs.move(width // 2, min(i // per_set * set_height, height - set_height))
+        tab = Tab('Tab {}'.format(i), tabs)
+        regions.append(tab.content_region)
+
+    # Fill each page with text fields.
+    for region in regions:
+        region_width, region_height = region.get_size()
+        for i in range(fields):
+            field = TextField('Field {}'.format(i), region)
+            field.resize(min(20, region_width))
+            field.move(y = min(i * 3, max(0, region_height - 3)))
+            leaves.append(field)
+
+    return leaves
@@ -4,14 +4,21 @@
 # Author: Brett Fedack
 
 
+import asyncio
+import concurrent.futures
 import curses
 import curses.ascii as ascii
 import math
 import os
 import re
+import selectors
+import signal
+import threading
 import weakref
-from datetime import datetime
 from . import signals
+from .backends import CursesBackend
+from .metrics import Metrics
+from .scheduler import Scheduler
 from .theme import Theme
 
 
@@ -29,7 +36,7 @@ def key_from_char(n):
         str: String representation of keyboard key
     '''
     # Get the keyname.
-    key = curses.keyname(n).decode('utf-8')
+    key = Widget._backend.keyname(n).decode('utf-8')
 
     # Remove 'KEY_' prefix.
     key = re.sub(r'^KEY_', '',  key)
@@ -45,9 +52,20 @@ class UI():
     Curses-based user interface framework class
 
     Attributes:
+        _backend (CursesBackend): Render backend
         _error_log (list<Exception>): History of runtime errors
+        _executor (Executor): Default executor for offloaded request handlers
         _focus_trace (list<weakref<Widget>>): Trace of input focus
+        _frame_interval (float): Minimum time (sec) between consecutive
+            redraws of widgets that remain tagged after being drawn
         _is_running (bool): Flag controlling run state of this UI
+        _metrics_timer (list): Scheduler timer for periodic metrics reports
+        _offloads (dict): Signal handlers, keyed by signal name, that submit
+            requests to executors
+        _poll_interval (float): Maximum time (sec) between checks for results
+            of offloaded requests; only used by backends whose input cannot
+            be waited on
+        _requests_in_flight (int): Number of pending offloaded requests
         _root (Widget): Root node of widget tree
     '''
     @property
@@ -56,34 +74,45 @@ class UI():
         return self._root
 
 
-    def __init__(self, signal_router = None):
+    def __init__(self, signal_router = None, frame_rate = 30, backend = None):
         '''
         Parameters:
             signal_router (SignalRouter): Communication hub for this component
                 (Optional)
+            frame_rate (float): Maximum redraw rate (frames per second) of
+                widgets that request continuous redrawing (Optional)
+            backend (CursesBackend): Render backend, such as GridBackend
+                (Optional)
         '''
-        # Initialize curses library.
-        curses.initscr()
-        curses.noecho()          # Hidden input
-        curses.curs_set(0)       # Hidden cursor
-        curses.cbreak()          # Non-buffered input
-        if curses.has_colors():  # Color enabled
-            curses.start_color()
+        # Initialize the render backend.
+        self._backend = backend if backend else CursesBackend()
+        self._backend.start()
+        Widget._backend = self._backend
+
+        # Keep time with the render backend's clock.
+        Widget._scheduler = Scheduler(self._backend.clock)
 
         # Setup signal handling.
         signal_router.register('UI_EXIT', self._exit)
 
         # Initialize attributes.
         self._error_log = []
+        self._executor = None
         self._focus_trace = []
+        self._frame_interval = 1 / frame_rate
         self._is_running = True
+        self._metrics_timer = None
+        self._offloads = {}
+        self._poll_interval = 0.05
+        self._requests_in_flight = 0
         self._root = Widget(label = 'root', signal_router = signal_router)
 
 
     def __del__(self):
-        # Deinitialize curses library, and display any errors.
-        if not curses.isendwin():
-            curses.endwin()
+        # Deinitialize the render backend, and display any errors.
+        self._backend.stop()
+        if self._executor:
+            self._executor.shutdown(wait = False)
         for e in self._error_log:
             raise e
 
@@ -96,6 +125,253 @@ class UI():
             self._error_log.append(e)
 
 
+    async def run_async(self):
+        '''
+        Executes user interface on the running asyncio event loop and logs
+        runtime errors; input is read when the terminal becomes readable, and
+        redraws are scheduled as deadlines come due
+        '''
+        loop = asyncio.get_running_loop()
+        thread = threading.get_ident()
+        scheduler = Widget.scheduler
+        fd = self._backend.fileno()
+        finished = loop.create_future()
+        handles = {}
+        watches_resize = False
+
+        def finish(e = None):
+            ''' Ends the event loop '''
+            if not finished.done():
+                finished.set_result(e)
+
+        def frame():
+            ''' Redraws the user interface, and sleeps until the next deadline '''
+            handles.pop('frame', None)
+            try:
+                self._frame()
+                if not self._is_running:
+                    return finish()
+
+                # Replace the pending wake-up call.
+                deadline = handles.pop('deadline', None)
+                if deadline:
+                    deadline.cancel()
+                timeout = self._input_timeout(can_wake = True)
+                if timeout >= 0:
+                    handles['deadline'] = loop.call_later(timeout / 1000, wake)
+            except Exception as e:
+                finish(e)
+
+        def wake():
+            ''' Schedules a frame, unless one is pending '''
+            if threading.get_ident() != thread:
+                loop.call_soon_threadsafe(wake)
+            elif 'frame' not in handles:
+                handles['frame'] = loop.call_soon(frame)
+
+        def read():
+            ''' Handles all available user input '''
+            try:
+                self._read_input()
+                wake()
+            except Exception as e:
+                finish(e)
+
+        def resize():
+            ''' Handles a terminal resize, which does not make input readable '''
+            try:
+                self._backend.resize()
+            except Exception as e:
+                return finish(e)
+            read()
+
+        try:
+            if not self._start():
+                return
+
+            # End on errors of coroutine signal handlers as on those of other
+            # signal handlers.
+            signals.SignalRouter.set_error_handler(finish)
+
+            # Poll backends that cannot signal input readiness, yielding to
+            # other tasks between iterations.
+            if fd is None:
+                while self._is_running and not finished.done():
+                    self._step()
+                    await asyncio.sleep(0)
+                e = finished.result() if finished.done() else None
+                if e:
+                    raise e
+                return
+
+            # Wait for input, terminal resizes, and deadlines.
+            scheduler.set_wake(wake)
+            loop.add_reader(fd, read)
+            try:
+                loop.add_signal_handler(signal.SIGWINCH, resize)
+                watches_resize = True
+            except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+                pass # Resizes are noticed with the next input instead
+            wake()
+            e = await finished
+            if e:
+                raise e
+        except Exception as e:
+            self._error_log.append(e)
+        finally:
+            if fd is not None:
+                loop.remove_reader(fd)
+            if watches_resize:
+                loop.remove_signal_handler(signal.SIGWINCH)
+            scheduler.set_wake(None)
+            signals.SignalRouter.set_error_handler(None)
+            for handle in handles.values():
+                handle.cancel()
+
+
+    def offload(self, signame, handler, executor = None):
+        '''
+        Runs the given request handler on an executor instead of the user
+        interface thread; the data it returns is delivered to the requesting
+        widget as a "DATASIG_IN" signal, which is shown to be loading until
+        then
+
+        Parameters:
+            signame (str): Name of request signal, such as "DATASIG_REQ" or
+                the target name of a translated request
+            handler (function): Request handler called with the public (not
+                underscore-prefixed) signal data; returns input signal data
+                (dict) or None; must be picklable for process pools
+            executor (Executor): Thread or process pool; a shared thread pool
+                is used if omitted (Optional)
+        '''
+        if not executor:
+            if not self._executor:
+                self._executor = concurrent.futures.ThreadPoolExecutor()
+            executor = self._executor
+
+        def submit(**kwargs):
+            # Only requests from widgets can be answered.
+            requester = kwargs.get('_requester')
+            widget = requester() if requester else None
+            if not widget:
+                return
+
+            # Run the handler, and indicate loading until it is done.
+            data = {k: v for k, v in kwargs.items() if not k.startswith('_')}
+            future = executor.submit(handler, **data)
+            self._requests_in_flight += 1
+            widget._set_loading(True)
+
+            # Deliver the result on this thread.
+            sequence = kwargs['_sequence']
+            future.add_done_callback(
+                lambda future: Widget.scheduler.call_soon_threadsafe(
+                    lambda: self._deliver(requester, sequence, future)
+                )
+            )
+
+        # Keep the signal handler alive, since routers hold weak references.
+        self._offloads[signame] = submit
+        self.root._signal_router.register(signame, submit)
+
+
+    def enable_metrics(self, interval = None):
+        '''
+        Starts recording wall time and call counts of widget methods; curses
+        calls made while drawing are counted by backends created with the
+        count_calls flag, and always by the headless backend; otherwise they
+        are reported as None
+
+        Parameters:
+            interval (float): Time (sec) between "UI_METRICS" signals; no
+                signals are emitted if omitted (Optional)
+
+        Returns:
+            Metrics: Recorded metrics
+        '''
+        if not Widget._metrics:
+            backend = Widget._backend
+            count = None
+            if getattr(backend, 'counts_calls', False):
+                count = lambda: backend.window_calls
+            Widget._metrics = Metrics(count = count)
+
+        # Report metrics periodically.
+        self._cancel_metrics_timer()
+        if interval:
+            def report():
+                self.emit_metrics()
+                self._metrics_timer = Widget._scheduler.call_later(interval, report)
+            self._metrics_timer = Widget._scheduler.call_later(interval, report)
+
+        return Widget._metrics
+
+
+    def disable_metrics(self):
+        ''' Stops recording metrics, and discards recorded metrics '''
+        self._cancel_metrics_timer()
+        Widget._metrics = None
+
+
+    def emit_metrics(self):
+        ''' Emits a "UI_METRICS" signal carrying a snapshot of recorded metrics '''
+        metrics = Widget._metrics
+        if not metrics:
+            return
+
+        # Notify both the component and the tree of widgets.
+        signal = signals.Signal('UI_METRICS', {'metrics': metrics.snapshot()})
+        self.root._signal_router.forward(signal)
+        self.root.flush(**signal.data)
+
+
+    def _cancel_metrics_timer(self):
+        ''' Stops periodic metrics reports '''
+        if self._metrics_timer:
+            Widget._scheduler.cancel(self._metrics_timer)
+            self._metrics_timer = None
+
+
+    def _deliver(self, requester, sequence, future):
+        '''
+        Delivers the result of an offloaded request to the requesting widget
+
+        Parameters:
+            requester (weakref<Widget>): Requesting widget
+            sequence (int): Sequence number of the request
+            future (Future): Completed request
+        '''
+        self._requests_in_flight -= 1
+
+        # Drop results of superseded requests.
+        widget = requester()
+        if not widget or widget._request_sequence != sequence:
+            return
+        widget._set_loading(False)
+
+        # Report errors raised by the request handler.
+        error = future.exception()
+        if error:
+            signal = signals.Signal('UI_FEEDBACK', message = str(error), error = True)
+            widget.bubble(**signal.data)
+            return
+
+        # Translate input data as the nearest translator, which translated
+        # the request, translates input signals.
+        data = future.result()
+        if data:
+            node = widget._parent
+            while node and not isinstance(node, DatasigTranslator):
+                node = node._parent
+            if node:
+                data = node._translate_data('INPUT', data)
+
+            # Deliver input data.
+            signal = signals.Signal('DATASIG_IN', data, False)
+            widget._signal_router.forward(signal)
+
+
     def _backtrace(self):
         ''' Transfers input focus to the previously focused widget '''
         focus_trace = self._focus_trace
@@ -129,94 +405,261 @@ class UI():
         self._is_running = False
 
 
+    def _input_timeout(self, can_wake = False):
+        '''
+        Calculates how long to wait for user input before the loop must resume
+
+        Parameters:
+            can_wake (bool): Flag indicating that the scheduler wakes the loop
+                once offloaded requests complete, so no polling is needed
+                (Optional)
+
+        Returns:
+            int: Timeout (ms) in curses format; -1 blocks until input arrives
+        '''
+        # Wait for the next scheduled deadline, if any.
+        timeout = Widget.scheduler.timeout()
+
+        # Wait no longer than a frame while redraws are still pending.
+        if self.root._is_redraw_pending():
+            frame_interval = self._frame_interval
+            timeout = frame_interval if timeout is None else min(timeout, frame_interval)
+
+        # Poll for the results of offloaded requests.
+        if self._requests_in_flight and not can_wake:
+            poll_interval = self._poll_interval
+            timeout = poll_interval if timeout is None else min(timeout, poll_interval)
+
+        return -1 if timeout is None else math.ceil(timeout * 1000)
+
+
     def _run(self):
         ''' Runs user interface event loop '''
+        if not self._start():
+            return
+
+        # Run until an exit signal is received, polling backends that cannot
+        # signal input readiness.
+        fd = self._backend.fileno()
+        if fd is None:
+            while self._is_running:
+                self._step()
+            return
+
+        # Let other threads, such as those of offloaded requests, interrupt
+        # the wait for input through a pipe.
+        thread = threading.get_ident()
+        wake_fd, notify_fd = os.pipe()
+        os.set_blocking(wake_fd, False)
+        os.set_blocking(notify_fd, False)
+        resized = []
+
+        def notify():
+            ''' Interrupts the wait for input '''
+            try:
+                os.write(notify_fd, b'\0')
+            except BlockingIOError:
+                pass # A wake-up call is already pending
+
+        def wake():
+            ''' Interrupts the wait for input from other threads '''
+            if threading.get_ident() != thread:
+                notify()
+
+        def resize(signum, frame):
+            ''' Interrupts the wait for input once the terminal is resized '''
+            resized.append(signum)
+            notify()
+
+        # Terminal resizes do not make input readable, so they interrupt the
+        # wait too; this replaces the curses handler, whose KEY_RESIZE input
+        # the backend restores.
+        previous = self._handle_sigwinch(resize)
+        scheduler = Widget.scheduler
+        scheduler.set_wake(wake)
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                selector.register(wake_fd, selectors.EVENT_READ)
+                while self._is_running:
+                    self._frame()
+
+                    # Sleep until user input, a deadline, or a wake-up call.
+                    timeout = self._input_timeout(can_wake = True)
+                    selector.select(None if timeout < 0 else timeout / 1000)
+                    try:
+                        while os.read(wake_fd, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    if resized:
+                        resized.clear()
+                        self._backend.resize()
+                    self._read_input()
+        finally:
+            scheduler.set_wake(None)
+            if previous is not None:
+                self._handle_sigwinch(previous)
+            os.close(wake_fd)
+            os.close(notify_fd)
+
+
+    def _handle_sigwinch(self, handler):
+        '''
+        Sets the handler of terminal resize signals, if they exist and this is
+        the main thread
+
+        Parameters:
+            handler (function): Signal handler
+
+        Returns:
+            function: Previous signal handler, or signal.SIG_DFL in place of
+                one not set from Python; None if the handler is not set
+        '''
+        if (not hasattr(signal, 'SIGWINCH')
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            return None
+        previous = signal.signal(signal.SIGWINCH, handler)
+        return signal.SIG_DFL if previous is None else previous
+
+
+    def _read_input(self):
+        ''' Handles all available user input without waiting '''
+        while self._is_running:
+            win = Widget.input_focus._win
+            win.timeout(0)
+            c = win.getch()
+            if c == curses.ERR:
+                break
+            self._handle_input(c)
+            self._sync_focus_trace()
+
+
+    def _start(self):
+        '''
+        Prepares the event loop by giving input focus to the entry point
+
+        Returns:
+            bool: True if the tree of widgets has an entry point; False
+                otherwise
+        '''
         # Determine entry point.
         descendants = self.root._descendants
         entry_point = descendants[0] if descendants else None
         if not entry_point:
-            return
+            return False
 
         # Set input focus.
         Widget.input_focus = entry_point
 
         # Reset focus trace.
-        focus_trace = self._focus_trace
-        focus_trace.clear()
+        self._focus_trace.clear()
+        return True
 
-        # Run until an exit signal is received.
-        while self._is_running:
 
-            # Redraw user interface.
-            self.root._draw()
+    def _step(self):
+        ''' Runs one iteration of the event loop '''
+        self._frame()
 
-            # Synchronize input focus with the focus trace.
-            if not focus_trace or focus_trace[-1]() is not Widget.input_focus:
-                focus_trace.append(weakref.ref(Widget.input_focus))
+        # Sleep until either user input arrives or a deadline is reached.
+        win = Widget.input_focus._win
+        win.timeout(self._input_timeout())
+        c = win.getch()
 
-            # Get the subject of input focus.
-            input_focus = Widget.input_focus
+        # Resume the loop if no user input was received.
+        if c != curses.ERR:
+            self._handle_input(c)
 
-            # Get user input.
-            c = input_focus._win.getch()
 
-            # Find neighboring, focusable widgets.
-            ancestor = input_focus._ancestor
-            siblings = ancestor._descendants if ancestor else None
-            descendants = input_focus._descendants
+    def _frame(self):
+        ''' Runs due timers, redraws the user interface, and syncs focus '''
+        # Run timers that have come due.
+        Widget.scheduler.run_due()
 
-            # Transfer input focus upward.
-            if (c == ascii.ESC
-                and not input_focus._overrides_esc
-                and len(focus_trace) > 1
-            ):
-                self._backtrace()
+        # Redraw user interface.
+        self.root._draw()
+        self._sync_focus_trace()
 
-            # Transfer input focus laterally.
-            elif (c in {ascii.TAB, curses.KEY_BTAB}
-                  and not input_focus._overrides_tab
-                  and len(siblings) > 1
-            ):
 
-                # Determine if lateral navigation is possible.
-                if siblings and input_focus in siblings:
+    def _sync_focus_trace(self):
+        ''' Synchronizes input focus with the focus trace '''
+        focus_trace = self._focus_trace
+        if not focus_trace or focus_trace[-1]() is not Widget.input_focus:
+            focus_trace.append(weakref.ref(Widget.input_focus))
 
-                    # Reference previous and next focusable siblings.
-                    curr_idx = siblings.index(input_focus)
-                    prev = siblings[(curr_idx - 1) % (len(siblings))]
-                    next = siblings[(curr_idx + 1) % (len(siblings))]
 
-                    # Transfer input focus to a focusable siblings.
-                    new_focus = prev if c == curses.KEY_BTAB else next
-                    Widget.input_focus = new_focus
-                    focus_trace[-1] = weakref.ref(Widget.input_focus)
+    def _handle_input(self, c):
+        '''
+        Navigates input focus or operates the focused widget
 
-            # Transfer input focus downward.
-            elif (c in {curses.KEY_ENTER, ascii.LF, ascii.CR}
-                  and not input_focus._overrides_enter
-                  and descendants
-            ):
-                self._transfer_down(descendants[0])
+        Parameters:
+            c (int): Character code for user input
+        '''
+        focus_trace = self._focus_trace
+        input_focus = Widget.input_focus
 
-            # Transfer input focus directly to a descendant.
-            elif (c in input_focus._focus_map
-                  and descendants[input_focus._focus_map[c]].audit()
-            ):
-                self._transfer_down(descendants[input_focus._focus_map[c]])
+        # Find neighboring, focusable widgets.
+        ancestor = input_focus._ancestor
+        siblings = ancestor._descendants if ancestor else None
+        descendants = input_focus._descendants
+
+        # Transfer input focus upward.
+        if (c == ascii.ESC
+            and not input_focus._overrides_esc
+            and len(focus_trace) > 1
+        ):
+            self._backtrace()
 
-            # Otherwise, pass user input to the focused widget.
+        # Transfer input focus laterally.
+        elif (c in {ascii.TAB, curses.KEY_BTAB}
+              and not input_focus._overrides_tab
+              and len(siblings) > 1
+        ):
+
+            # Determine if lateral navigation is possible.
+            if siblings and input_focus in siblings:
+
+                # Reference previous and next focusable siblings.
+                curr_idx = siblings.index(input_focus)
+                prev = siblings[(curr_idx - 1) % (len(siblings))]
+                next = siblings[(curr_idx + 1) % (len(siblings))]
+
+                # Transfer input focus to a focusable siblings.
+                new_focus = prev if c == curses.KEY_BTAB else next
+                Widget.input_focus = new_focus
+                focus_trace[-1] = weakref.ref(Widget.input_focus)
+
+        # Transfer input focus downward.
+        elif (c in {curses.KEY_ENTER, ascii.LF, ascii.CR}
+              and not input_focus._overrides_enter
+              and descendants
+        ):
+            self._transfer_down(descendants[0])
+
+        # Transfer input focus directly to a descendant.
+        elif (c in input_focus._focus_map
+              and descendants[input_focus._focus_map[c]].audit()
+        ):
+            self._transfer_down(descendants[input_focus._focus_map[c]])
+
+        # Otherwise, pass user input to the focused widget.
+        else:
+            metrics = Widget._metrics
+            if metrics:
+                ret = metrics.call(input_focus, 'operate', c)
             else:
                 ret = input_focus.operate(c)
 
-                # The response should be to continue or end operation.
-                if ret not in {'CONTINUE', 'END'}:
-                    raise RuntimeError(
-                        'Returned {}; expected value in {"CONTINUE", "END"}'.format(ret)
-                    )
+            # The response should be to continue or end operation.
+            if ret not in {'CONTINUE', 'END'}:
+                raise RuntimeError(
+                    'Returned {}; expected value in {"CONTINUE", "END"}'.format(ret)
+                )
 
-                # Backtrace input focus if operation has come to an end.
-                elif ret == 'END':
-                    self._backtrace()
+            # Backtrace input focus if operation has come to an end.
+            elif ret == 'END':
+                self._backtrace()
 
 
 class MetaWidget(type):
@@ -262,7 +705,11 @@ class MetaWidget(type):
             new_focus.focus(**kwargs)
 
             # Emit a signal containing data from the previous input focus.
-            output_is_ready, data = previous_focus.compose()
+            metrics = Widget._metrics
+            if metrics:
+                output_is_ready, data = metrics.call(previous_focus, 'compose')
+            else:
+                output_is_ready, data = previous_focus.compose()
             if output_is_ready:
                 signal = signals.Signal('DATASIG_OUT', data, False)
                 previous_focus.bubble(**signal.data)
@@ -285,6 +732,18 @@ class MetaWidget(type):
         Widget.set_input_focus(widget)
 
 
+    @property
+    def metrics(cls):
+        ''' Getter for "metrics" property '''
+        return Widget._metrics
+
+
+    @property
+    def scheduler(cls):
+        ''' Getter for "scheduler" property '''
+        return Widget._scheduler
+
+
     @property
     def theme(cls):
         ''' Getter for "theme" property '''
@@ -296,7 +755,18 @@ class Widget(metaclass = MetaWidget):
     Curses-based widget base class
 
     Attributes:
+        _backend (CursesBackend):
+        _damage (list<4-tuple>): Screen regions, as (x, y, width, height)
+            tuples, that need to be redrawn during the next draw call
+        _damage_limit (int): Number of damaged regions beyond which they are
+            merged into their bounding box, bounding the cost of intersection
+            tests
+        _has_tags (bool): Flag indicating that visible, tagged widgets are
+            waiting for the next draw call
         _input_focus (Widget):
+        _metrics (Metrics): Instrumentation of widget methods; None unless
+            enabled by the user interface
+        _scheduler (Scheduler):
         _theme (Theme):
 
         _label (str): Identifier for this widget
@@ -312,18 +782,24 @@ class Widget(metaclass = MetaWidget):
             on this widget
         _is_focusable (bool): Flag indicating if this widget can gain input
             focus
+        _is_loading (bool): Flag indicating that requested data is pending
         _is_drawable (bool): Flag indicating if this widget can be drawn
+        _is_overlay (bool): Flag indicating if the subtree rooted at this
+            widget is drawn over the rest of the tree of widgets
         _is_tagged (bool): Flag indicating a pending draw operation
         _is_visible (bool): Flag indicating if the subtree rooted at this
             widget is visible
-        _timestamp (datetime): Reference date & time for animation purposes;
-            updates automatically when input focus changes
+        _timestamp (float): Reference time (sec) of the scheduler's monotonic
+            clock for animation purposes; updates automatically when input
+            focus changes
         _overrides_enter (bool): Flag indicating if this widget overrides the
             default downward navigation key
         _overrides_esc (bool): Flag indicating if this widget overrides the
             default backtrace navigation key
         _overrides_tab (bool): Flag indicating if this widget overrides the
             default lateral navigation key
+        _request_sequence (int): Number of data requests made by this widget;
+            identifies the latest request
 
     Preconditions:
         Curses library shall be intialized.
@@ -331,9 +807,27 @@ class Widget(metaclass = MetaWidget):
     __metaclass__ = MetaWidget
 
 
+    _backend = CursesBackend()
+
+
+    _damage = []
+
+
+    _damage_limit = 64
+
+
+    _has_tags = False
+
+
     _input_focus = None
 
 
+    _metrics = None
+
+
+    _scheduler = Scheduler()
+
+
     _theme = Theme()
 
 
@@ -351,6 +845,18 @@ class Widget(metaclass = MetaWidget):
         self.set_input_focus(widget)
 
 
+    @property
+    def metrics(self):
+        ''' Getter for "metrics" property '''
+        return Widget._metrics
+
+
+    @property
+    def scheduler(self):
+        ''' Getter for "scheduler" property '''
+        return Widget._scheduler
+
+
     @property
     def theme(self):
         ''' Getter for "theme" property '''
@@ -405,23 +911,25 @@ class Widget(metaclass = MetaWidget):
         self._signal_router = signal_router if signal_router else signals.SignalRouter()
 
         # Setup signal handlers.
-        self.add_signal_handler('DATASIG_IN', self.decompose)
+        self.add_signal_handler('DATASIG_IN', self._decompose)
         self.add_signal_handler('DATASIG_FOCUS', self._focus)
 
         # Encapsulate a curses window in this widget.
-        pwin = self._parent._win if parent else curses.newwin(0, 0)
+        backend = Widget._backend
+        pwin = self._parent._win if parent else backend.newwin(0, 0)
         ph, pw = pwin.getmaxyx()
         py, px = pwin.getbegyx()
-        win = curses.newwin(ph, pw, py, px)
+        win = backend.newwin(ph, pw, py, px)
         win.keypad(1)
-        win.nodelay(1)
         self._win = win
 
         # Enable rendering of the subtree rooted at this widget.
         self._links = []
         self._is_drawable = True
+        self._is_overlay = False
         self._is_tagged = True
         self._is_visible = True
+        self._record_damage()
 
         # Initialize timestamp
         self.update_timestamp()
@@ -431,6 +939,10 @@ class Widget(metaclass = MetaWidget):
         self._overrides_esc = False
         self._overrides_tab = False
 
+        # Initialize request state.
+        self._is_loading = False
+        self._request_sequence = 0
+
 
     def override(enter = False, esc = False, tab = False):
         '''
@@ -450,13 +962,28 @@ class Widget(metaclass = MetaWidget):
 
 
     def update_timestamp(self):
-        ''' Updates timestamp to current date & time '''
-        self._timestamp = datetime.now()
+        ''' Updates timestamp to the current time '''
+        self._timestamp = Widget._scheduler.now()
 
 
     def get_time(self):
         ''' Calculates elapsed time (sec) since this widget received focus. '''
-        return (datetime.now() - self._timestamp).total_seconds()
+        return Widget._scheduler.now() - self._timestamp
+
+
+    def animate(self, rate):
+        '''
+        Redraws this widget at a fixed rate for as long as it is visible
+
+        Parameters:
+            rate (float): Target frame rate (frames per second)
+        '''
+        Widget._scheduler.animate(self, rate)
+
+
+    def deanimate(self):
+        ''' Stops redrawing this widget at a fixed rate '''
+        Widget._scheduler.deanimate(self)
 
 
     def get_position(self):
@@ -494,7 +1021,7 @@ class Widget(metaclass = MetaWidget):
             Widget: Alias to this widget
         '''
         # Determine the bounds of both this widget and its parent.
-        p = self._parent._win if self._parent else curses.newwin(0, 0)
+        p = self._parent._win if self._parent else Widget._backend.newwin(0, 0)
         py, px = p.getbegyx()
         ph, pw = p.getmaxyx()
         s = self._win
@@ -509,8 +1036,11 @@ class Widget(metaclass = MetaWidget):
         for ref in self._links:
             ref().offset(x, y)
 
-        # Recursively offset the tree of widgets rooted at this node.
+        # Recursively offset the tree of widgets rooted at this node, and
+        # redraw both the vacated and the newly occupied regions.
+        self._record_damage()
         self._offset_tree(x, y)
+        self._record_damage()
 
         return self
 
@@ -527,7 +1057,7 @@ class Widget(metaclass = MetaWidget):
             Widget: Alias to this widget
         '''
         # Determine the coordinates of this widget and its parent.
-        p = self._parent._win if self._parent else curses.newwin(0, 0)
+        p = self._parent._win if self._parent else Widget._backend.newwin(0, 0)
         py, px = p.getbegyx()
         s = self._win
         sy, sx = s.getbegyx()
@@ -554,7 +1084,7 @@ class Widget(metaclass = MetaWidget):
             Widget: Alias to this widget
         '''
         # Determine the bounds of both this widget and its parent.
-        p = self._parent._win if self._parent else curses.newwin(0, 0)
+        p = self._parent._win if self._parent else Widget._backend.newwin(0, 0)
         py, px = p.getbegyx()
         ph, pw = p.getmaxyx()
         s = self._win
@@ -565,8 +1095,11 @@ class Widget(metaclass = MetaWidget):
         width = sw if width is None else min(max(1, width), px + pw - sx)
         height = sh if height is None else min(max(1, height), py + ph - sy)
 
-        # Resize this widget.
+        # Resize this widget, and redraw both the vacated and the newly
+        # occupied regions.
+        self._record_damage()
         self._win.resize(int(height), int(width))
+        self._record_damage()
 
         # Compensate for the effects resizing may have on any children.
         for child in self._children:
@@ -641,7 +1174,7 @@ class Widget(metaclass = MetaWidget):
         span_inner = sh if cross else sw
 
         # Get length along parent's alignment axis.
-        p = self._parent._win if self._parent else curses.newwin(0, 0)
+        p = self._parent._win if self._parent else Widget._backend.newwin(0, 0)
         ph, pw = p.getmaxyx()
         span_outer = ph if cross else pw
 
@@ -662,12 +1195,15 @@ class Widget(metaclass = MetaWidget):
 
     def hide(self):
         ''' Disables visibility of this widget '''
+        self._record_damage()
         self._is_visible = False
 
 
     def show(self):
         ''' Enables visibility of this widget '''
-        self._is_visible = True
+        if not self._is_visible:
+            self._is_visible = True
+            self._record_damage()
 
 
     def toggle_visibility(self):
@@ -675,6 +1211,21 @@ class Widget(metaclass = MetaWidget):
         self.hide() if self._is_visible else self.show()
 
 
+    def _is_shown(self):
+        '''
+        Determines if this widget and all of its ancestors are visible
+
+        Returns:
+            bool: True if shown; False otherwise
+        '''
+        node = self
+        while node:
+            if not node._is_visible:
+                return False
+            node = node._parent
+        return True
+
+
     def style(self, name):
         '''
         Retrieves a curses style attribute from this widget's color theme
@@ -767,13 +1318,25 @@ class Widget(metaclass = MetaWidget):
 
     def request(self, **kwargs):
         ''' Bubbles a request for input data '''
-        signal = signals.Signal('DATASIG_REQ', propagate = False)
+        # Identify this request, superseding any that are pending.
+        self._request_sequence += 1
+        self._set_loading(False)
+
+        signal = signals.Signal(
+            'DATASIG_REQ', propagate = False,
+            _requester = weakref.ref(self), _sequence = self._request_sequence
+        )
         self.bubble(**signal.data)
 
 
     def tag_redraw(self):
         ''' Marks this widget to be redrawn during the next draw call '''
+        # Tagged widgets record their region as damaged once they are drawn,
+        # since widgets drawn beforehand are covered anyway.
         self._is_tagged = True
+        if not Widget._has_tags and self._is_shown():
+            Widget._has_tags = True
+            Widget._scheduler.wake()
         for ref in self._links:
             ref().tag_redraw()
 
@@ -862,6 +1425,37 @@ class Widget(metaclass = MetaWidget):
         return 'CONTINUE'
 
 
+    def draw_loading(self):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Defines how to indicate that requested data is loading; drawn over
+        this widget during a draw call
+        '''
+        return
+
+
+    def _decompose(self, **kwargs):
+        ''' Integrates input signal data into this widget '''
+        metrics = Widget._metrics
+        if metrics:
+            metrics.call(self, 'decompose', **kwargs)
+        else:
+            self.decompose(**kwargs)
+
+
+    def _set_loading(self, is_loading):
+        '''
+        Shows or hides this widget's loading indicator
+
+        Parameters:
+            is_loading (bool): Flag indicating that requested data is pending
+        '''
+        if self._is_loading != is_loading:
+            self._is_loading = is_loading
+            self.tag_redraw()
+
+
     def _focus(self, **kwargs):
         ''' Transfers input focus to this widget in response to a signal '''
         Widget.set_input_focus(self, **kwargs)
@@ -870,42 +1464,167 @@ class Widget(metaclass = MetaWidget):
     def _draw(self):
         ''' Draws this widget '''
         self._draw_tagged()
-        curses.doupdate()
+        Widget._backend.doupdate()
 
 
     def _draw_tagged(self):
-        ''' Draws all visible, tagged subtrees in this tree of widgets '''
-        # Skip hidden trees.
-        if self._is_visible:
+        '''
+        Draws all visible widgets in this tree of widgets that are either
+        tagged or intersect a damaged region of the screen
+        '''
+        # Take ownership of the damaged regions recorded since the last draw
+        # call; damage and tags recorded while drawing are deferred to the
+        # next one.
+        damage = Widget._damage
+        if not damage and not Widget._has_tags:
+            return
+        Widget._damage = []
+        Widget._has_tags = False
 
-            # Draw tree if it is tagged.
-            if self._is_tagged:
-                self._draw_tree()
+        # Draw overlays after the rest of the tree, so they remain on top.
+        overlays = []
+        self._draw_tree(damage, overlays)
+        for overlay in overlays:
+            overlay._draw_tree(damage)
 
-            # Otherwise, continue search for tagged trees.
-            else:
-                for child in self._children:
-                    child._draw_tagged()
 
+    def _is_redraw_pending(self):
+        '''
+        Determines if any damaged regions or tagged widgets are waiting to be
+        redrawn
+
+        Returns:
+            bool: True if a draw operation is pending; False otherwise
+        '''
+        return bool(Widget._damage) or Widget._has_tags
 
-    def _draw_tree(self):
-        ''' Draws the tree of widgets rooted at this node '''
-        # Preemptively remove draw tag.
-        self._is_tagged = False
 
+    def _draw_tree(self, damage, overlays = None):
+        '''
+        Draws the damaged parts of the tree of widgets rooted at this node
+
+        Parameters:
+            damage (list<4-tuple>): Damaged screen regions; extended with the
+                regions that are redrawn
+            overlays (list<Widget>): Collects overlay subtrees to draw last;
+                overlays are drawn in place if omitted (Optional)
+        '''
         # Skip hidden trees.
-        if self._is_visible:
+        if not self._is_visible:
+            return
 
-            # Draw this widget.
-            if self._is_drawable:
-                self._win.bkgdset(self.style('fill'));
-                self._win.erase()
-                self.draw()
-                self._win.noutrefresh()
+        # Defer overlays.
+        if self._is_overlay and overlays is not None:
+            overlays.append(self)
+            return
 
-            # Recursively draw each child subtree.
+        # Draw rows of this widget that are either tagged or damaged.
+        if self._is_drawable:
+            x, y, width, height = rect = self._get_rect()
+            spans = [(0, height)] if self._is_tagged else self._damaged_spans(rect, damage)
+            if spans:
+
+                # Preemptively remove draw tag.
+                self._is_tagged = False
+
+                # Draw this widget, only copying damaged rows to the screen.
+                win = self._win
+                clip = None if spans == [(0, height)] else spans
+                Widget._backend.begin_draw(win, clip)
+                win.bkgdset(self.style('fill'));
+                win.erase()
+                metrics = Widget._metrics
+                if metrics:
+                    metrics.draw(self)
+                else:
+                    self.draw()
+                if self._is_loading:
+                    self.draw_loading()
+                Widget._backend.end_draw(win, clip)
+
+                # Redrawn rows cover widgets that are drawn afterwards.
+                for start, stop in spans:
+                    damage.append((x, y + start, width, stop - start))
+
+        # Pass the tag of widgets that cannot be drawn, such as groups, on to
+        # their children.
+        elif self._is_tagged:
+            self._is_tagged = False
             for child in self._children:
-                child._draw_tree()
+                child._is_tagged = True
+
+        # Recursively draw each child subtree.
+        for child in self._children:
+            child._draw_tree(damage, overlays)
+
+
+    def _damaged_spans(self, rect, damage):
+        '''
+        Finds the rows of the given region that intersect damaged regions
+
+        Parameters:
+            rect (4-tuple): Screen region as (x, y, width, height)
+            damage (list<4-tuple>): Damaged screen regions
+
+        Returns:
+            list<2-tuple>: Sorted, disjoint spans of damaged rows, as
+                (start, stop) pairs relative to the top of the given region
+        '''
+        x, y, width, height = rect
+
+        # Clip damaged regions to the given region.
+        spans = sorted(
+            (max(dy, y) - y, min(dy + dh, y + height) - y)
+            for dx, dy, dw, dh in damage
+            if dx < x + width and x < dx + dw and dy < y + height and y < dy + dh
+        )
+
+        # Merge overlapping spans.
+        merged = []
+        for start, stop in spans:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+            else:
+                merged.append((start, stop))
+        return merged
+
+
+    def _get_rect(self):
+        '''
+        Gets the screen region occupied by this widget
+
+        Returns:
+            4-tuple: x (int), y (int), width (int), height (int)
+        '''
+        y, x = self._win.getbegyx()
+        height, width = self._win.getmaxyx()
+        return x, y, width, height
+
+
+    def _record_damage(self):
+        ''' Marks the screen region occupied by this widget for redraw '''
+        # Hidden widgets do not occupy the screen.
+        if not self._is_shown():
+            return
+
+        # Skip regions that are already damaged.
+        x, y, width, height = self._get_rect()
+        damage = Widget._damage
+        for dx, dy, dw, dh in damage:
+            if dx <= x and dy <= y and x + width <= dx + dw and y + height <= dy + dh:
+                return
+        damage.append((x, y, width, height))
+        if len(damage) == 1:
+            Widget._scheduler.wake()
+
+        # Bound the cost of intersection tests by merging excessive regions
+        # into their bounding box.
+        if len(damage) > Widget._damage_limit:
+            left = min(r[0] for r in damage)
+            top = min(r[1] for r in damage)
+            right = max(r[0] + r[2] for r in damage)
+            bottom = max(r[1] + r[3] for r in damage)
+            Widget._damage = [(left, top, right - left, bottom - top)]
 
 
     def _offset_tree(self, x, y):
@@ -986,6 +1705,14 @@ class ContentWidget(Widget):
         return
 
 
+    def draw_loading(self):
+        # Indicate loading within the top border.
+        self.draw_text(
+            ' Loading... ', margin = (2, 2, 0, 0), align = 'RIGHT',
+            attr = self.style('inactive')
+        )
+
+
     def draw_border(self,
                     offset_left = 0,
                     offset_right = 0,
@@ -1098,6 +1825,31 @@ class ContentWidget(Widget):
         self._win.chgat(row, col, 1, self.style('cursor'))
 
 
+    def draw_highlight(self, col, row, length, attr, margin = (0, 0, 0, 0)):
+        '''
+        Restyles a run of drawn characters, clipped to the given margins
+
+        Parameters:
+            col (int): Column in which the run starts
+            row (int): Row of the run
+            length (int): Number of characters in the run
+            attr (int): Curses style attribute
+            margin (sequence<int>): Left, right, top, and bottom widget margins
+                (Optional)
+        '''
+        # Determine this widget's dimensions.
+        width, height = self.get_size()
+
+        # Return early if the run is not within the given margins.
+        start = max(col, margin[0])
+        stop = min(col + length, width - margin[1])
+        if row < margin[2] or row > height - margin[3] - 1 or start >= stop:
+            return
+
+        # Draw the highlight.
+        self._win.chgat(row, start, stop - start, attr)
+
+
     def draw_text(self, text, row = 0, padding = (0, 0), margin = (0, 0, 0, 0),
                   hint = None, fit = 'CLIP_RIGHT', expand = 'NONE',
                   align = 'LEFT', attr = None, accent = ''                     ):
@@ -1234,7 +1986,8 @@ class ContentWidget(Widget):
 
     def _auto_scroll(self, text, width, gap = 8, rate = 5, delay = 0.67):
         '''
-        Scrolls text on a single line over time
+        Scrolls text on a single line over time; widgets that scroll text
+        should animate at the given rate to advance the scroll
 
         Parameters:
             text (str): Text to scroll
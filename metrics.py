@@ -0,0 +1,110 @@
+# Filename: metrics.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import time
+
+
+class Metrics():
+    '''
+    Opt-in instrumentation of widget methods
+
+    Attributes:
+        _clock (function): Wall time source (sec)
+        _count (function): Source of the running number of curses calls;
+            None if curses calls are not counted
+        _records (dict): Method records keyed by (class name, label, method
+            name) and formatted as follows:
+                [calls (int), time (float), curses calls (int or None)]
+    '''
+    def __init__(self, clock = time.perf_counter, count = lambda: 0):
+        '''
+        Parameters:
+            clock (function): _clock attribute initializer (Optional)
+            count (function): _count attribute initializer (Optional)
+        '''
+        self._clock = clock
+        self._count = count
+        self._records = {}
+
+
+    def call(self, widget, method, *args, **kwargs):
+        '''
+        Calls a method of the given widget, recording its wall time
+
+        Parameters:
+            widget (Widget): Widget owning the method
+            method (str): Method name
+            *args, **kwargs: Method arguments
+
+        Returns:
+            Return value of the method
+        '''
+        start = self._clock()
+        try:
+            return getattr(widget, method)(*args, **kwargs)
+        finally:
+            self._record(widget, method, self._clock() - start, 0)
+
+
+    def draw(self, widget):
+        '''
+        Draws the given widget, recording its wall time and the number of
+        curses calls made meanwhile
+
+        Parameters:
+            widget (Widget): Widget to draw
+        '''
+        if self._count is None:
+            start = self._clock()
+            try:
+                widget.draw()
+            finally:
+                self._record(widget, 'draw', self._clock() - start, None)
+            return
+
+        count = self._count()
+        start = self._clock()
+        try:
+            widget.draw()
+        finally:
+            elapsed = self._clock() - start
+            self._record(widget, 'draw', elapsed, self._count() - count)
+
+
+    def reset(self):
+        ''' Discards all records '''
+        self._records.clear()
+
+
+    def snapshot(self):
+        '''
+        Gets a copy of all records grouped by widget class and label
+
+        Returns:
+            dict: Method statistics keyed by class name, label, and method
+                name, formatted as follows:
+                    {'calls': int, 'time': float, 'curses_calls': int}
+                where curses calls are None if they are not counted
+        '''
+        snapshot = {}
+        for (cls, label, method), (calls, elapsed, curses_calls) in self._records.items():
+            stats = {'calls': calls, 'time': elapsed}
+            if method == 'draw':
+                stats['curses_calls'] = curses_calls
+            snapshot.setdefault(cls, {}).setdefault(label, {})[method] = stats
+        return snapshot
+
+
+    def _record(self, widget, method, elapsed, curses_calls):
+        ''' Accumulates a measured method call '''
+        key = (type(widget).__name__, widget._label, method)
+        record = self._records.get(key)
+        if record:
+            record[0] += 1
+            record[1] += elapsed
+            if curses_calls is not None:
+                record[2] += curses_calls
+        else:
+            self._records[key] = [1, elapsed, curses_calls]
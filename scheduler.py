@@ -0,0 +1,197 @@
+# Filename: scheduler.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import collections
+import heapq
+import itertools
+import math
+import time
+import weakref
+
+
+class Scheduler():
+    '''
+    Deadline queue that allows the event loop to sleep until work is due
+
+    Attributes:
+        _animations (WeakKeyDictionary): Animation schedules keyed by widget
+            and formatted as follows:
+                [interval (float), anchor (float), deadline (float)]
+        _clock (function): Monotonic time source (sec)
+        _counter (itertools.count): Tie-breaker for timers sharing a deadline
+        _ready (deque<function>): Callbacks submitted from other threads
+        _timers (list<list>): Heap of pending timers formatted as follows:
+            [deadline (float), id (int), callback (function)]
+        _wake (function): Callback notifying an event loop of new work
+    '''
+    def __init__(self, clock = time.monotonic):
+        '''
+        Parameters:
+            clock (function): _clock attribute initializer (Optional)
+        '''
+        self._animations = weakref.WeakKeyDictionary()
+        self._clock = clock
+        self._counter = itertools.count()
+        self._ready = collections.deque()
+        self._timers = []
+        self._wake = None
+
+
+    def now(self):
+        ''' Gets the current time (sec) from this scheduler's clock '''
+        return self._clock()
+
+
+    def call_later(self, delay, callback):
+        '''
+        Schedules the given callback to run after a delay
+
+        Parameters:
+            delay (float): Delay (sec) before running the callback
+            callback (function): Function to call without arguments
+
+        Returns:
+            list: Timer that can be passed to the cancel method
+        '''
+        timer = [self._clock() + max(0, delay), next(self._counter), callback]
+        heapq.heappush(self._timers, timer)
+        self.wake()
+        return timer
+
+
+    def call_soon_threadsafe(self, callback):
+        '''
+        Schedules the given callback to run on the event loop's thread; safe to
+        call from any thread
+
+        Parameters:
+            callback (function): Function to call without arguments
+        '''
+        self._ready.append(callback)
+        self.wake()
+
+
+    def animate(self, widget, rate):
+        '''
+        Redraws the given widget at a fixed rate while it is visible
+
+        Parameters:
+            widget (Widget): Widget to animate
+            rate (float): Target frame rate (frames per second)
+        '''
+        interval = 1 / rate
+
+        # Keep the frame phase of an animation that is already running.
+        animation = self._animations.get(widget)
+        if animation and animation[0] == interval:
+            return
+
+        now = self._clock()
+        self._animations[widget] = [interval, now, now + interval]
+        self.wake()
+
+
+    def deanimate(self, widget):
+        '''
+        Stops animating the given widget
+
+        Parameters:
+            widget (Widget): Animated widget
+        '''
+        self._animations.pop(widget, None)
+
+
+    def set_wake(self, callback):
+        '''
+        Sets the callback that notifies an event loop of new work, such as
+        timers, animations, and redraw requests
+
+        Parameters:
+            callback (function): Function to call without arguments; None
+                removes the callback
+        '''
+        self._wake = callback
+
+
+    def wake(self):
+        ''' Notifies the event loop, if any, of new work '''
+        if self._wake:
+            self._wake()
+
+
+    def cancel(self, timer):
+        '''
+        Cancels the given timer, if it is pending
+
+        Parameters:
+            timer (list): Timer returned by the call_later method
+        '''
+        # Disarm the timer; it is discarded once its deadline is reached.
+        timer[2] = None
+
+
+    def run_due(self):
+        '''
+        Runs callbacks submitted from other threads and the callbacks of all
+        timers whose deadlines have passed, and tags visible widgets with
+        pending animation frames for redraw
+        '''
+        # Run callbacks submitted from other threads.
+        ready = self._ready
+        while ready:
+            ready.popleft()()
+
+        # Run timers that were due on entry, deferring timers that they add.
+        timers = self._timers
+        now = self._clock()
+        due = []
+        while timers and timers[0][0] <= now:
+            due.append(heapq.heappop(timers))
+        for timer in due:
+            if timer[2]:
+                timer[2]()
+
+        # Advance animations to their next frame after the current time.
+        for widget, animation in list(self._animations.items()):
+            interval, anchor, deadline = animation
+            if deadline <= now:
+                if widget._is_shown():
+                    widget.tag_redraw()
+                frames = math.floor((now - anchor) / interval) + 1
+                deadline = anchor + frames * interval
+
+                # Guard against rounding onto the current time.
+                animation[2] = deadline if deadline > now else deadline + interval
+
+
+    def timeout(self):
+        '''
+        Calculates the time remaining until the next deadline
+
+        Returns:
+            float: Time (sec) until the next deadline; None if nothing is
+                scheduled
+        '''
+        if self._ready:
+            return 0
+
+        timers = self._timers
+
+        # Discard cancelled timers.
+        while timers and not timers[0][2]:
+            heapq.heappop(timers)
+
+        # Find the earliest deadline, ignoring animations of hidden widgets.
+        deadlines = [
+            animation[2]
+            for widget, animation in self._animations.items()
+            if widget._is_shown()
+        ]
+        if timers:
+            deadlines.append(timers[0][0])
+
+        if not deadlines:
+            return None
+        return max(0, min(deadlines) - self._clock())
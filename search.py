@@ -0,0 +1,183 @@
+# Filename: search.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import bisect
+
+
+class _FoldTable(dict):
+    '''
+    Translation table of characters to their lowercase forms, built as
+    characters are looked up; characters whose lowercase forms are longer
+    are kept as is
+    '''
+    def __missing__(self, code):
+        lowercase = chr(code).lower()
+        self[code] = value = ord(lowercase) if len(lowercase) == 1 else code
+        return value
+
+
+_fold_table = _FoldTable()
+
+
+def fold_case(text):
+    '''
+    Lowercases text one character at a time, so that the result has the same
+    length as the text and offsets within it are offsets within the text;
+    unlike str.lower, characters such as "\u0130" are kept as is rather than
+    expanded
+
+    Parameters:
+        text (str): Text to lowercase
+
+    Returns:
+        str: Lowercase text
+    '''
+    if text.isascii():
+        return text.lower()
+    return text.translate(_fold_table)
+
+
+class IncrementalSearch():
+    '''
+    Case-insensitive search for a pattern that is typed one character at a
+    time; matches of a pattern are found among the matches of the pattern
+    before its last character was typed rather than by searching again, and
+    the matches of each typed prefix are kept so that deleting characters
+    restores them
+
+    Attributes:
+        _scan (function): Finds every match of a pattern; receives the
+            pattern lowercased by fold_case (str) and returns match keys in
+            sorted order
+        _test (function): Determines if a match of a shorter pattern matches
+            the given pattern; receives a match key and the pattern
+            lowercased by fold_case (str) and returns a bool
+        _stack (list<list>): Each typed prefix of the pattern, formatted as
+            follows:
+                [pattern (str), match keys (list); None until needed]
+    '''
+    def __init__(self, scan, test):
+        '''
+        Parameters:
+            scan (function): _scan attribute initializer
+            test (function): _test attribute initializer
+        '''
+        self._scan = scan
+        self._test = test
+        self._stack = []
+
+
+    @property
+    def pattern(self):
+        ''' Getter for "pattern" property '''
+        return self._stack[-1][0] if self._stack else ''
+
+
+    @property
+    def matches(self):
+        ''' Getter for "matches" property '''
+        if not self._stack:
+            return []
+
+        # Find matches that were discarded by the refresh method.
+        entry = self._stack[-1]
+        if entry[1] is None:
+            entry[1] = self._scan(fold_case(entry[0]))
+        return entry[1]
+
+
+    def push(self, text):
+        '''
+        Appends text to the pattern, narrowing the matches
+
+        Parameters:
+            text (str): Typed text
+        '''
+        pattern = self.pattern + text
+        if self._stack:
+            test = self._test
+            lowercase = fold_case(pattern)
+            matches = [key for key in self.matches if test(key, lowercase)]
+        else:
+            matches = self._scan(fold_case(pattern))
+        self._stack.append([pattern, matches])
+
+
+    def pop(self):
+        ''' Removes the last typed character of the pattern '''
+        if self._stack:
+            self._stack.pop()
+
+
+    def refresh(self):
+        ''' Discards matches, which are found again as needed '''
+        for entry in self._stack:
+            entry[1] = None
+
+
+    def first(self, key):
+        '''
+        Finds the first match at or after the given key, wrapping around
+
+        Parameters:
+            key: Match key
+
+        Returns:
+            Match key; None if there are no matches
+        '''
+        matches = self.matches
+        if not matches:
+            return None
+        i = bisect.bisect_left(matches, key)
+        return matches[i % len(matches)]
+
+
+    def next(self, key):
+        '''
+        Finds the first match after the given key, wrapping around
+
+        Parameters:
+            key: Match key
+
+        Returns:
+            Match key; None if there are no matches
+        '''
+        matches = self.matches
+        if not matches:
+            return None
+        i = bisect.bisect_right(matches, key)
+        return matches[i % len(matches)]
+
+
+    def previous(self, key):
+        '''
+        Finds the last match before the given key, wrapping around
+
+        Parameters:
+            key: Match key
+
+        Returns:
+            Match key; None if there are no matches
+        '''
+        matches = self.matches
+        if not matches:
+            return None
+        i = bisect.bisect_left(matches, key)
+        return matches[i - 1]
+
+
+    def position(self, key):
+        '''
+        Gets the position of the given match among all matches
+
+        Parameters:
+            key: Match key
+
+        Returns:
+            int: Index of the match; None if it is not a match
+        '''
+        matches = self.matches
+        i = bisect.bisect_left(matches, key)
+        return i if i < len(matches) and matches[i] == key else None
@@ -4,7 +4,9 @@
 # Author: Brett Fedack
 
 
-import inspect
+import asyncio
+import sys
+import types
 import weakref
 
 
@@ -25,7 +27,7 @@ class Signal():
             data (dict): _data attribute initializer (Optional)
             propagate (bool): _propagate attribute initializer (Optional)
         '''
-        self._name = name
+        self._name = name = sys.intern(name)
         self._data = data if data else {}
         self._propagate = propagate
 
@@ -48,10 +50,27 @@ class SignalRouter():
     Mediator for managing signal handlers and forwarding received signals
 
     Attributes:
-        _signal_handlers (dict): Signal handler lists keyed by signal name
+        _signal_handlers (dict): Weak references to signal handlers keyed by
+            handler identity, in registration order, keyed by signal name
+        _dispatch (dict): Weak references to signal handlers in registration
+            order and in reverse order (2-tuple of tuples), keyed by signal
+            name; replaced rather than modified when handlers are registered
+            or deregistered
+        _dead (set<2-tuple>): Signal name and handler identity of each signal
+            handler that was garbage collected; removed before the next
+            dispatch
+        _tasks (set<Task>): Pending tasks of coroutine signal handlers
+        _on_error (function): Receives exceptions raised by coroutine signal
+            handlers; None re-raises them to the event loop
     '''
+    _tasks = set()
+    _on_error = None
+
+
     def __init__(self):
         self._signal_handlers = dict()
+        self._dispatch = dict()
+        self._dead = set()
 
 
     def forward(self, signal, reverse = False):
@@ -66,29 +85,94 @@ class SignalRouter():
         Returns:
             bool: True if given signal is forwarded; False otherwise
         '''
-        signame = signal.data['_name']
-        propagate = signal.data['_propagate']
+        data = signal.data
+        if self._dead:
+            self._compact()
 
         # Determine if the signal can be handled.
-        if signame in self._signal_handlers:
+        handlers = self._dispatch.get(data['_name'])
+        if handlers is None:
+            return False
 
-            # Create a shallow working copy of the signal handlers list.
-            handlers_list = self._signal_handlers[signame].copy()
-            if reverse:
-                handlers_list.reverse()
+        # Visit registered signal handlers in order; the dispatch table is
+        # replaced, not modified, by handlers that register or deregister.
+        propagate = data['_propagate']
+        for handler in handlers[1] if reverse else handlers[0]:
 
-            # Visit registered signal handlers in order.
-            for handler in handlers_list:
+            # Skip handlers that were garbage collected during dispatch.
+            handler = handler()
+            if handler is None:
+                continue
 
-                # Handle the signal.
-                handler()(**signal.data) # Called from weak reference
+            # Handle the signal.
+            ret = handler(**data)
+            if ret is not None and asyncio.iscoroutine(ret):
+                self._await(ret)
 
-                # Only handle once if the signal cannot propagate.
-                if not propagate:
-                    break
+            # Only handle once if the signal cannot propagate.
+            if not propagate:
+                break
 
-            return True
-        return False
+        return True
+
+
+    def _await(self, coroutine):
+        '''
+        Runs a coroutine signal handler as a task of the running event loop;
+        coroutine signal handlers are refused outside of an event loop, such
+        as that of UI.run_async, since running them to completion would block
+        user input
+
+        Parameters:
+            coroutine (coroutine): Result of calling the signal handler
+        '''
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coroutine.close()
+            raise RuntimeError(
+                'Coroutine signal handlers require a running event loop, such '
+                'as that of UI.run_async'
+            )
+
+        # Keep pending tasks alive.
+        task = loop.create_task(coroutine)
+        SignalRouter._tasks.add(task)
+        task.add_done_callback(SignalRouter._finish_task)
+
+
+    @staticmethod
+    def _finish_task(task):
+        '''
+        Releases the task of a finished coroutine signal handler, and reports
+        any exception it raised
+
+        Parameters:
+            task (Task): Finished task
+        '''
+        SignalRouter._tasks.discard(task)
+        if task.cancelled():
+            return
+        e = task.exception()
+        if e is None:
+            return
+        if SignalRouter._on_error:
+            SignalRouter._on_error(e)
+        else:
+            raise e
+
+
+    @staticmethod
+    def set_error_handler(callback):
+        '''
+        Sets the callback that receives exceptions raised by coroutine signal
+        handlers, such as the error handling of an event loop
+
+        Parameters:
+            callback (function): Function to call with the exception; None
+                removes the callback
+        '''
+        SignalRouter._on_error = callback
 
 
     def register(self, signame, handler):
@@ -101,23 +185,31 @@ class SignalRouter():
 
         Returns:
             (bool): True if handler is registered; False otherwise '''
-        # Create a weak reference to the function/method handler.
-        if inspect.ismethod(handler):
-            handler = weakref.WeakMethod(handler)
-        elif inspect.isfunction(handler):
-            handler = weakref.ref(handler)
-        else:
+        key = self._handler_key(handler)
+        if key is None:
             return False
-
-        # Add given non-duplicate handler to respective signal handlers list.
-        if signame in self._signal_handlers:
-            if handler not in self._signal_handlers[signame]:
-                self._signal_handlers[signame].append(handler)
-                return True
+        if self._dead:
+            self._compact()
+
+        # Add given non-duplicate handler to respective signal handlers.
+        signame = sys.intern(signame)
+        handlers = self._signal_handlers.setdefault(signame, {})
+        ref = handlers.get(key)
+        if ref is not None:
+            if ref() is not None:
+                return False
+            del handlers[key]
+
+        # Mark the handler for removal once it is garbage collected.
+        dead = self._dead
+        callback = lambda ref: dead.add((signame, key))
+        if type(handler) is types.MethodType:
+            handlers[key] = weakref.WeakMethod(handler, callback)
         else:
-            self._signal_handlers[signame] = [handler]
-            return True
-        return False
+            handlers[key] = weakref.ref(handler, callback)
+        self._update_dispatch(signame)
+        return True
+
 
     def deregister(self, signame, handler):
         '''
@@ -130,23 +222,70 @@ class SignalRouter():
         Returns:
             (bool): True if handler is deregistered; False otherwise
         '''
-        # Compare function/method handlers by weak reference.
-        if inspect.ismethod(handler):
-            handler = weakref.WeakMethod(handler)
-        elif inspect.isfunction(handler):
-            handler = weakref.ref(handler)
-        else:
+        key = self._handler_key(handler)
+        if self._dead:
+            self._compact()
+        handlers = self._signal_handlers.get(signame)
+        if key is None or not handlers or key not in handlers:
             return False
 
-        # Remove given handler from respective signal handlers list.
-        if (signame in self._signal_handlers
-            and handler in self._signal_handlers[signame]
-        ):
-            self._signal_handlers[signame].remove(handler)
+        # Remove given handler from respective signal handlers.
+        del handlers[key]
+        self._update_dispatch(signame)
+        return True
+
+
+    def _compact(self):
+        '''
+        Removes signal handlers that were garbage collected; removal is
+        deferred from the death callbacks of weak references, which may run
+        while signal handlers are being updated
+        '''
+        dead = self._dead
+        while dead:
+            signame, key = dead.pop()
+
+            # Keep live handlers registered since under a reused identity.
+            handlers = self._signal_handlers.get(signame)
+            ref = handlers.get(key) if handlers else None
+            if ref is not None and ref() is None:
+                del handlers[key]
+                self._update_dispatch(signame)
+
+
+    def _handler_key(self, handler):
+        '''
+        Identifies a signal handler without holding a reference to it
+
+        Parameters:
+            handler (method|function): Signal handler
+
+        Returns:
+            Identity of the bound instance and function of a method, or of a
+            function; None if the handler is neither
+        '''
+        handler_type = type(handler)
+        if handler_type is types.MethodType:
+            return (id(handler.__self__), id(handler.__func__))
+        elif handler_type is types.FunctionType:
+            return id(handler)
+        return None
+
+
+    def _update_dispatch(self, signame):
+        '''
+        Rebuilds the dispatch table entry of the given signal name
+
+        Parameters:
+            signame (str): Signal name
+        '''
+        handlers = self._signal_handlers.get(signame)
 
-            # Remove signal name if it is associated with an empty list.
-            if not self._signal_handlers[signame]:
-                del self._signal_handlers[signame]
+        # Remove signal name if it has no signal handlers.
+        if not handlers:
+            self._signal_handlers.pop(signame, None)
+            self._dispatch.pop(signame, None)
+            return
 
-            return True
-        return False
+        handlers = tuple(handlers.values())
+        self._dispatch[signame] = (handlers, handlers[::-1])
@@ -0,0 +1,1209 @@
+# Filename: sources.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import array
+import bisect
+import heapq
+import io
+import itertools
+import json
+import mmap
+import operator
+import pickle
+import re
+import sys
+import tempfile
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def to_text(item):
+    '''
+    Converts a table item into displayable text
+
+    Parameters:
+        item: Table item
+
+    Returns:
+        str: Text of integers and strings; empty otherwise
+    '''
+    return str(item) if type(item) in {int, str} else ''
+
+
+class RowSource():
+    '''
+    Protocol for rows of tabulated data that are fetched as they are needed;
+    subclasses override the __len__ and fetch methods
+
+    Attributes:
+        header (list<str>): Column names
+    '''
+    def __init__(self, header):
+        '''
+        Parameters:
+            header (sequence): header attribute initializer
+        '''
+        self.header = [to_text(name) for name in header]
+
+
+    def __len__(self):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Gets the number of rows
+
+        Returns:
+            int: Number of rows
+        '''
+        return 0
+
+
+    def fetch(self, start, stop):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Gets a range of rows
+
+        Parameters:
+            start (int): Index of first row
+            stop (int): Index after last row
+
+        Returns:
+            list<list<str>>: Rows of text
+        '''
+        return []
+
+
+    def col_widths(self):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Gets the length of the longest item, header included, of each column
+
+        Returns:
+            list<int>: Column widths in characters; None if unknown
+        '''
+        return None
+
+
+class ListSource(RowSource):
+    '''
+    Row source holding tabulated data in memory
+
+    Attributes:
+        _body (list<list<str>>): Rows of text
+        _widths (list<int>): Length of the longest item of each column
+        _keys (dict<str:int>): Row indices keyed by the item in the key
+            column; None until rows are changed by key
+        _key_column (int): Column index of keys
+        _keys_stop (int): Number of rows indexed by key
+    '''
+    def __init__(self, table = ()):
+        '''
+        Parameters:
+            table (sequence<sequence>): Header followed by rows of items
+                (Optional)
+        '''
+        table = iter(table)
+        super().__init__(next(table, []))
+        self._body = []
+        self._widths = [len(name) for name in self.header]
+        self._keys = None
+        self._key_column = None
+        self._keys_stop = 0
+        self.extend(table)
+
+
+    def __len__(self):
+        return len(self._body)
+
+
+    def fetch(self, start, stop):
+        return self._body[start:stop]
+
+
+    def col_widths(self):
+        return self._widths
+
+
+    @classmethod
+    def from_pretty_print(cls, text, **kwargs):
+        '''
+        Creates a row source from an ASCII table, parsing it as it is loaded
+
+        Parameters:
+            text (str|bytes|file): See the parse_pretty_print function
+            kwargs: Keyword arguments passed on to the constructor
+
+        Returns:
+            ListSource: Parsed rows
+        '''
+        rows = parse_pretty_print(text)
+        source = cls((next(rows, []),), **kwargs)
+        source._extend_text(rows)
+        return source
+
+
+    def extend(self, rows):
+        '''
+        Appends rows of items, validating each against the header
+
+        Parameters:
+            rows (iterable<sequence>): Rows of items
+        '''
+        self._extend_text([to_text(item) for item in row] for row in rows)
+
+
+    def apply_delta(self, key = 0, insert = (), update = (), delete = ()):
+        '''
+        Changes rows identified by the item in a key column; rows are deleted
+        first, then updated in place, then inserted at the end, and no rows
+        change if any row does not match the header
+
+        Parameters:
+            key (int): Column index of keys (Optional)
+            insert (iterable<sequence>): Rows to append; rows whose keys
+                exist replace them instead (Optional)
+            update (iterable<sequence>): Rows to replace; rows whose keys do
+                not exist are ignored (Optional)
+            delete (iterable): Keys of rows to remove (Optional)
+
+        Returns:
+            2-tuple: Indices of rows replaced in place (set<int>), and indices
+                of removed rows prior to their removal (list<int>)
+        '''
+        # Reject changes that include rows that do not match the header.
+        widths = self._widths
+        update, insert = [
+            [[to_text(item) for item in row] for row in rows]
+            for rows in (update, insert)
+        ]
+        if any(len(row) != len(widths) for row in itertools.chain(update, insert)):
+            raise ValueError('Mismatch between table header & body column counts')
+
+        body = self._body
+        keys = self._index_keys(key)
+
+        # Remove deleted rows, which shifts the rows after them.
+        deleted = sorted({keys[k] for k in map(to_text, delete) if k in keys})
+        if deleted:
+            removed = set(deleted)
+            start = deleted[0]
+            body[start:] = [
+                row for i, row in enumerate(body[start:], start) if i not in removed
+            ]
+            self._keys = None
+            keys = self._index_keys(key)
+
+        # Replace existing rows, and append new rows.
+        updated = set()
+        new_rows = []
+        for rows, is_insert in ((update, False), (insert, True)):
+            for row in rows:
+                i = keys.get(row[key])
+                if i is not None:
+                    body[i] = row
+                    updated.add(i)
+                    widths[:] = map(max, widths, map(len, row))
+                elif is_insert:
+                    new_rows.append(row)
+        self._extend_text(new_rows)
+
+        return updated, deleted
+
+
+    def _index_keys(self, column):
+        '''
+        Indexes rows by the item in the given column, continuing from the
+        last indexed row
+
+        Parameters:
+            column (int): Column index of keys
+
+        Returns:
+            dict<str:int>: Row indices keyed by item
+        '''
+        if self._keys is None or self._key_column != column:
+            self._keys = {}
+            self._key_column = column
+            self._keys_stop = 0
+
+        keys = self._keys
+        body = self._body
+        for i in range(self._keys_stop, len(body)):
+            keys[body[i][column]] = i
+        self._keys_stop = len(body)
+        return keys
+
+
+    def _extend_text(self, rows):
+        '''
+        Appends rows of text, validating each against the header
+
+        Parameters:
+            rows (iterable<list<str>>): Rows of text
+        '''
+        body = self._body
+        widths = self._widths
+        for row in rows:
+
+            # Reject rows that do not match the header.
+            if len(row) != len(widths):
+                raise ValueError('Mismatch between table header & body column counts')
+
+            # Widen columns to fit the row.
+            widths[:] = map(max, widths, map(len, row))
+            body.append(row)
+
+
+class SpillSource(ListSource):
+    '''
+    Row source holding tabulated data in memory up to a budget; rows past the
+    budget are written to a temporary file and read back through a memory map
+    as they are fetched; rows in memory can be changed by key, but spilled
+    rows cannot
+
+    Attributes:
+        _memory_budget (int): Estimated memory (bytes) that rows may occupy
+        _memory_used (int): Estimated memory (bytes) occupied by rows
+        _file (file): Temporary file of spilled rows encoded as JSON; None
+            until rows spill
+        _map (mmap.mmap): Memory map of the temporary file; None until
+            spilled rows are fetched
+        _offsets (array): Offset (bytes) of each spilled row in the temporary
+            file, followed by the end of the last row
+        _spilled_keys (set<str>): Items in the key column of spilled rows;
+            None until rows are changed by key after rows spill
+        _spilled_key_column (int): Column index of spilled keys
+    '''
+    # Estimated memory (bytes) occupied by each row and item, excluding text.
+    _row_size = 64
+    _item_size = 56
+
+    def __init__(self, table = (), memory_budget = 64 << 20):
+        '''
+        Parameters:
+            table (sequence<sequence>): Header followed by rows of items
+                (Optional)
+            memory_budget (int): _memory_budget attribute initializer
+                (Optional)
+        '''
+        self._memory_budget = memory_budget
+        self._memory_used = 0
+        self._file = None
+        self._map = None
+        self._offsets = array.array('Q', [0])
+        self._spilled_keys = None
+        self._spilled_key_column = None
+        super().__init__(table)
+
+
+    def __del__(self):
+        self.close()
+
+
+    def __len__(self):
+        return len(self._body) + len(self._offsets) - 1
+
+
+    def fetch(self, start, stop):
+        start, stop, _ = slice(start, stop).indices(len(self))
+        body = self._body
+        rows = body[start:stop]
+
+        # Read rows past those in memory from the temporary file.
+        start = max(start, len(body)) - len(body)
+        stop -= len(body)
+        if stop > start:
+            rows.extend(self._read(start, stop))
+        return rows
+
+
+    @property
+    def is_spilled(self):
+        ''' Getter for "is_spilled" property '''
+        return self._file is not None
+
+
+    def apply_delta(self, key = 0, insert = (), update = (), delete = ()):
+        '''
+        Changes rows identified by the item in a key column; see
+        ListSource.apply_delta; inserted rows past the memory budget are
+        spilled, and no rows change if a changed row is spilled, since
+        spilled rows cannot be changed in place
+
+        Returns:
+            2-tuple: See ListSource.apply_delta
+        '''
+        insert, update = list(insert), list(update)
+        delete = [to_text(k) for k in delete]
+
+        # Find keys of changed rows that are not in memory among the keys of
+        # spilled rows.
+        if self._file is not None:
+            changed = {to_text(row[key]) for row in insert + update if key < len(row)}
+            changed.update(delete)
+            changed.difference_update(self._index_keys(key))
+            if not changed.isdisjoint(self._index_spilled_keys(key)):
+                raise ValueError('Rows spilled to disk cannot be changed')
+
+        return super().apply_delta(key, insert, update, delete)
+
+
+    def close(self):
+        ''' Releases the temporary file, if any '''
+        if self._map:
+            self._map.close()
+            self._map = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+    def _extend_text(self, rows):
+        body = self._body
+        widths = self._widths
+        offsets = self._offsets
+        for row in rows:
+
+            # Reject rows that do not match the header.
+            if len(row) != len(widths):
+                raise ValueError('Mismatch between table header & body column counts')
+
+            # Widen columns to fit the row.
+            widths[:] = map(max, widths, map(len, row))
+
+            # Keep rows in memory until the budget is spent.
+            if self._file is None:
+                self._memory_used += self._row_size + sum(
+                    self._item_size + len(item) for item in row
+                )
+                if self._memory_used <= self._memory_budget:
+                    body.append(row)
+                    continue
+                self._file = tempfile.TemporaryFile()
+
+            # Spill rows past the budget, indexing where each row starts.
+            data = json.dumps(row, ensure_ascii = False, separators = (',', ':'))
+            data = data.encode('utf-8')
+            self._file.write(data)
+            offsets.append(offsets[-1] + len(data))
+            if self._spilled_keys is not None:
+                self._spilled_keys.add(row[self._spilled_key_column])
+
+
+    def _index_spilled_keys(self, column, chunk_size = 1 << 12):
+        '''
+        Indexes the items in the given column of spilled rows, reading them
+        back once per key column
+
+        Parameters:
+            column (int): Column index of keys
+            chunk_size (int): Number of rows read at a time (Optional)
+
+        Returns:
+            set<str>: Spilled keys
+        '''
+        if self._spilled_keys is None or self._spilled_key_column != column:
+            self._spilled_keys = keys = set()
+            self._spilled_key_column = column
+            count = len(self._offsets) - 1
+            for start in range(0, count, chunk_size):
+                rows = self._read(start, min(count, start + chunk_size))
+                keys.update(row[column] for row in rows)
+        return self._spilled_keys
+
+
+    def _read(self, start, stop):
+        '''
+        Reads a range of spilled rows
+
+        Parameters:
+            start (int): Index of first spilled row
+            stop (int): Index after last spilled row
+
+        Returns:
+            list<list<str>>: Rows of text
+        '''
+        offsets = self._offsets
+
+        # Map the temporary file again once rows are written past the map.
+        if self._map is None or len(self._map) < offsets[stop]:
+            self._file.flush()
+            if self._map:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        data = self._map
+        return [json.loads(data[offsets[i]:offsets[i + 1]]) for i in range(start, stop)]
+
+
+class ArraySource(RowSource):
+    '''
+    Row source holding tabulated data in NumPy arrays, one per column; items
+    are only converted to text as rows are fetched, and numbers are aligned
+    to the right of their columns
+
+    Attributes:
+        _columns (list<numpy.ndarray>): Numeric arrays, and object arrays of
+            text, of equal length
+        _buffers (list<numpy.ndarray>): Arrays that hold each column in their
+            leading items, with room for appended rows
+        _widths (list<int>): Length of the longest item of each column
+    '''
+    def __init__(self, header, columns):
+        '''
+        Parameters:
+            header (sequence): header attribute initializer
+            columns (sequence<array_like>): Items of each column
+        '''
+        if numpy is None:
+            raise ImportError('ArraySource requires NumPy')
+        super().__init__(header)
+
+        # Store numbers natively, and anything else as text.
+        self._columns = [self._to_array(column) for column in columns]
+        self._buffers = list(self._columns)
+
+        # Reject columns that do not match the header, or each other.
+        if len(self._columns) != len(self.header):
+            raise ValueError('Mismatch between table header & body column counts')
+        if len({len(column) for column in self._columns}) > 1:
+            raise ValueError('Table columns differ in length')
+
+        self._widths = [
+            max(len(name), self._measure(column))
+            for name, column in zip(self.header, self._columns)
+        ]
+
+
+    @classmethod
+    def from_records(cls, records):
+        '''
+        Creates a row source from the fields of a structured array
+
+        Parameters:
+            records (numpy.ndarray): Structured array with a field per column
+
+        Returns:
+            ArraySource: Rows of the array
+        '''
+        names = records.dtype.names
+        return cls(names, [records[name] for name in names])
+
+
+    @classmethod
+    def from_table(cls, table):
+        '''
+        Creates a row source from rows of items
+
+        Parameters:
+            table (sequence<sequence>): Header followed by rows of items
+
+        Returns:
+            ArraySource: Rows of the table
+        '''
+        table = iter(table)
+        header = list(next(table, []))
+        rows = list(table)
+        if any(len(row) != len(header) for row in rows):
+            raise ValueError('Mismatch between table header & body column counts')
+        columns = zip(*rows) if rows else [()] * len(header)
+        return cls(header, columns)
+
+
+    def __len__(self):
+        return len(self._columns[0]) if self._columns else 0
+
+
+    def fetch(self, start, stop):
+        return self._rows(slice(start, stop))
+
+
+    def extend(self, rows):
+        '''
+        Appends rows of items, validating each against the header; numbers
+        can be appended to numeric columns and to empty columns, and anything
+        else to text columns
+
+        Parameters:
+            rows (iterable<sequence>): Rows of items
+        '''
+        rows = [list(row) for row in rows]
+        if any(len(row) != len(self.header) for row in rows):
+            raise ValueError('Mismatch between table header & body column counts')
+        if not rows:
+            return
+
+        # Reject rows that do not match the type of each column before
+        # changing any column.
+        appended = []
+        for column, items in zip(self._columns, zip(*rows)):
+            array = self._to_array(items)
+            is_numeric = array.dtype.kind in 'iuf'
+            if len(column) and is_numeric != (column.dtype.kind in 'iuf'):
+                raise ValueError('Mismatch between table column & appended item types')
+            appended.append(array)
+
+        for i, array in enumerate(appended):
+            column = self._columns[i]
+            buffer = self._buffers[i]
+            start, stop = len(column), len(column) + len(array)
+            dtype = numpy.result_type(column, array) if len(column) else array.dtype
+
+            # Grow the buffer geometrically, so that appending is amortized
+            # over the rows appended.
+            if stop > len(buffer) or dtype != buffer.dtype:
+                buffer = numpy.empty(max(stop, 2 * len(buffer)), dtype)
+                buffer[:start] = column
+                self._buffers[i] = buffer
+            buffer[start:stop] = array
+            self._columns[i] = buffer[:stop]
+
+            # Measure the appended items, or the whole column if it is
+            # formatted differently now.
+            if dtype != column.dtype:
+                self._widths[i] = max(len(self.header[i]), self._measure(buffer[:stop]))
+            else:
+                self._widths[i] = max(self._widths[i], self._measure(array))
+
+
+    def take(self, indices):
+        '''
+        Gets rows by index
+
+        Parameters:
+            indices (list<int>): Row indices
+
+        Returns:
+            list<list<str>>: Rows of text
+        '''
+        return self._rows(numpy.asarray(indices, numpy.intp))
+
+
+    def col_widths(self):
+        return self._widths
+
+
+    @staticmethod
+    def _to_array(items):
+        ''' Converts items to a numeric array, or to an object array of text '''
+        array = numpy.asarray(items)
+        if array.ndim != 1:
+            raise ValueError('Table columns must be one-dimensional')
+        if array.dtype.kind not in 'iuf':
+            array = numpy.array([to_text(item) for item in array.tolist()], object)
+        return array
+
+
+    def _rows(self, key):
+        ''' Formats the rows selected by the given array index '''
+        columns = []
+        for column, width in zip(self._columns, self._widths):
+            values = column[key]
+            if column.dtype.kind in 'iuf':
+                values = numpy.char.rjust(values.astype(str), width)
+            columns.append(values.tolist())
+        return [list(row) for row in zip(*columns)]
+
+
+    @staticmethod
+    def _measure(column, chunk_size = 1 << 16):
+        ''' Gets the length of the longest item of the given column '''
+        if not len(column):
+            return 0
+
+        # The extremes of an integer column are its longest items.
+        kind = column.dtype.kind
+        if kind in 'iu':
+            return max(len(str(column.min())), len(str(column.max())))
+
+        # Convert floats to text in chunks to bound memory.
+        if kind == 'f':
+            return max(
+                int(numpy.char.str_len(column[i:i + chunk_size].astype(str)).max())
+                for i in range(0, len(column), chunk_size)
+            )
+
+        return max(map(len, column))
+
+
+def parse_pretty_print(text):
+    '''
+    Parses an ASCII table one line at a time; accepts tables bordered by "|"
+    and "+" characters, as well as psql's aligned output format
+
+    Parameters:
+        text (str|bytes|file): Table text, UTF-8 encoded bytes, or a text or
+            binary file-like object
+
+    Returns:
+        generator: Yields the header followed by each row as a list of
+            stripped items
+    '''
+    is_bordered = None
+    for line in _iter_lines(text):
+        line = line.rstrip('\r\n')
+
+        # Determine the format from the first non-empty line.
+        if not line.strip():
+            continue
+        if is_bordered is None:
+            is_bordered = line[0] in '|+'
+
+        # Only parse rows between the outer borders.
+        if is_bordered:
+            if line[0] == '|':
+                yield [item.strip() for item in line.split('|')[1:-1]]
+
+        # Skip psql's header separator and row count footer.
+        elif not _psql_skip.match(line):
+            yield [item.strip() for item in line.split('|')]
+
+
+# Lines of psql's aligned output that do not hold table rows.
+_psql_skip = re.compile(r'^(?:[-+]+|\(\d+ rows?\))$')
+
+# Number of characters of a string split into lines at a time.
+_block_size = 1 << 16
+
+
+def _iter_lines(text):
+    ''' Iterates over the lines of text, bytes, or file-like objects '''
+    # Decode bytes one line at a time.
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        text = io.BytesIO(text)
+
+    # Split strings in blocks rather than copying them whole.
+    if isinstance(text, str):
+        tail = ''
+        for start in range(0, len(text), _block_size):
+            lines = (tail + text[start:start + _block_size]).split('\n')
+            tail = lines.pop()
+            yield from lines
+        if tail:
+            yield tail
+        return
+
+    for line in text:
+        yield line.decode('utf-8') if isinstance(line, bytes) else line
+
+
+def sort_key(text):
+    '''
+    Orders decimal numbers numerically, before text ordered
+    case-insensitively; words that Python reads as numbers, such as "nan" and
+    "inf", are text
+
+    Parameters:
+        text (str): Table item
+
+    Returns:
+        tuple: Sort key
+    '''
+    if _decimal.match(text):
+        return (0, float(text), '')
+    return (1, 0, text.lower())
+
+
+# Decimal numbers, optionally signed, in fixed or exponent notation; numbers
+# are right-justified in columns of arrays.
+_decimal = re.compile(r'^\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$')
+
+
+class ViewSource(RowSource):
+    '''
+    Sorted and filtered view of another row source; views are computed in
+    steps so that callers can interleave other work, and the rows computed so
+    far are available while a computation is underway
+
+    Attributes:
+        _source (RowSource): Underlying rows
+        _sort (2-tuple): Column index (int) and descending flag (bool) of the
+            sort order; None if unsorted
+        _filter (2-tuple): Column index (int), or None for any column, and
+            lowercase text (str) of the filter; None if unfiltered
+        _index (array): Underlying row indices in view order; None if the view
+            matches the underlying order
+        _sort_cache (dict<2-tuple:array>): Sort permutations keyed by
+            sort order; rows appended since are merged in when used
+        _filter_cache (dict<2-tuple:bytearray>): Filter bitmaps keyed by
+            filter; rows appended since are tested when used
+        _chunk_size (int): Number of rows processed per computation step
+        _run_size (int): Number of rows per sorted run written to a temporary
+            file when sorting rows that are spilled to disk
+        version (int): Number of times the row indices have been replaced
+    '''
+    def __init__(self, source, chunk_size = 1000):
+        '''
+        Parameters:
+            source (RowSource): _source attribute initializer
+            chunk_size (int): _chunk_size attribute initializer (Optional)
+        '''
+        self.header = source.header
+        self._source = source
+        self._sort = None
+        self._filter = None
+        self._index = None
+        self._sort_cache = {}
+        self._filter_cache = {}
+        self._chunk_size = chunk_size
+        self._run_size = 1 << 16
+        self.version = 0
+
+
+    @property
+    def sort(self):
+        ''' Getter for "sort" property '''
+        return self._sort
+
+
+    @property
+    def filter(self):
+        ''' Getter for "filter" property '''
+        return self._filter
+
+
+    def __len__(self):
+        return len(self._source) if self._index is None else len(self._index)
+
+
+    def fetch(self, start, stop):
+        index = self._index
+        if index is None:
+            return self._source.fetch(start, stop)
+        # Gather rows in one call if the underlying source supports it.
+        take = getattr(self._source, 'take', None)
+        if take:
+            return take(index[start:stop])
+        fetch = self._source.fetch
+        return [fetch(i, i + 1)[0] for i in index[start:stop]]
+
+
+    def col_widths(self):
+        get_widths = getattr(self._source, 'col_widths', None)
+        return get_widths() if get_widths else None
+
+
+    def extend(self, rows):
+        '''
+        Appends rows to the underlying source; cached sort permutations and
+        filter bitmaps are kept, and appended rows join the view once it is
+        updated
+
+        Parameters:
+            rows (iterable<sequence>): Rows of items
+        '''
+        self._source.extend(rows)
+
+
+    def apply_delta(self, key = 0, insert = (), update = (), delete = ()):
+        '''
+        Changes underlying rows by key, which invalidates cached sort
+        permutations and filter bitmaps; see ListSource.apply_delta
+
+        Returns:
+            2-tuple: Indices of underlying rows replaced in place (set<int>),
+                and indices of removed underlying rows (list<int>)
+        '''
+        try:
+            updated, deleted = self._source.apply_delta(key, insert, update, delete)
+        finally:
+            self._sort_cache.clear()
+            self._filter_cache.clear()
+
+        # Drop removed rows from the view until it is recomputed.
+        if deleted and self._index is not None:
+            removed = set(deleted)
+            self._publish(array.array('q', (
+                i - bisect.bisect_left(deleted, i)
+                for i in self._index
+                if i not in removed
+            )))
+        return updated, deleted
+
+
+    def update(self, sort = None, filter = None):
+        '''
+        Computes the view for the given sort order and filter in steps
+
+        Parameters:
+            sort (2-tuple): Column index (int) and descending flag (bool)
+                (Optional)
+            filter (2-tuple): Column index (int), or None for any column, and
+                text (str) (Optional)
+
+        Returns:
+            generator: Yields after each step; exhausted once the view is
+                computed
+        '''
+        if filter:
+            filter = (filter[0], filter[1].lower())
+        self._sort = sort
+        self._filter = filter
+
+        # Order underlying rows.
+        order = None
+        if sort:
+            # Sort each direction separately, since reversing a stable sort
+            # reverses the order of equal rows.
+            column, descending = sort
+            order = self._sort_cache.get(sort)
+            if order is not None and len(order) < len(self._source):
+                order = yield from self._merge_appended(column, descending, order)
+                if order is not None:
+                    self._sort_cache[sort] = order
+            if order is None:
+                order = array.array('q')
+                yield from self._merge_sorted(column, descending, order, not filter)
+                self._sort_cache[sort] = order
+
+        # Select underlying rows.
+        if filter:
+            index = array.array('q')
+            yield from self._select(filter, order, index)
+        else:
+            index = order
+        self._publish(index)
+
+
+    def _publish(self, index):
+        ''' Replaces the row indices of this view '''
+        self._index = index
+        self.version += 1
+
+
+    def _rows(self, start, stop):
+        ''' Iterates over underlying rows in chunks along with their indices '''
+        source = self._source
+        chunk_size = self._chunk_size
+        for i in range(start, stop, chunk_size):
+            yield i, source.fetch(i, min(stop, i + chunk_size))
+
+
+    def _merge_sorted(self, column, descending, order, publish):
+        '''
+        Sorts underlying rows by the given column in sorted runs that are
+        merged in steps, appending to the given list
+
+        Parameters:
+            column (int): Column index
+            descending (bool): Flag indicating a descending sort order
+            order (array): Receives sorted row indices
+            publish (bool): Flag indicating that sorted rows are viewable
+                while sorting
+        '''
+        # Keep the sort keys of rows that are spilled to disk on disk too.
+        if getattr(self._source, 'is_spilled', False):
+            merged = yield from self._merge_spilled(column, descending)
+
+        else:
+            keys = []
+            runs = []
+
+            # Sort runs of rows.
+            for start, rows in self._rows(0, len(self._source)):
+                keys.extend(sort_key(row[column]) for row in rows)
+                run = sorted(
+                    range(start, start + len(rows)),
+                    key = keys.__getitem__, reverse = descending
+                )
+                runs.append(run)
+                yield
+            merged = heapq.merge(*runs, key = keys.__getitem__, reverse = descending)
+
+        # Merge runs, viewing the merged rows so far.
+        chunk_size = self._chunk_size
+        while True:
+            chunk = list(itertools.islice(merged, chunk_size))
+            if not chunk:
+                break
+            order.extend(chunk)
+            if publish and self._index is not order:
+                self._publish(order)
+            yield
+
+
+    def _merge_appended(self, column, descending, order):
+        '''
+        Merges underlying rows appended since the given sort permutation was
+        computed into it in steps, searching for the place of each appended
+        row after equal rows
+
+        Parameters:
+            column (int): Column index
+            descending (bool): Flag indicating a descending sort order
+            order (array): Sorted row indices of the rows before those
+                appended
+
+        Returns:
+            array: Sorted row indices; None if so many rows were appended that
+                sorting all rows is cheaper
+        '''
+        start, stop = len(order), len(self._source)
+        if (stop - start) * start.bit_length() > start:
+            return None
+
+        # Sort appended rows.
+        keys = []
+        for i, rows in self._rows(start, stop):
+            keys.extend(sort_key(row[column]) for row in rows)
+            yield
+        appended = sorted(
+            range(stop - start), key = keys.__getitem__, reverse = descending
+        )
+
+        def key_at(position):
+            ''' Gets the sort key of a row in the given sorted position '''
+            i = order[position]
+            return sort_key(self._source.fetch(i, i + 1)[0][column])
+
+        # Find the place of each appended row, which follows the place of the
+        # previous appended row.
+        merged = array.array('q')
+        lo = 0
+        for count, i in enumerate(appended, 1):
+            key = keys[i]
+            hi = len(order)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if (key > key_at(mid)) if descending else (key < key_at(mid)):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            merged.extend(order[len(merged) - count + 1:lo])
+            merged.append(start + i)
+            if count % self._chunk_size == 0:
+                yield
+        merged.extend(order[len(merged) - len(appended):])
+        return merged
+
+
+    def _merge_spilled(self, column, descending):
+        '''
+        Sorts underlying rows by the given column in sorted runs of sort keys
+        and row indices that are written to a temporary file, so that only a
+        run and a block of each run are held in memory
+
+        Parameters:
+            column (int): Column index
+            descending (bool): Flag indicating a descending sort order
+
+        Returns:
+            iterator<int>: Row indices in sorted order, read from the runs as
+                they are merged
+        '''
+        file = tempfile.TemporaryFile()
+        block_size = self._chunk_size
+        num_rows = len(self._source)
+        by_key = operator.itemgetter(0)
+        runs = []
+        run = []
+
+        # Sort runs of rows, writing each in blocks.
+        for start, rows in self._rows(0, num_rows):
+            keys = (sort_key(row[column]) for row in rows)
+            run.extend(zip(keys, itertools.count(start)))
+            if len(run) >= self._run_size or start + len(rows) >= num_rows:
+                run.sort(key = by_key, reverse = descending)
+                offsets = []
+                for i in range(0, len(run), block_size):
+                    offsets.append(file.tell())
+                    pickle.dump(run[i:i + block_size], file)
+                runs.append(offsets)
+                run = []
+            yield
+        file.flush()
+
+        def read(offsets):
+            ''' Reads the blocks of a run '''
+            for offset in offsets:
+                file.seek(offset)
+                yield from pickle.load(file)
+
+        merged = heapq.merge(*map(read, runs), key = by_key, reverse = descending)
+        return map(operator.itemgetter(1), merged)
+
+
+    def _select(self, filter, order, index):
+        '''
+        Selects underlying rows that match the given filter in steps,
+        appending to the given list
+
+        Parameters:
+            filter (2-tuple): Column index, or None, and lowercase text
+            order (array): Row indices in view order; None for the underlying
+                order
+            index (array): Receives selected row indices
+        '''
+        column, text = filter
+        bitmap = self._filter_cache.get(filter)
+
+        # Test rows appended since the bitmap was computed.
+        if bitmap is not None and len(bitmap) < len(self._source):
+            for start, rows in self._rows(len(bitmap), len(self._source)):
+                for row in rows:
+                    items = row if column is None else row[column:column + 1]
+                    bitmap.append(any(text in item.lower() for item in items))
+                yield
+
+        # Test each row at most once per filter.
+        if bitmap is None:
+            bitmap = bytearray(len(self._source))
+            for start, rows in self._rows(0, len(self._source)):
+                for i, row in enumerate(rows, start):
+                    items = row if column is None else row[column:column + 1]
+                    bitmap[i] = any(text in item.lower() for item in items)
+
+                # View matches so far while following the underlying order.
+                if order is None:
+                    index.extend(i for i in range(start, start + len(rows)) if bitmap[i])
+                    if self._index is not index:
+                        self._publish(index)
+                yield
+            self._filter_cache[filter] = bitmap
+            if order is None:
+                return
+
+        # Apply the bitmap in view order.
+        order = range(len(bitmap)) if order is None else order
+        chunk_size = self._chunk_size
+        for start in range(0, len(order), chunk_size):
+            index.extend(i for i in order[start:start + chunk_size] if bitmap[i])
+            if self._index is not index:
+                self._publish(index)
+            yield
+
+
+class OptionSource():
+    '''
+    Protocol for enumerated input options that are fetched a page at a time
+    as they are needed; subclasses override the __len__ and fetch methods,
+    and fetching may be asynchronous, as when options come from a catalog
+    query
+    '''
+    def __len__(self):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Gets the number of options
+
+        Returns:
+            int: Number of options
+        '''
+        return 0
+
+
+    def fetch(self, start, stop):
+        '''
+        * Abstract method for inserting user-defined code into UI framework *
+
+        Gets a range of options
+
+        Parameters:
+            start (int): Index of first option
+            stop (int): Index after last option
+
+        Returns:
+            list<str>: Options; a Future of them if fetched asynchronously
+        '''
+        return []
+
+
+    def find(self, text, index = -1, cycle = False):
+        '''
+        Finds an option that starts with, or else contains, the given text
+
+        Parameters:
+            text (str): Lowercase text
+            index (int): Index of the current option (Optional)
+            cycle (bool): Flag indicating that the text repeats a character;
+                unless an option starts with the text, the option after the
+                current one is found among options starting with the
+                character (Optional)
+
+        Returns:
+            int: Index of the found option; None if no option is found or
+                options cannot be searched, as by default, in which case
+                SelectField only searches the pages of options it fetched
+        '''
+        return None
+
+
+class OptionList(OptionSource):
+    '''
+    Enumerated input options held in memory
+
+    Attributes:
+        _options (list<str>): Options
+        _lower (list<str>): Lowercase options
+        _prefix_index (list<2-tuple>): Lowercase option (str) and option index
+            (int) of each option, sorted for finding options by prefix
+    '''
+    def __init__(self, options = ()):
+        '''
+        Parameters:
+            options (iterable<str>): _options attribute initializer (Optional)
+        '''
+        self._options = list(options)
+        self._lower = [option.lower() for option in self._options]
+        self._prefix_index = sorted(zip(self._lower, itertools.count()))
+
+
+    def __len__(self):
+        return len(self._options)
+
+
+    def fetch(self, start, stop):
+        return self._options[start:stop]
+
+
+    def find(self, text, index = -1, cycle = False):
+        entries = self._prefix_index
+        start, stop = self._prefix_range(text)
+
+        # Cycle through options starting with a repeated character, unless
+        # an option starts with the repeated text.
+        if cycle and start == stop:
+            text = text[0]
+            start, stop = self._prefix_range(text)
+            if start < stop and index >= 0 and self._lower[index].startswith(text):
+                current = (self._lower[index], index)
+                after = bisect.bisect_right(entries, current, start, stop)
+                return entries[after if after < stop else start][1]
+
+        # Find the first option starting with the text.
+        if start < stop:
+            return entries[start][1]
+
+        # Fall back to the next option containing the text.
+        options = self._lower
+        count = len(options)
+        for i in range(1, count + 1):
+            i = (index + i) % count
+            if text in options[i]:
+                return i
+        return None
+
+
+    def _prefix_range(self, text):
+        '''
+        Finds options starting with the given text; the sorted index holds
+        them in a contiguous range
+
+        Parameters:
+            text (str): Lowercase text
+
+        Returns:
+            2-tuple: Start (int) and stop (int) of the range within the
+                sorted index
+        '''
+        entries = self._prefix_index
+        start = bisect.bisect_left(entries, (text,))
+        stop = bisect.bisect_left(entries, (text + chr(sys.maxunicode),), start)
+        return start, stop
@@ -0,0 +1,677 @@
+# Filename: textbuffer.py
+# Creation Date: Fri 16 Oct 2026
+# Last Modified: Fri 16 Oct 2026
+
+
+import array
+import bisect
+import collections
+import itertools
+import mmap
+import os
+
+
+class PieceTable():
+    '''
+    Text buffer that describes its text as pieces of the original text and of
+    an append-only buffer of added text; edits near the previous edit take
+    constant time, and edits are logged for undo and redo
+
+    Attributes:
+        _original (str): Initial text
+        _added (list<str>): Added characters in the order they were added
+        _pieces (list<list>): Pieces of the text in order, formatted as
+            follows:
+                [is_added (bool), start (int), length (int)]
+        _length (int): Number of characters
+        _located (2-tuple): Index and offset of the most recently located
+            piece
+        _undo (list<list>): Edits formatted as follows:
+            [offset (int), removed text (str), inserted text (str)]
+        _redo (list<list>): Undone edits in the same format
+        _is_grouping (bool): Flag indicating that the next edit may be
+            grouped with the most recent edit
+        _text (str): Cached text; None after an edit
+        _lines (LineIndex): Offsets of lines
+    '''
+    @property
+    def lines(self):
+        ''' Getter for "lines" property '''
+        return self._lines
+
+
+    def __init__(self, text = ''):
+        '''
+        Parameters:
+            text (str): _original attribute initializer (Optional)
+        '''
+        self._original = text
+        self._added = []
+        self._pieces = [[False, 0, len(text)]] if text else []
+        self._length = len(text)
+        self._located = (0, 0)
+        self._undo = []
+        self._redo = []
+        self._is_grouping = False
+        self._text = text
+        self._lines = LineIndex(text)
+
+
+    def __len__(self):
+        return self._length
+
+
+    def __str__(self):
+        if self._text is None:
+            self._text = self.get(0, self._length)
+        return self._text
+
+
+    def get(self, start, stop):
+        '''
+        Gets a range of text
+
+        Parameters:
+            start (int): Offset of first character
+            stop (int): Offset after last character
+
+        Returns:
+            str: Text in range
+        '''
+        start = max(0, start)
+        stop = min(stop, self._length)
+        if self._text is not None:
+            return self._text[start:stop]
+
+        # Gather text from each piece in range.
+        original = self._original
+        added = self._added
+        pieces = self._pieces
+        chunks = []
+        i, offset = self._locate(start)
+        while start < stop:
+            is_added, piece_start, length = pieces[i]
+            head = start - offset
+            tail = min(length, stop - offset)
+            if is_added:
+                chunks.append(''.join(added[piece_start + head:piece_start + tail]))
+            else:
+                chunks.append(original[piece_start + head:piece_start + tail])
+            start = offset + tail
+            offset += length
+            i += 1
+        return ''.join(chunks)
+
+
+    def line(self, row):
+        '''
+        Gets a line of text
+
+        Parameters:
+            row (int): Line index
+
+        Returns:
+            str: Line of text, excluding its line break
+        '''
+        start = self._lines.start(row)
+        return self.get(start, start + self._lines.length(row))
+
+
+    def insert(self, offset, text):
+        '''
+        Inserts text, logging the edit
+
+        Parameters:
+            offset (int): Offset at which to insert
+            text (str): Text to insert
+        '''
+        if not text:
+            return
+        offset = max(0, min(offset, self._length))
+
+        # Group typed characters until the end of a word.
+        undo = self._undo
+        last = undo[-1] if undo and self._is_grouping else None
+        if (last
+            and len(text) == 1
+            and not last[1]
+            and last[0] + len(last[2]) == offset
+            and not last[2][-1].isspace()
+        ):
+            last[2] += text
+        else:
+            undo.append([offset, '', text])
+
+        self._redo.clear()
+        self._is_grouping = True
+        self._insert(offset, text)
+
+
+    def delete(self, start, stop):
+        '''
+        Deletes a range of text, logging the edit
+
+        Parameters:
+            start (int): Offset of first character
+            stop (int): Offset after last character
+        '''
+        removed = self.get(start, stop)
+        if not removed:
+            return
+        start = max(0, start)
+
+        # Group characters deleted backward until the start of a word.
+        undo = self._undo
+        last = undo[-1] if undo and self._is_grouping else None
+        if (last
+            and len(removed) == 1
+            and not last[2]
+            and last[0] == start + 1
+            and not last[1][0].isspace()
+        ):
+            last[0] = start
+            last[1] = removed + last[1]
+        else:
+            undo.append([start, removed, ''])
+
+        self._redo.clear()
+        self._is_grouping = True
+        self._delete(start, start + len(removed))
+
+
+    def undo(self):
+        '''
+        Reverts the most recent edit
+
+        Returns:
+            int: Offset after the restored text; None if there is nothing to
+                undo
+        '''
+        if not self._undo:
+            return None
+        edit = self._undo.pop()
+        offset, removed, inserted = edit
+        self._delete(offset, offset + len(inserted))
+        self._insert(offset, removed)
+        self._redo.append(edit)
+        self._is_grouping = False
+        return offset + len(removed)
+
+
+    def redo(self):
+        '''
+        Reapplies the most recently reverted edit
+
+        Returns:
+            int: Offset after the inserted text; None if there is nothing to
+                redo
+        '''
+        if not self._redo:
+            return None
+        edit = self._redo.pop()
+        offset, removed, inserted = edit
+        self._delete(offset, offset + len(removed))
+        self._insert(offset, inserted)
+        self._undo.append(edit)
+        self._is_grouping = False
+        return offset + len(inserted)
+
+
+    def _locate(self, offset):
+        '''
+        Finds the piece containing the given offset, starting from the most
+        recently located piece
+
+        Parameters:
+            offset (int): Offset of a character
+
+        Returns:
+            2-tuple: Index of the piece (int), which is the number of pieces
+                at the end of the text, and offset of the piece (int)
+        '''
+        pieces = self._pieces
+        i, start = self._located
+        while i > 0 and offset < start:
+            i -= 1
+            start -= pieces[i][2]
+        while i < len(pieces) and offset >= start + pieces[i][2]:
+            start += pieces[i][2]
+            i += 1
+        self._located = (i, start)
+        return i, start
+
+
+    def _insert(self, offset, text):
+        ''' Inserts text without logging the edit '''
+        if not text:
+            return
+        self._text = None
+        self._lines.insert(offset, text)
+        added = self._added
+        pieces = self._pieces
+        i, start = self._locate(offset)
+
+        # Extend the preceding piece if it ends the added text.
+        if offset == start and i > 0:
+            previous = pieces[i - 1]
+            if previous[0] and previous[1] + previous[2] == len(added):
+                self._located = (i - 1, start - previous[2])
+                previous[2] += len(text)
+                added.extend(text)
+                self._length += len(text)
+                return
+
+        piece = [True, len(added), len(text)]
+        added.extend(text)
+        self._length += len(text)
+
+        # Split the piece containing the offset around the inserted piece.
+        if offset > start:
+            is_added, piece_start, length = pieces[i]
+            head = offset - start
+            pieces[i:i + 1] = [
+                [is_added, piece_start, head],
+                piece,
+                [is_added, piece_start + head, length - head]
+            ]
+            self._located = (i + 1, offset)
+        else:
+            pieces.insert(i, piece)
+            self._located = (i, offset)
+
+
+    def _delete(self, start, stop):
+        ''' Deletes a range of text without logging the edit '''
+        stop = min(stop, self._length)
+        if start >= stop:
+            return
+        self._text = None
+        self._lines.delete(start, stop)
+        self._length -= stop - start
+        pieces = self._pieces
+        remaining = stop - start
+        i, offset = self._locate(start)
+        while remaining:
+            piece = pieces[i]
+            head = start - offset
+
+            # Split a piece that contains the whole range.
+            if head and head + remaining < piece[2]:
+                tail = head + remaining
+                pieces.insert(i + 1, [piece[0], piece[1] + tail, piece[2] - tail])
+                piece[2] = head
+                remaining = 0
+
+            # Cut the end of a piece.
+            elif head:
+                remaining -= piece[2] - head
+                piece[2] = head
+                offset = start
+                i += 1
+
+            # Cut the start of a piece.
+            elif remaining < piece[2]:
+                piece[1] += remaining
+                piece[2] -= remaining
+                remaining = 0
+
+            # Remove a piece.
+            else:
+                remaining -= piece[2]
+                del pieces[i]
+        self._located = (i, offset)
+
+
+class LineIndex():
+    '''
+    Index of the offsets at which lines of text start, updated as the text is
+    edited; shifts of the lines after an edit are applied lazily, so that
+    consecutive edits to nearby lines take time in proportion to the distance
+    between them
+
+    Attributes:
+        _starts (list<int>): Offset of each line, excluding any pending shift
+        _shift_row (int): Index of the first line that a pending shift applies
+            to
+        _shift (int): Pending shift of the offsets of lines from _shift_row on
+        _length (int): Number of characters
+        _lengths (collections.Counter): Number of lines of each length
+        _widest (int): Length of the longest line; None until calculated
+    '''
+    def __init__(self, text = ''):
+        '''
+        Parameters:
+            text (str): Text to index (Optional)
+        '''
+        lengths = [len(line) for line in text.split('\n')]
+        self._starts = list(itertools.accumulate(
+            (length + 1 for length in lengths[:-1]), initial = 0
+        ))
+        self._shift_row = len(self._starts)
+        self._shift = 0
+        self._length = len(text)
+        self._lengths = collections.Counter(lengths)
+        self._widest = None
+
+
+    def __len__(self):
+        return len(self._starts)
+
+
+    def start(self, row):
+        '''
+        Gets the offset of the given line
+
+        Parameters:
+            row (int): Line index
+
+        Returns:
+            int: Offset of the first character of the line
+        '''
+        start = self._starts[row]
+        return start + self._shift if row >= self._shift_row else start
+
+
+    def length(self, row):
+        '''
+        Gets the length of the given line, excluding its line break
+
+        Parameters:
+            row (int): Line index
+
+        Returns:
+            int: Number of characters
+        '''
+        stop = self.start(row + 1) - 1 if row + 1 < len(self._starts) else self._length
+        return stop - self.start(row)
+
+
+    def ensure(self, rows):
+        '''
+        Indexes at least the given number of lines, if the text has them;
+        every line is always indexed
+
+        Parameters:
+            rows (int): Number of lines
+        '''
+        pass
+
+
+    def widest(self):
+        ''' Gets the length of the longest line '''
+        if self._widest is None:
+            self._widest = max(self._lengths)
+        return self._widest
+
+
+    def row(self, offset):
+        '''
+        Finds the line containing the given offset
+
+        Parameters:
+            offset (int): Offset of a character
+
+        Returns:
+            int: Line index
+        '''
+        starts = self._starts
+        shift_row = self._shift_row
+        if shift_row < len(starts) and offset >= starts[shift_row] + self._shift:
+            return bisect.bisect_right(starts, offset - self._shift, shift_row) - 1
+        return bisect.bisect_right(starts, offset, 0, shift_row) - 1
+
+
+    def split_offset(self, offset):
+        '''
+        Calculates 2-dimensional offsets from a linear offset
+
+        Parameters:
+            offset (int): Linear offset value
+
+        Returns:
+            2-tuple: horizontal offset (int), vertical offset (int)
+        '''
+        offset = max(0, min(offset, self._length))
+        row = self.row(offset)
+        return offset - self.start(row), row
+
+
+    def join_offsets(self, col_offset, row_offset):
+        '''
+        Calculates a linear offset from 2-dimensional offsets, clamped to the
+        text
+
+        Parameters:
+            col_offset (int): Horizontal offset value
+            row_offset (int): Vertical offset value
+
+        Returns:
+            int: Linear offset value
+        '''
+        row = max(0, min(row_offset, len(self._starts) - 1))
+        return self.start(row) + max(0, min(col_offset, self.length(row)))
+
+
+    def insert(self, offset, text):
+        '''
+        Updates this index for text inserted at the given offset
+
+        Parameters:
+            offset (int): Offset of inserted text
+            text (str): Inserted text
+        '''
+        row = self.row(offset)
+        start = self.start(row)
+        length = self.length(row)
+        parts = text.split('\n')
+
+        # Shift the lines after the edited line.
+        self._length += len(text)
+        self._shift_lines(row + 1, len(text))
+
+        # Split the edited line at each inserted line break.
+        head = offset - start
+        tail = length - head
+        lengths = [len(part) for part in parts]
+        lengths[0] += head
+        lengths[-1] += tail
+        starts = itertools.accumulate((length + 1 for length in lengths[:-1]), initial = start)
+        next(starts)
+        self._insert_lines(row + 1, list(starts))
+        self._update_lengths([length], lengths)
+
+
+    def delete(self, start, stop):
+        '''
+        Updates this index for text deleted from the given range
+
+        Parameters:
+            start (int): Offset of first deleted character
+            stop (int): Offset after last deleted character
+        '''
+        first = self.row(start)
+        last = self.row(stop)
+        lengths = [self.length(row) for row in range(first, last + 1)]
+        length = (start - self.start(first)) + (self.start(last) + lengths[-1] - stop)
+
+        # Join the edited lines, and shift the lines after them.
+        self._delete_lines(first + 1, last + 1)
+        self._length -= stop - start
+        self._shift_lines(first + 1, start - stop)
+        self._update_lengths(lengths, [length])
+
+
+    def _shift_lines(self, row, delta):
+        '''
+        Shifts the offsets of lines from the given line on, applying the
+        pending shift to the lines between the given line and those it
+        applies to
+
+        Parameters:
+            row (int): Index of first line to shift
+            delta (int): Change in offset
+        '''
+        if not delta:
+            return
+        starts = self._starts
+        shift_row = self._shift_row
+        shift = self._shift
+        if not shift:
+            self._shift_row = row
+        elif row >= shift_row:
+            starts[shift_row:row] = [start + shift for start in starts[shift_row:row]]
+            self._shift_row = row
+        else:
+            starts[row:shift_row] = [start + delta for start in starts[row:shift_row]]
+        self._shift = shift + delta
+
+
+    def _insert_lines(self, row, starts):
+        ''' Inserts the offsets of lines before the given line '''
+        if not starts:
+            return
+        if row >= self._shift_row:
+            starts = [start - self._shift for start in starts]
+        else:
+            self._shift_row += len(starts)
+        self._starts[row:row] = starts
+
+
+    def _delete_lines(self, start, stop):
+        ''' Deletes the offsets of lines in the given range '''
+        if start >= stop:
+            return
+        if stop <= self._shift_row:
+            self._shift_row -= stop - start
+        elif start < self._shift_row:
+            self._starts[start:self._shift_row] = [
+                offset + self._shift for offset in self._starts[start:self._shift_row]
+            ]
+            self._shift_row = start
+        del self._starts[start:stop]
+
+
+    def _update_lengths(self, old_lengths, new_lengths):
+        ''' Replaces line lengths in the histogram of line lengths '''
+        counts = self._lengths
+        for length in old_lengths:
+            counts[length] -= 1
+            if not counts[length]:
+                del counts[length]
+                if length == self._widest:
+                    self._widest = None
+        counts.update(new_lengths)
+        if self._widest is not None:
+            self._widest = max(self._widest, max(new_lengths))
+
+
+class MappedText():
+    '''
+    Read-only text of a file that is mapped into memory rather than read;
+    lines are indexed as they are first needed, and only decoded when they
+    are fetched; serves as its own line index
+
+    Attributes:
+        _file (file): Binary file
+        _map (mmap.mmap): Memory map of the file; None if the file is empty
+        _size (int): Size (bytes) of the file
+        _encoding (str): Text encoding of the file
+        _starts (array): Offset (bytes) of each indexed line
+        _next (int): Offset (bytes) of the first line that is not indexed;
+            exceeds the size of the file once every line is indexed
+        _widest (int): Length of the longest indexed line
+    '''
+    @property
+    def lines(self):
+        ''' Getter for "lines" property '''
+        return self
+
+
+    def __init__(self, path, encoding = 'utf-8'):
+        '''
+        Parameters:
+            path (str): Path of the file
+            encoding (str): _encoding attribute initializer (Optional)
+        '''
+        # Leave nothing to release if the file cannot be opened.
+        self._file = self._map = None
+        self._file = open(path, 'rb')
+        try:
+            self._size = size = os.fstat(self._file.fileno()).st_size
+            if size:
+                self._map = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+        except Exception:
+            self.close()
+            raise
+        self._encoding = encoding
+        self._starts = array.array('Q')
+        self._next = 0
+        self._widest = 0
+
+
+    def __del__(self):
+        self.close()
+
+
+    def __len__(self):
+        return len(self._starts)
+
+
+    def __str__(self):
+        return self._decode(0, self._size)
+
+
+    def close(self):
+        ''' Releases the memory map and the file '''
+        if self._map:
+            self._map.close()
+            self._map = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+    def ensure(self, rows):
+        '''
+        Indexes at least the given number of lines, if the file has them
+
+        Parameters:
+            rows (int): Number of lines
+        '''
+        starts = self._starts
+        data = self._map
+        size = self._size
+        while len(starts) < rows and self._next <= size:
+            start = self._next
+            stop = data.find(b'\n', start) if data else -1
+            stop = size if stop < 0 else stop
+            starts.append(start)
+            self._next = stop + 1
+            self._widest = max(self._widest, len(self.line(len(starts) - 1)))
+
+
+    def widest(self):
+        ''' Gets the length of the longest indexed line '''
+        return self._widest
+
+
+    def line(self, row):
+        '''
+        Gets an indexed line of text
+
+        Parameters:
+            row (int): Line index
+
+        Returns:
+            str: Line of text, excluding its line break
+        '''
+        starts = self._starts
+        stop = starts[row + 1] if row + 1 < len(starts) else self._next
+        return self._decode(starts[row], stop - 1).rstrip('\r')
+
+
+    def _decode(self, start, stop):
+        ''' Decodes a range of bytes of the file '''
+        if not self._map:
+            return ''
+        return self._map[start:stop].decode(self._encoding, 'replace')
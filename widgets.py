@@ -4,12 +4,20 @@
 # Author: Brett Fedack
 
 
+import bisect
 import math
 import curses
 import curses.ascii as ascii
+import itertools
+import time
 import weakref
 from . import signals
 from .core import Widget, ContentWidget, Group
+from .sources import (
+    ArraySource, ListSource, OptionList, OptionSource, SpillSource, ViewSource
+)
+from .search import IncrementalSearch, fold_case
+from .textbuffer import MappedText, PieceTable
 
 
 class Button(ContentWidget):
@@ -118,10 +126,12 @@ class StatusLine(ContentWidget):
         else:
             text = self._status
 
-        # Tag for redraw in order to animate the scroll.
+        # Animate the scroll one character per frame while text overflows.
         effective_width = width - margin[0] - margin[1]
         if len(text) > effective_width:
-            self.tag_redraw()
+            self.animate(rate = 5)
+        else:
+            self.deanimate()
 
         # Draw status line text content.
         self.draw_text(text, row = 1, margin = margin, fit = 'AUTO_SCROLL', attr = attr)
@@ -585,6 +595,205 @@ class Labeled(ContentWidget):
         self._links.append(ref)
 
 
+class Searchable(Labeled):
+    '''
+    Class of labeled widgets whose content can be searched incrementally;
+    subclasses implement the _search_scan, _search_test, _search_key, and
+    _show_match methods
+
+    Attributes:
+        _search (IncrementalSearch): Search underway; None if not searching
+        _search_origin: Match key at which the search started
+        _search_match: Match key of the current match; None if there is none
+        _search_state: State of the content when it was last searched
+        _search_overrides_esc (bool): Value of the _overrides_esc attribute
+            before the search started
+    '''
+    def __init__(self, label, parent, focus_key = None):
+        # Initialize inherited state.
+        super().__init__(label, parent, focus_key)
+
+        # Initialize attributes.
+        self._search = None
+        self._search_origin = None
+        self._search_match = None
+        self._search_state = None
+        self._search_overrides_esc = False
+
+
+    def report(self):
+        return {'usage': 'Type text to find. Enter/^N: Next, ^P: Previous, Esc: Done'}
+
+
+    def _operate_search(self, c):
+        '''
+        Starts a search upon Ctrl-F, and operates the search underway, if any
+
+        Parameters:
+            c (int): Character code for user input
+
+        Returns:
+            bool: True if the given input is consumed; False otherwise
+        '''
+        search = self._search
+        if search is None:
+            if c == ascii.ctrl(ord('f')) and self._is_searchable():
+                self.tag_redraw()
+                self._search = IncrementalSearch(self._search_scan, self._search_test)
+                self._search_origin = self._search_key()
+                self._search_match = None
+                self._search_state = self._get_search_state()
+                self._search_overrides_esc = self._overrides_esc
+                self._overrides_esc = True
+                return True
+            return False
+
+        # Find matches again if the content changed.
+        state = self._get_search_state()
+        if state != self._search_state:
+            self._search_state = state
+            search.refresh()
+
+        key = self._search_match
+        if key is None:
+            key = self._search_origin
+
+        # Extend the pattern, narrowing the matches.
+        if ascii.isprint(c):
+            search.push(chr(c))
+            match = search.first(self._search_origin)
+
+        # Shorten the pattern, or end the search once it is empty.
+        elif c in {ascii.BS, ascii.DEL, curses.KEY_BACKSPACE}:
+            if not search.pattern:
+                self._stop_search()
+                return True
+            search.pop()
+            match = search.first(self._search_origin) if search.pattern else None
+
+        # Find the next match.
+        elif c in {
+            curses.KEY_ENTER, ascii.LF, ascii.CR, ascii.ctrl(ord('f')), ascii.ctrl(ord('n'))
+        }:
+            match = search.next(key)
+
+        # Find the previous match.
+        elif c == ascii.ctrl(ord('p')):
+            match = search.previous(key)
+
+        # End the search, passing on any other input.
+        else:
+            self._stop_search()
+            return c == ascii.ESC
+
+        self.tag_redraw()
+        self._search_match = match
+        if match is not None:
+            self._show_match(match)
+        return True
+
+
+    def _stop_search(self):
+        ''' Ends the search underway, if any '''
+        if self._search:
+            self.tag_redraw()
+            self._search = None
+            self._search_match = None
+            self._overrides_esc = self._search_overrides_esc
+
+
+    def _draw_search(self):
+        ''' Draws the pattern and match count of the search underway, if any '''
+        search = self._search
+        if not search:
+            return
+        width, height = self.get_size()
+        matches = search.matches if search.pattern else []
+        position = None
+        if self._search_match is not None:
+            position = search.position(self._search_match)
+        text = ' Find: {} ({}/{}) '.format(
+            search.pattern,
+            0 if position is None else position + 1,
+            len(matches)
+        )
+        self.draw_text(
+            text, row = height - 1, margin = (2, 2, 0, 0), attr = self.style('text')
+        )
+
+
+    def _match_styles(self):
+        '''
+        Gets the style attributes of matches
+
+        Returns:
+            2-tuple: Style attribute (int) of matches, and of the current
+                match (int)
+        '''
+        return (
+            self.style('match') or curses.A_REVERSE,
+            self.style('current_match') or curses.A_REVERSE | curses.A_BOLD
+        )
+
+
+    def _is_searchable(self):
+        ''' Determines if the content of this widget can be searched '''
+        return True
+
+
+    def _get_search_state(self):
+        ''' Gets the state of the content, which changes when it is edited '''
+        return None
+
+
+    def _search_scan(self, pattern):
+        '''
+        * Abstract method for finding matches *
+
+        Parameters:
+            pattern (str): Pattern lowercased by fold_case
+
+        Returns:
+            list: Keys of every match in sorted order
+        '''
+        return []
+
+
+    def _search_test(self, key, pattern):
+        '''
+        * Abstract method for testing a match of a shorter pattern *
+
+        Parameters:
+            key: Match key
+            pattern (str): Pattern lowercased by fold_case
+
+        Returns:
+            bool: True if the match also matches the given pattern; False
+                otherwise
+        '''
+        return False
+
+
+    def _search_key(self):
+        '''
+        * Abstract method for locating the start of a search *
+
+        Returns:
+            Match key at which to start searching
+        '''
+        return None
+
+
+    def _show_match(self, key):
+        '''
+        * Abstract method for scrolling a match into view *
+
+        Parameters:
+            key: Match key
+        '''
+        return
+
+
 class FlipSwitch(Labeled):
     '''
     Boolean state widget
@@ -805,53 +1014,104 @@ class NavList(Labeled):
             Widget.input_focus = page_list[page_idx]
 
 
-class TextBox(Labeled):
+class TextBox(Searchable):
     '''
     Multi-line text input/display widget
 
     Parameters:
+        _buffer (PieceTable): Text content, along with its edit history; a
+            MappedText when viewing a file
         _text (str): Text content
         _cursor_offset: Position of cursor relative to beginning of the text
         _col_scroll (int): Index corresponding to left of viewable region
         _row_scroll (int): Index corresponding to top of viewable region
         _read_only (bool): Flag controlling ability to edit this widget
+        _editable_state (2-tuple): Read-only flag (bool) and downward
+            navigation override flag (bool) from before viewing a file,
+            restored once the file is cleared; None unless viewing a file
     '''
+    @property
+    def _text(self):
+        ''' Getter for "_text" property '''
+        return str(self._buffer)
+
+
+    @_text.setter
+    def _text(self, text):
+        ''' Setter for "_text" property '''
+        # Replace the text content, discarding its edit history.
+        self._buffer = PieceTable(text)
+
+
     def __init__(self, label, parent, focus_key = None):
         # Initialize inherited state.
         super().__init__(label, parent, focus_key)
         self._overrides_enter = True
 
         # Initialize attributes.
-        self._text = ''
+        self._buffer = PieceTable()
         self._cursor_offset = 0
         self._col_scroll = 0
         self._row_scroll = 0
         self._read_only = False
+        self._editable_state = None
 
 
     def clear(self, **kwargs):
-        self._text = ''
+        self._stop_search()
+
+        # Release a viewed file, and restore the mode from before viewing it.
+        if isinstance(self._buffer, MappedText):
+            self._buffer.close()
+        if self._editable_state:
+            self._read_only, self._overrides_enter = self._editable_state
+            self._editable_state = None
+
+        self._buffer = PieceTable()
         self._cursor_offset = 0
         self._col_scroll = 0
         self._row_scroll = 0
 
 
     def report(self):
+        if self._search:
+            return super().report()
         usage = 'Up/Down/Left/Right: Move Cursor'
         if not self._read_only:
-            usage = 'Type text input. Up/Down/Left/Right: Move Cursor'
+            usage = (
+                'Type text input. Up/Down/Left/Right: Move Cursor, '
+                '^U/^R: Undo/Redo, ^F: Find'
+            )
+        elif self._is_searchable():
+            usage = 'Up/Down/Left/Right: Scroll, ^F: Find'
         else:
             usage = 'Up/Down/Left/Right: Scroll'
         return {'usage': usage}
 
 
     def compose(self):
-        return (not self._read_only and self._text != '', {'text': self._text})
+        # Leave the text of read-only boxes alone, since decoding a viewed
+        # file would read all of it.
+        if self._read_only:
+            return (False, {})
+        return (self._text != '', {'text': self._text})
 
 
-    def decompose(self, text, **kwargs):
+    def decompose(self, text = '', path = None, **kwargs):
+        '''
+        Parameters:
+            text (str): Text content (Optional)
+            path (str): Path of a file to view instead; see the open method
+                (Optional)
+        '''
+        if path is not None:
+            self.open(path)
+            return
+
         self.clear()
-        self._text = text
+
+        # Break lines at line feeds only.
+        self._text = text.replace('\r\n', '\n').replace('\r', '\n')
 
 
     def draw(self):
@@ -859,7 +1119,8 @@ class TextBox(Labeled):
         width, height = self.get_size()
         effective_width = width - margin[0] - margin[1]
         effective_height = height - margin[2] - margin[3]
-        text = self._text
+        buffer = self._buffer
+        lines = buffer.lines
         offset = self._cursor_offset
         col_scroll = self._col_scroll
         row_scroll = self._row_scroll
@@ -867,12 +1128,32 @@ class TextBox(Labeled):
         # Draw border around the text box.
         self.draw_border(offset_right = 1)
 
-        # Draw lines of text.
-        line_list = self._build_line_list()
-        for i in range(min(len(line_list[row_scroll:]), effective_height)):
-            line = line_list[i + row_scroll]
+        # Draw the visible lines of text, indexing one line past them to
+        # tell if there is content below.
+        lines.ensure(row_scroll + effective_height + 1)
+        for i in range(max(0, min(len(lines) - row_scroll, effective_height))):
+            line = buffer.line(i + row_scroll)
             self.draw_text(line[col_scroll:], row = i + margin[2], margin = margin, fit = 'NO_WRAP')
 
+        # Highlight visible matches of the search underway, if any.
+        search = self._search
+        if search and search.pattern and row_scroll < len(lines):
+            match_attr, current_attr = self._match_styles()
+            last_row = min(len(lines), row_scroll + effective_height) - 1
+            stop = lines.start(last_row) + lines.length(last_row)
+            matches = search.matches
+            for i in range(bisect.bisect_left(matches, lines.start(row_scroll)), len(matches)):
+                match = matches[i]
+                if match > stop:
+                    break
+                col_offset, row_offset = lines.split_offset(match)
+                attr = current_attr if match == self._search_match else match_attr
+                self.draw_highlight(
+                    col_offset + margin[0] - col_scroll,
+                    row_offset + margin[2] - row_scroll,
+                    len(search.pattern), attr, margin = margin
+                )
+
         # Draw the cursor.
         if not self._read_only:
             col_offset, row_offset = self._split_offset(offset)
@@ -889,7 +1170,7 @@ class TextBox(Labeled):
             self.draw_text(left_arrow, row = center_row, align = 'LEFT', attr = attr)
 
         # Indicate content after.
-        num_cols = max([len(i) for i in text.splitlines() or [text]])
+        num_cols = lines.widest()
         if col_scroll < num_cols - effective_width:
             right_arrow = u'\u25B6'
             self.draw_text(right_arrow, row = center_row, margin = (width - 2, 0, 0, 0), attr = attr)
@@ -900,25 +1181,31 @@ class TextBox(Labeled):
             self.draw_text(up_arrow, padding = padding, align = 'CENTER', attr = attr)
 
         # Indicate content below.
-        num_rows = len(line_list)
+        num_rows = len(lines)
         if row_scroll < num_rows - effective_height:
             down_arrow = u'\u25BC'
             self.draw_text(down_arrow, row = height - 1, padding = padding, align = 'CENTER', attr = attr)
 
+        self._draw_search()
+
 
     def operate(self, c):
+        # Find text.
+        if self._operate_search(c):
+            return 'CONTINUE'
+
         margin = [2, 3, 1, 1]
         width, height = self.get_size()
         effective_width = width - margin[0] - margin[1]
         effective_height = height - margin[2] - margin[3]
-        text = self._text
+        buffer = self._buffer
         offset = self._cursor_offset
-        col_offset, row_offset = self._split_offset(self._cursor_offset)
         col_scroll = self._col_scroll
         row_scroll = self._row_scroll
 
         # Enforce read-only constraint.
         if not self._read_only:
+            col_offset, row_offset = self._split_offset(self._cursor_offset)
 
             # Add a character.
             if (ascii.isprint(c)
@@ -926,8 +1213,9 @@ class TextBox(Labeled):
             ):
                 self.tag_redraw()
 
-                # Insert character before the cursor.
-                self._text = text[:offset] + chr(c) + text[offset:]
+                # Insert character before the cursor; line breaks are
+                # always stored as line feeds.
+                buffer.insert(offset, '\n' if c in {curses.KEY_ENTER, ascii.CR} else chr(c))
 
                 # Update offset of the cursor.
                 self._cursor_offset += 1
@@ -939,16 +1227,27 @@ class TextBox(Labeled):
                 self.tag_redraw()
 
                 # Delete character preceding the cursor.
-                self._text = text[:offset - 1] + text[offset:]
+                buffer.delete(offset - 1, offset)
 
                 # Update offset of the cursor.
                 self._cursor_offset -= 1
 
+            # Undo or redo an edit, placing the cursor after the changed
+            # text.
+            elif c in {ascii.ctrl(ord('u')), ascii.ctrl(ord('r'))}:
+                if c == ascii.ctrl(ord('u')):
+                    new_offset = buffer.undo()
+                else:
+                    new_offset = buffer.redo()
+                if new_offset is not None:
+                    self.tag_redraw()
+                    self._cursor_offset = new_offset
+
             # Move cursor left unless start of either text or line is
             # encountered.
             if (c == curses.KEY_LEFT
                 and offset > 0
-                and ord(text[offset - 1]) not in {
+                and ord(buffer.get(offset - 1, offset)) not in {
                     curses.KEY_ENTER, ascii.LF, ascii.CR
                 }
             ):
@@ -958,8 +1257,8 @@ class TextBox(Labeled):
             # Move cursor right unless end of either text or line is
             # encountered.
             elif (c == curses.KEY_RIGHT
-                  and offset < len(text)
-                  and ord(text[offset]) not in {
+                  and offset < len(buffer)
+                  and ord(buffer.get(offset, offset + 1)) not in {
                       curses.KEY_ENTER, ascii.LF, ascii.CR
                 }
             ):
@@ -978,21 +1277,12 @@ class TextBox(Labeled):
 
 
             # Scroll if necessary.
-            col_offset, row_offset = self._split_offset(self._cursor_offset)
-            if col_offset < col_scroll:
-                self._col_scroll = col_offset
-            elif col_offset > col_scroll + effective_width - 1:
-                self._col_scroll += col_offset - (col_scroll + effective_width - 1)
-                self._col_scroll = col_offset - (effective_width - 1)
-            if row_offset < row_scroll:
-                self._row_scroll = row_offset
-            elif row_offset > row_scroll + effective_height - 1:
-                self._row_scroll = row_offset - (effective_height - 1)
+            self._scroll_to(*self._split_offset(self._cursor_offset))
 
         else: # Read-only mode
-            line_list = self._build_line_list()
-            num_cols = max([len(i) for i in line_list])
-            num_rows = len(line_list)
+            buffer.lines.ensure(row_scroll + effective_height + 1)
+            num_cols = buffer.lines.widest()
+            num_rows = len(buffer.lines)
             scroll_sensitivity = 1
 
             # Scroll left.
@@ -1024,6 +1314,35 @@ class TextBox(Labeled):
         return 'CONTINUE'
 
 
+    def open(self, path, encoding = 'utf-8'):
+        '''
+        Views the file at the given path in read-only mode until cleared;
+        the file is mapped into memory rather than read, and only visible
+        lines are decoded; files that cannot be opened are reported
+
+        Parameters:
+            path (str): Path of the file
+            encoding (str): Text encoding of the file (Optional)
+
+        Returns:
+            bool: True if the file is opened; False otherwise
+        '''
+        # Report files that cannot be opened, keeping the current content.
+        try:
+            buffer = MappedText(path, encoding)
+        except OSError as e:
+            signal = signals.Signal('UI_FEEDBACK', message = str(e), error = True)
+            self.bubble(**signal.data)
+            return False
+
+        self.tag_redraw()
+        self.clear()
+        self._editable_state = (self._read_only, self._overrides_enter)
+        self.read_only()
+        self._buffer = buffer
+        return True
+
+
     def read_only(self):
         ''' Prevents editing of this widget '''
         self._read_only = True
@@ -1032,25 +1351,66 @@ class TextBox(Labeled):
         self._overrides_enter = False
 
 
-    def _build_line_list(self, strip = False):
+    def _scroll_to(self, col_offset, row_offset):
         '''
-        Builds lines of text from the string of text content
+        Scrolls the given position into view
 
         Parameters:
-            strip (bool): Flag controlling removal of trailing, blank lines
-
-        Returns:
-            list<str>: Lines of text
+            col_offset (int): Horizontal offset value
+            row_offset (int): Vertical offset value
         '''
-        # Build line list from text content.
-        line_list = self._text.splitlines() or [self._text]
+        margin = [2, 3, 1, 1]
+        width, height = self.get_size()
+        effective_width = width - margin[0] - margin[1]
+        effective_height = height - margin[2] - margin[3]
+        col_scroll = self._col_scroll
+        row_scroll = self._row_scroll
+
+        if col_offset < col_scroll:
+            self._col_scroll = col_offset
+        elif col_offset > col_scroll + effective_width - 1:
+            self._col_scroll = col_offset - (effective_width - 1)
+        if row_offset < row_scroll:
+            self._row_scroll = row_offset
+        elif row_offset > row_scroll + effective_height - 1:
+            self._row_scroll = row_offset - (effective_height - 1)
+
+
+    def _is_searchable(self):
+        # Mapped files are too large to search.
+        return not isinstance(self._buffer, MappedText)
+
+
+    def _search_scan(self, pattern):
+        # Lowercase without changing the length, so offsets match the buffer.
+        text = fold_case(str(self._buffer))
+        matches = []
+        i = text.find(pattern)
+        while i >= 0:
+            matches.append(i)
+            i = text.find(pattern, i + 1)
+        return matches
 
-        # Remove any trailing blank lines.
-        if strip:
-            while len(line_list) > 1 and line_list[-1].strip() == '':
-                line_list.pop()
 
-        return line_list
+    def _search_test(self, offset, pattern):
+        return fold_case(self._buffer.get(offset, offset + len(pattern))) == pattern
+
+
+    def _search_key(self):
+        # Search from the cursor, or from the top of the viewable region.
+        if self._read_only:
+            return self._buffer.lines.start(self._row_scroll)
+        return self._cursor_offset
+
+
+    def _show_match(self, offset):
+        col_offset, row_offset = self._split_offset(offset)
+        if not self._read_only:
+            self._cursor_offset = offset
+
+        # Scroll the end, then the start, of the match into view.
+        self._scroll_to(col_offset + len(self._search.pattern), row_offset)
+        self._scroll_to(col_offset, row_offset)
 
 
     def _join_offsets(self, col_offset, row_offset):
@@ -1064,13 +1424,7 @@ class TextBox(Labeled):
         Returns:
             int: Linear offset value
         '''
-        offset = 0
-        line_list = self._build_line_list()
-        row_offset = max(0, min(row_offset, len(line_list) - 1))
-        for line in line_list[:row_offset]:
-            offset += len(line) + 1
-        offset += min(col_offset, len(line_list[row_offset]))
-        return offset
+        return self._buffer.lines.join_offsets(col_offset, row_offset)
 
 
     def _split_offset(self, offset):
@@ -1083,16 +1437,7 @@ class TextBox(Labeled):
         Returns:
             2-tuple: horizontal offset (int), vertical offset (int)
         '''
-        col = max(0, offset)
-        row = 0
-        line_list = self._build_line_list()
-        for line in line_list:
-            line_len = len(line) if line else 0
-            if line_len >= col:
-                break;
-            row += 1
-            col -= line_len + 1
-        return col, row
+        return self._buffer.lines.split_offset(offset)
 
 
 class NumericField(Labeled):
@@ -1233,49 +1578,82 @@ class SelectField(Labeled):
     Enumerated input widget
 
     Attributes:
-        _options (list<str>): Enumerated input options
+        _source (OptionSource): Enumerated input options, which follow the
+            option for no selection
+        _count (int): Number of options, including the option for no
+            selection
+        _pages (dict<int, list<str>>): Fetched pages of options by page
+            index, ordered from least to most recently used
+        _pending (set<int>): Indices of pages being fetched asynchronously
+        _page_size (int): Number of options per page
+        _page_limit (int): Maximum number of pages to keep
+        _generation (int): Number of loaded option sources, which identifies
+            pages of replaced sources that are fetched late
         _options_limit (int): Maximum number of options to display
         _highlight (int): Highlighted index in list of options
         _init_highlight (int): Highlight index at the time of gaining focus
         _row_scroll (int): Index corresponding to top of viewable region
         _expanded (bool): Flag indicating if options list is expanded/collapsed
-        _overlayed (bool): Flag indicating if expanded options list has been
-            drawn over siblings
         _auto_expand (bool): Flag controlling automated expansion of options
+        _typeahead (str): Lowercase text typed to find an option
+        _typeahead_time (float): Time (sec) at which text was last typed
+        _typeahead_timeout (float): Time (sec) after which typed text is
+            discarded
     '''
     def __init__(self, label, parent, focus_key = None):
         # Initialize inherited state.
         super().__init__(label, parent, focus_key)
 
         # Initialize attributes.
-        self._options = ['-- NO SELECTION --']
+        self._source = OptionList()
+        self._count = 1
+        self._pages = {}
+        self._pending = set()
+        self._page_size = 64
+        self._page_limit = 16
+        self._generation = 0
         self._options_limit = -1
         self._highlight = 0
         self._init_highlight = 0
         self._row_scroll = 0
         self._auto_expand = False
+        self._typeahead = ''
+        self._typeahead_time = 0
+        self._typeahead_timeout = 1.0
         self.collapse()
 
 
     def clear(self, **kwargs):
-        self._options = ['-- NO SELECTION --']
         self._highlight = 0
+        self.load_options(())
 
 
     def report(self):
-        return {'usage': 'Up/Down:Scroll, Enter:Select'}
+        return {'usage': 'Up/Down:Scroll, Type:Find, Enter:Select'}
 
 
     def compose(self):
         highlight = self._highlight
-        option = self._options[highlight]
+        option = self._option(highlight) if highlight > 0 else None
         selection_changed = highlight != self._init_highlight
-        return (selection_changed, {'option': option if highlight > 0 else None})
+        data = {'option': option}
+
+        # Distinguish an option whose page is being fetched from no selection.
+        if highlight > 0 and option is None:
+            data['pending'] = True
+        return (selection_changed, data)
 
 
     def decompose(self, options, **kwargs):
+        # Keep pages fetched from the same option source.
+        if options is self._source:
+            self._count = len(options) + 1
+            self._highlight = min(self._highlight, self._count - 1)
+            self.tag_redraw()
+
         # Load options and update draw state.
-        self.load_options(options)
+        else:
+            self.load_options(options)
         if self._expanded:
             self.expand()
 
@@ -1305,9 +1683,10 @@ class SelectField(Labeled):
 
         # Draw the list of options.
         row_scroll = self._row_scroll
-        options_section = self._options[row_scroll:][:height - 2]
-        for i in range(len(options_section)):
-            option = options_section[i]
+        for i in range(min(height - 2, self._count - row_scroll)):
+            option = self._option(i + row_scroll)
+            if option is None:
+                option = '...'
 
             # Format and style option.
             expand = 'AROUND' if not i + row_scroll else 'RIGHT'
@@ -1331,41 +1710,38 @@ class SelectField(Labeled):
 
             # Indicate content below.
             down_arrow = u'\u25BC'
-            if self._row_scroll + height - 2 < len(self._options):
+            if self._row_scroll + height - 2 < self._count:
                 self.draw_text(down_arrow, row = height - 1, padding = padding, align = 'CENTER', attr = attr)
 
 
     def operate(self, c):
-        margin = [1, 1, 1, 1]
-
-        # Draw expanded options list over siblings.
-        if self._expanded and not self._overlayed:
-            self.tag_redraw()
-            self._overlayed = True
-
         if c in {curses.KEY_DOWN, curses.KEY_UP, curses.KEY_ENTER, ascii.LF, ascii.CR}:
             self.tag_redraw()
 
             # Highlight the next option, wrapping if necessary.
             if c == curses.KEY_DOWN:
                 self._highlight += 1
-                self._highlight %= len(self._options)
+                self._highlight %= self._count
 
             # Highlight the previous option, wrapping if necessary.
             elif c == curses.KEY_UP:
                 self._highlight -= 1
-                self._highlight %= len(self._options)
+                self._highlight %= self._count
 
             # Select the highlighted option.
             elif c in {curses.KEY_ENTER, ascii.LF, ascii.CR}:
                 return 'END'
 
-            # Scroll list if necessary.
-            effective_height = self.get_size()[1] - margin[2] - margin[3]
-            if self._highlight < self._row_scroll:
-                self._row_scroll = self._highlight
-            elif self._highlight >= self._row_scroll + effective_height:
-                self._row_scroll = self._highlight - effective_height + 1
+            self._scroll_to_highlight()
+
+        # Highlight an option that starts with, or else contains, the typed
+        # text.
+        elif ascii.isprint(c):
+            index = self._find_option(chr(c).lower())
+            if index is not None and index != self._highlight:
+                self.tag_redraw()
+                self._highlight = index
+                self._scroll_to_highlight()
 
         return 'CONTINUE'
 
@@ -1377,18 +1753,16 @@ class SelectField(Labeled):
 
     def collapse(self):
         ''' Collapses the options list to display only a single option '''
-        # Collapse options list.
+        # Collapse options list; resizing redraws any siblings that were
+        # occluded by the drop-down list.
         self.resize(height = 3)
 
-        # Redraw siblings that may have been occluded by drop-down list.
-        self._ancestor.tag_redraw()
-
         # Scroll to the highlighted option.
         self._row_scroll = self._highlight
 
-        # Set state.
+        # Set state, drawing the options list and its label in tree order.
         self._expanded = False
-        self._overlayed = False
+        self._is_overlay = self.linked_label._is_overlay = False
 
 
     def expand(self):
@@ -1398,12 +1772,13 @@ class SelectField(Labeled):
         sy = self.get_position()[1]
         option_count = ph if self._options_limit < 0 else self._options_limit
         option_count = min(option_count, ph - sy - 3)
-        option_count = min(option_count, len(self._options))
+        option_count = min(option_count, self._count)
         sh = option_count + 2
         self.resize(height = sh)
 
-        # Set state.
+        # Set state, drawing the options list and its label over siblings.
         self._expanded = True
+        self._is_overlay = self.linked_label._is_overlay = True
 
 
     def limit_options(self, count):
@@ -1420,88 +1795,334 @@ class SelectField(Labeled):
 
     def load_options(self, options):
         '''
-        Loads enumerated options from a list
+        Loads enumerated options from a list, or from an option source that
+        is asked only for the pages of options being shown; typing finds
+        options through the find method of the source, or else only among
+        the pages fetched so far
 
         Parameters:
-            options (list<str>): Options list
+            options (iterable<str>|OptionSource): Options list or source
         '''
-        self._options = ['-- NO SELECTION --']
-        self._options.extend(options)
+        if not isinstance(options, OptionSource):
+            options = OptionList(options)
+        self._source = options
+        self._count = len(options) + 1
+        self._highlight = min(self._highlight, self._count - 1)
+        self._typeahead = ''
+
+        # Discard pages of the previous source, including pending ones.
+        self._pages = {}
+        self._pending.clear()
+        self._generation += 1
+        self._set_loading(False)
+        self.tag_redraw()
         if self._expanded:
             self.expand()
 
 
-class Table(Labeled):
+    def _find_option(self, char):
+        '''
+        Finds an option by text typed one character at a time; text that is
+        typed within a timeout of the previous character extends the search,
+        and repeating a single character cycles through options starting
+        with it, unless an option starts with the repeated text
+
+        Parameters:
+            char (str): Lowercase character
+
+        Returns:
+            int: Index of the found option; None if no option is found
+        '''
+        # Discard typed text after a pause.
+        now = Widget.scheduler.now()
+        if now - self._typeahead_time > self._typeahead_timeout:
+            self._typeahead = ''
+        self._typeahead_time = now
+
+        # Cycle through options starting with a repeated character.
+        text = self._typeahead + char
+        is_cycling = len(text) > 1 and text == char * len(text)
+        self._typeahead = text
+
+        # Search the option source, which excludes the option for no
+        # selection, or else the fetched options of a source that cannot be
+        # searched.
+        index = self._source.find(text, self._highlight - 1, is_cycling)
+        if index is None and not isinstance(self._source, OptionList):
+            index = self._find_fetched(text, is_cycling)
+        return None if index is None else index + 1
+
+
+    def _find_fetched(self, text, cycle):
+        '''
+        Finds an option among the fetched pages of options; see
+        OptionSource.find
+
+        Parameters:
+            text (str): Lowercase text
+            cycle (bool): Flag indicating that the text repeats a character
+
+        Returns:
+            int: Index of the found option within the option source; None if
+                no fetched option is found
+        '''
+        indices = []
+        options = []
+        for page in sorted(self._pages):
+            start = page * self._page_size
+            indices.extend(range(start, start + len(self._pages[page])))
+            options.extend(self._pages[page])
+
+        # Search from the highlighted option, if it is fetched.
+        current = self._highlight - 1
+        position = bisect.bisect_left(indices, current)
+        if position == len(indices) or indices[position] != current:
+            position = -1
+        found = OptionList(options).find(text, position, cycle)
+        return None if found is None else indices[found]
+
+
+    def _option(self, index):
+        '''
+        Gets an option, fetching its page if necessary
+
+        Parameters:
+            index (int): Option index
+
+        Returns:
+            str: Option; None while its page is being fetched
+        '''
+        if index == 0:
+            return '-- NO SELECTION --'
+
+        # Mark the page as most recently used.
+        page, i = divmod(index - 1, self._page_size)
+        options = self._pages.pop(page, None)
+        if options is None:
+            self._fetch_page(page)
+            options = self._pages.pop(page, None)
+            if options is None:
+                return None
+        self._pages[page] = options
+        return options[i] if i < len(options) else None
+
+
+    def _fetch_page(self, page):
+        '''
+        Fetches a page of options from the option source
+
+        Parameters:
+            page (int): Page index
+        '''
+        if page in self._pending:
+            return
+        start = page * self._page_size
+        stop = min(start + self._page_size, self._count - 1)
+        result = self._source.fetch(start, stop)
+
+        # Store options that are fetched synchronously.
+        if not hasattr(result, 'add_done_callback'):
+            self._store_page(page, result)
+            return
+
+        # Store options on this thread once they are fetched, and indicate
+        # loading until then.
+        self._pending.add(page)
+        self._set_loading(True)
+        generation = self._generation
+        result.add_done_callback(
+            lambda future: Widget.scheduler.call_soon_threadsafe(
+                lambda: self._receive_page(generation, page, future)
+            )
+        )
+
+
+    def _receive_page(self, generation, page, future):
+        '''
+        Stores a page of options that was fetched asynchronously
+
+        Parameters:
+            generation (int): Number of loaded option sources at the time of
+                the request
+            page (int): Page index
+            future (Future): Completed request
+        '''
+        # Drop pages of replaced option sources.
+        if generation != self._generation:
+            return
+        self._pending.discard(page)
+        if not self._pending:
+            self._set_loading(False)
+
+        # Report errors raised by the option source.
+        error = future.exception()
+        if error:
+            signal = signals.Signal('UI_FEEDBACK', message = str(error), error = True)
+            self.bubble(**signal.data)
+            return
+
+        self._store_page(page, future.result())
+        self.tag_redraw()
+
+
+    def _store_page(self, page, options):
+        '''
+        Stores a page of options, discarding the least recently used pages
+        beyond the page limit
+
+        Parameters:
+            page (int): Page index
+            options (list<str>): Options
+        '''
+        pages = self._pages
+        pages[page] = list(options)
+        while len(pages) > self._page_limit:
+            del pages[next(iter(pages))]
+
+
+    def _scroll_to_highlight(self):
+        ''' Scrolls the highlighted option into view '''
+        margin = [1, 1, 1, 1]
+        effective_height = self.get_size()[1] - margin[2] - margin[3]
+        if self._highlight < self._row_scroll:
+            self._row_scroll = self._highlight
+        elif self._highlight >= self._row_scroll + effective_height:
+            self._row_scroll = self._highlight - effective_height + 1
+
+
+class Table(Searchable):
     '''
     Display widget for tabulated data
 
     Parameters:
         _header (list<str>): Column names for tabulated data
-        _body (list<str>): Rows of tabulated data
+        _source (RowSource): Rows of tabulated data, fetched as they become
+            visible
+        _item_widths (list<int>): Length of the longest known item of each
+            column
         _col_widths (list<int>): Span of each column in characters
         _col_scroll (int): Index corresponding to left of viewable region
         _row_scroll (int): Index corresponding to top of viewable region
+        _header_line (str): Formatted header; None until drawn
+        _line_cache (dict<int:str>): Formatted rows keyed by row index; valid
+            for the current column widths
+        _line_cache_limit (int): Number of formatted rows to cache
+        _stream_timer (list): Scheduler timer for ingesting the next chunk of
+            streamed rows
+        _view (ViewSource): Sorted and filtered view of the source
+        _view_job (generator): Pending computation of the view
+        _view_stale (bool): Flag indicating that rows were appended while
+            the view was computed, so it is updated again once computed
+        _view_step_time (float): Maximum time (sec) spent computing the view
+            between user input events
+        _view_timer (list): Scheduler timer for the next computation step
+        _view_version (int): Version of the view that cached lines belong to
     '''
     def __init__(self, label, parent, focus_key = None):
         # Initialize inherited state.
         super().__init__(label, parent, focus_key)
 
         # Initialize attributes.
+        self._line_cache = {}
+        self._line_cache_limit = 1024
+        self._stream_timer = None
+        self._view_job = None
+        self._view_stale = False
+        self._view_step_time = 0.01
+        self._view_timer = None
         self.clear()
 
 
     def clear(self, **kwargs):
+        self._stop_search()
+        self.stop_stream()
+        self._stop_view_job()
         self._header = []
-        self._body = []
+        self._source = ListSource()
+        self._view = ViewSource(self._source)
+        self._view_version = self._view.version
+        self._item_widths = []
         self._col_widths = []
         self._col_scroll = 0
         self._row_scroll = 0
+        self._header_line = None
+        self._line_cache.clear()
 
 
     def report(self):
-        return {'usage': 'Up/Down/Left/Right/PgUp/PgDn: Scroll'}
+        if self._search:
+            return super().report()
+        return {'usage': 'Up/Down/Left/Right/PgUp/PgDn: Scroll, S: Sort, ^F: Find'}
+
+
+    def decompose(
+        self, table = [], pretty_print = '', source = None, append = False,
+        columnar = False, memory_budget = None, delta = None, **kwargs
+    ):
+        '''
+        Parameters:
+            table (sequence<sequence>): Header followed by rows of items
+                (Optional)
+            pretty_print (str|bytes|file): ASCII table, as printed by psql;
+                parsed as it is loaded (Optional)
+            source (RowSource): Rows to fetch as they become visible; any
+                object providing header, __len__, fetch, and optionally
+                col_widths (Optional)
+            append (bool): Flag indicating that the rows of the given table
+                continue the current table; the first row is only treated as
+                the header if no header is set yet (Optional)
+            columnar (bool): Flag indicating that the given table is stored in
+                NumPy arrays, one per column, rather than as text; suits
+                results with many numeric columns (Optional)
+            memory_budget (int): Estimated memory (bytes) that rows may
+                occupy before the rest are spilled to a temporary file;
+                unlimited if None (Optional)
+            delta (dict): Keyed changes to the current table, passed on to
+                the apply_delta method as keyword arguments; changes that the
+                source rejects are reported rather than raised (Optional)
+        '''
+        # Append chunks of rows to the current table.
+        if append and self._header:
+            self.append(table)
+            return
 
+        # Change rows of the current table by key.
+        if delta is not None:
+            self.apply_delta(**delta)
+            return
 
-    def decompose(self, table = [], pretty_print = '', **kwargs):
         self.tag_redraw()
         self.clear()
 
-        # Parse ASCII "Pretty Print" text, if available.
-        if pretty_print:
-            table = [
-                [item.strip() for item in row.split('|')[1:-1]]
-                for row in pretty_print.splitlines()
-                if row[0] == '|'
-            ]
-
-        # Convert table items into strings.
-        table = [[str(item) if type(item) in {int, str} else '' for item in row] for row in table]
-
-        # Separate table data into header and body sections.
-        self._header = table[0]
-        self._body = table[1:]
-
-        # Calculate the maximum width of each column.
-        self._col_widths = [
-            max([len(row[i]) + 4 for row in table])
-            for i in range(len(self._header))
-        ]
-        self._col_widths[-1] -= 4
-
-        # Validate received data.
-        header_len = len(self._header)
-        for row in self._body:
-
-            # Clear table data, and indicate error.
-            if len(row) != header_len:
-                self.clear()
-                signal = signals.Signal(
-                    'UI_FEEDBACK',
-                    message = 'Mismatch between table header & body column counts',
-                    error = True
-                )
-                self.bubble(**signal.data)
-                break;
+        # Load tabulated data, parsing ASCII "Pretty Print" text if
+        # available, and validate received data.
+        try:
+            if source is None:
+
+                # Spill rows past the memory budget, if any, to disk.
+                kind, options = ListSource, {}
+                if memory_budget is not None:
+                    kind, options = SpillSource, {'memory_budget': memory_budget}
+
+                if pretty_print:
+                    source = kind.from_pretty_print(pretty_print, **options)
+                elif columnar:
+                    source = ArraySource.from_table(table)
+                else:
+                    source = kind(table, **options)
+        except ValueError as e:
+            signal = signals.Signal('UI_FEEDBACK', message = str(e), error = True)
+            self.bubble(**signal.data)
+            return
+        self._source = source
+        self._view = ViewSource(source)
+        self._header = source.header
+
+        # Calculate the width of each column from hints, or from the header
+        # until rows are fetched.
+        get_widths = getattr(source, 'col_widths', None)
+        widths = get_widths() if get_widths else None
+        self._set_widths(list(widths) if widths else [len(name) for name in self._header])
 
 
     def draw(self):
@@ -1509,11 +2130,11 @@ class Table(Labeled):
         margin = [2, 3, 1, 1]
         effective_width = width - margin[0] - margin[1]
         effective_height = height - margin[2] - margin[3] - 2
-        header = self._header
-        body = self._body
+        num_rows = len(self._view)
         col_widths = self._col_widths
         col_scroll = self._col_scroll
         row_scroll = self._row_scroll
+        lines = self._formatted_lines(row_scroll, min(num_rows, row_scroll + effective_height))
 
         # Draw border around both the table and header section.
         self.draw_border(offset_right = 1)
@@ -1523,20 +2144,28 @@ class Table(Labeled):
         )
 
         # Draw the table header.
-        line = ''.join([
-            '{:<{}}'.format(header[i], col_widths[i])
-            for i in range(len(header))
-        ])
-        self.draw_text(line[col_scroll:], row = margin[2], margin = margin, fit = 'NO_WRAP')
+        if self._header_line is None:
+            self._header_line = self._format_row(self._header)
+        line = self._header_line[col_scroll:col_scroll + effective_width]
+        self.draw_text(line, row = margin[2], margin = margin, fit = 'NO_WRAP')
         margin[2] += 2
 
-        # Draw the table body.
-        for i in range(min(len(body[row_scroll:]), effective_height)):
-            line = ''.join([
-                '{:<{}}'.format(body[i + row_scroll][j], col_widths[j])
-                for j in range(len(body[i + row_scroll]))
-            ])
-            self.draw_text(line[col_scroll:], row = margin[2], margin = margin, fit = 'NO_WRAP')
+        # Draw the table body, cutting the visible window out of each line.
+        search = self._search if self._search and self._search.pattern else None
+        for row, line in enumerate(lines, row_scroll):
+            visible = line[col_scroll:col_scroll + effective_width]
+            self.draw_text(visible, row = margin[2], margin = margin, fit = 'NO_WRAP')
+
+            # Highlight matches of the search underway, if any.
+            if search and search.position(row) is not None:
+                match_attr, current_attr = self._match_styles()
+                attr = current_attr if row == self._search_match else match_attr
+                pattern = fold_case(search.pattern)
+                for i in self._find_in_row(row, pattern):
+                    self.draw_highlight(
+                        i + margin[0] - col_scroll, margin[2], len(pattern), attr,
+                        margin = margin
+                    )
             margin[2] += 1
 
         # Indicate if content exists outside of the visible region.
@@ -1560,17 +2189,23 @@ class Table(Labeled):
             self.draw_text(up_arrow, padding = padding, align = 'CENTER', attr = attr)
 
         # Indicate content below.
-        if row_scroll < len(body) - effective_height:
+        if row_scroll < num_rows - effective_height:
             down_arrow = u'\u25BC'
             self.draw_text(down_arrow, row = height - 1, padding = padding, align = 'CENTER', attr = attr)
 
+        self._draw_search()
+
 
     def operate(self, c):
+        # Find text.
+        if self._operate_search(c):
+            return 'CONTINUE'
+
         margin = [2, 3, 3, 1]
         width, height = self.get_size()
         effective_width = width - margin[0] - margin[1]
         effective_height = height - margin[2] - margin[3]
-        body = self._body
+        num_rows = len(self._view)
         col_widths = self._col_widths
         col_scroll = self._col_scroll
         row_scroll = self._row_scroll
@@ -1599,7 +2234,7 @@ class Table(Labeled):
             self.tag_redraw()
             self._row_scroll = min(
                 row_scroll + 1 * scroll_sensitivity,
-                max(0, len(self._body) - effective_height)
+                max(0, num_rows - effective_height)
             )
 
         # Scroll up a full page.
@@ -1612,7 +2247,411 @@ class Table(Labeled):
             self.tag_redraw()
             self._row_scroll = min(
                 row_scroll + effective_height * scroll_sensitivity,
-                max(0, len(self._body) - effective_height)
+                max(0, num_rows - effective_height)
             )
 
+        # Sort by the leftmost visible column, cycling through ascending,
+        # descending, and unsorted orders.
+        elif c in {ord('s'), ord('S')} and col_widths:
+            column = 0
+            while column < len(col_widths) - 1 and sum(col_widths[:column + 1]) <= col_scroll:
+                column += 1
+            sort = self._view.sort
+            if sort == (column, False):
+                self.sort(column, descending = True)
+            elif sort == (column, True):
+                self.sort()
+            else:
+                self.sort(column)
+
         return 'CONTINUE'
+
+
+    def sort(self, column = None, descending = False):
+        '''
+        Sorts rows by the given column; numbers are ordered numerically and
+        text case-insensitively
+
+        Parameters:
+            column (int): Column index; rows are unsorted if omitted
+                (Optional)
+            descending (bool): Flag indicating a descending order (Optional)
+        '''
+        sort = None if column is None else (column, descending)
+        self._update_view(sort, self._view.filter)
+
+
+    def filter(self, text = None, column = None):
+        '''
+        Only shows rows with an item that contains the given text, ignoring
+        case
+
+        Parameters:
+            text (str): Text to find; rows are unfiltered if omitted
+                (Optional)
+            column (int): Index of column to search; all columns are searched
+                if omitted (Optional)
+        '''
+        filter = (column, text) if text else None
+        self._update_view(self._view.sort, filter)
+
+
+    def append(self, rows):
+        '''
+        Appends rows of items to this table; columns widen as needed
+
+        Parameters:
+            rows (iterable<sequence>): Rows of items
+
+        Returns:
+            bool: True if all rows are appended; False otherwise
+        '''
+        # Report sources that cannot be appended to.
+        source = self._source
+        if not hasattr(source, 'extend'):
+            message = '{} does not support appending rows'.format(type(source).__name__)
+            signal = signals.Signal('UI_FEEDBACK', message = message, error = True)
+            self.bubble(**signal.data)
+            return False
+
+        # Keep rows appended before any invalid row.
+        view = self._view
+        start = len(source)
+        try:
+            view.extend(rows)
+        except ValueError as e:
+            signal = signals.Signal('UI_FEEDBACK', message = str(e), error = True)
+            self.bubble(**signal.data)
+            return False
+        finally:
+            self._update_appended(start)
+
+            # Merge appended rows into the sorted or filtered view, once the
+            # view underway, if any, is computed.
+            if self._view_job:
+                self._view_stale = True
+            elif view.sort or view.filter:
+                self._update_view(view.sort, view.filter, keep_scroll = True)
+        return True
+
+
+    def apply_delta(self, key = 0, insert = (), update = (), delete = ()):
+        '''
+        Changes rows identified by the item in a key column, keeping the
+        scroll position; only changed rows are formatted again, and this
+        table is only redrawn if a changed row is visible
+
+        Parameters:
+            key (int): Column index of keys (Optional)
+            insert (iterable<sequence>): Rows to append; rows whose keys
+                exist replace them instead (Optional)
+            update (iterable<sequence>): Rows to replace; rows whose keys do
+                not exist are ignored (Optional)
+            delete (iterable): Keys of rows to remove (Optional)
+
+        Returns:
+            bool: True if the changes are applied; False if they are rejected
+        '''
+        # Report sources that cannot be changed by key.
+        source = self._source
+        if not hasattr(source, 'apply_delta'):
+            message = '{} does not support keyed deltas'.format(type(source).__name__)
+            signal = signals.Signal('UI_FEEDBACK', message = message, error = True)
+            self.bubble(**signal.data)
+            return False
+
+        view = self._view
+        num_rows = len(source)
+        try:
+            updated, deleted = view.apply_delta(key, insert, update, delete)
+        except ValueError as e:
+            signal = signals.Signal('UI_FEEDBACK', message = str(e), error = True)
+            self.bubble(**signal.data)
+            return False
+
+        # Keep the scroll position within the remaining rows.
+        effective_height = self.get_size()[1] - 4
+        self._row_scroll = min(self._row_scroll, max(0, len(view) - effective_height))
+
+        # Widen columns to fit changed rows, which formats all rows again.
+        widths = source.col_widths()
+        if widths and widths != self._item_widths:
+            self._set_widths(list(widths))
+            self.tag_redraw()
+
+        # Sort and filter changed rows.
+        if view.sort or view.filter:
+            self._update_view(view.sort, view.filter, keep_scroll = True)
+            return True
+
+        # Rows after the first removed or added row move.
+        start = self._row_scroll
+        stop = start + effective_height
+        lines = self._line_cache
+        if deleted or len(source) != num_rows:
+            moved = deleted[0] if deleted else num_rows
+            for i in [i for i in lines if i >= moved]:
+                del lines[i]
+            if moved <= stop:
+                self.tag_redraw()
+
+        # Format updated rows again once they are drawn.
+        for i in updated:
+            lines.pop(i, None)
+            if start <= i < stop:
+                self.tag_redraw()
+        return True
+
+
+    def stream(self, rows, header = None, chunk_size = 256):
+        '''
+        Incrementally appends rows to this table between user input events,
+        such as rows from a generator or a database cursor; replaces the
+        current table
+
+        Parameters:
+            rows (iterable<sequence>): Rows of items; the first row is the
+                header unless one is given
+            header (sequence<str>): Column names (Optional)
+            chunk_size (int): Number of rows to append at a time (Optional)
+        '''
+        rows = iter(rows)
+        if header is None:
+            header = next(rows, None)
+            if header is None:
+                return
+        self.decompose(table = [header])
+
+        def ingest():
+            self._stream_timer = None
+            chunk = list(itertools.islice(rows, chunk_size))
+            if chunk and self.append(chunk):
+                self._stream_timer = Widget.scheduler.call_later(0, ingest)
+
+        self._stream_timer = Widget.scheduler.call_later(0, ingest)
+
+
+    def stop_stream(self):
+        ''' Stops appending streamed rows '''
+        if self._stream_timer:
+            Widget.scheduler.cancel(self._stream_timer)
+            self._stream_timer = None
+
+
+    def _update_view(self, sort, filter, keep_scroll = False):
+        '''
+        Computes the sorted and filtered view of this table's rows in steps
+        between user input events, showing rows as they are computed
+
+        Parameters:
+            sort (2-tuple): Column index and descending flag
+            filter (2-tuple): Column index, or None, and text
+            keep_scroll (bool): Flag indicating that the scroll position is
+                kept rather than reset to the first row (Optional)
+        '''
+        self._stop_view_job()
+        if not keep_scroll:
+            self._row_scroll = 0
+        self._view_job = job = self._view.update(sort, filter)
+
+        def step():
+            self._view_timer = None
+            self.tag_redraw()
+
+            # Yield to user input once the step time is spent.
+            deadline = time.perf_counter() + self._view_step_time
+            for _ in job:
+                if time.perf_counter() >= deadline:
+                    self._view_timer = Widget.scheduler.call_later(0, step)
+                    return
+            self._view_job = None
+            self._set_loading(False)
+
+            # Merge rows appended meanwhile.
+            if self._view_stale:
+                view = self._view
+                self._update_view(view.sort, view.filter, keep_scroll = True)
+
+        self._set_loading(True)
+        step()
+
+
+    def _stop_view_job(self):
+        ''' Stops computing the view '''
+        if self._view_timer:
+            Widget.scheduler.cancel(self._view_timer)
+            self._view_timer = None
+        self._view_stale = False
+        if self._view_job:
+            self._view_job = None
+            self._set_loading(False)
+
+
+    def _update_appended(self, start):
+        '''
+        Widens columns to fit appended rows, and redraws if they are visible
+
+        Parameters:
+            start (int): Index of the first appended row
+        '''
+        widths = self._source.col_widths()
+        if widths and widths != self._item_widths:
+            self._set_widths(list(widths))
+            self.tag_redraw()
+
+        # Appended rows are visible if they start above the bottom border,
+        # where content below is indicated.
+        effective_height = self.get_size()[1] - 4
+        if start <= self._row_scroll + effective_height:
+            self.tag_redraw()
+
+
+    def _get_search_state(self):
+        view = self._view
+        return (id(view), view.version, len(view))
+
+
+    def _search_scan(self, pattern):
+        view = self._view
+        chunk_size = 1000
+        matches = []
+        for start in range(0, len(view), chunk_size):
+            for i, row in enumerate(view.fetch(start, start + chunk_size), start):
+                if any(pattern in fold_case(item) for item in row):
+                    matches.append(i)
+        return matches
+
+
+    def _search_test(self, row, pattern):
+        return any(pattern in fold_case(item) for item in self._view.fetch(row, row + 1)[0])
+
+
+    def _search_key(self):
+        # Search from the top of the viewable region.
+        return self._row_scroll
+
+
+    def _show_match(self, row):
+        margin = [2, 3, 3, 1]
+        width, height = self.get_size()
+        effective_width = width - margin[0] - margin[1]
+        effective_height = height - margin[2] - margin[3]
+
+        # Scroll the matching row into view.
+        if not self._row_scroll <= row < self._row_scroll + effective_height:
+            self._row_scroll = min(row, max(0, len(self._view) - effective_height))
+
+        # Scroll the first occurrence within the row into view.
+        offsets = self._find_in_row(row, fold_case(self._search.pattern))
+        length = len(self._search.pattern)
+        col_scroll = self._col_scroll
+        if offsets and not col_scroll <= offsets[0] <= col_scroll + effective_width - length:
+            self._col_scroll = max(0, min(offsets[0], sum(self._col_widths) - effective_width))
+
+
+    def _find_in_row(self, row, pattern):
+        '''
+        Finds matches of a pattern within each item of the given row, as the
+        _search_test method does, rather than across the padding between
+        items
+
+        Parameters:
+            row (int): Row index
+            pattern (str): Pattern lowercased by fold_case
+
+        Returns:
+            list<int>: Offsets of matches within the formatted row
+        '''
+        offsets = []
+        start = 0
+        for item, width in zip(self._view.fetch(row, row + 1)[0], self._col_widths):
+            item = fold_case(item)
+            i = item.find(pattern)
+            while i >= 0:
+                offsets.append(start + i)
+                i = item.find(pattern, i + 1)
+            start += width
+        return offsets
+
+
+    def _format_row(self, row):
+        '''
+        Pads the items of the given row to their column widths
+
+        Parameters:
+            row (list<str>): Row of text
+
+        Returns:
+            str: Formatted row
+        '''
+        return ''.join([item.ljust(width) for item, width in zip(row, self._col_widths)])
+
+
+    def _formatted_lines(self, start, stop):
+        '''
+        Gets formatted rows, fetching and formatting those that are not cached
+
+        Parameters:
+            start (int): Index of first row
+            stop (int): Index after last row
+
+        Returns:
+            list<str>: Formatted rows
+        '''
+        lines = self._line_cache
+
+        # Cached lines belong to a previous view.
+        if self._view_version != self._view.version:
+            self._view_version = self._view.version
+            lines.clear()
+
+        if any(i not in lines for i in range(start, stop)):
+
+            # Widen columns to fit fetched rows, which invalidates the cache.
+            rows = self._view.fetch(start, stop)
+            self._fit_rows(rows)
+
+            # Bound the size of the cache.
+            if len(lines) + len(rows) > self._line_cache_limit:
+                lines.clear()
+            for i, row in enumerate(rows, start):
+                if i not in lines:
+                    lines[i] = self._format_row(row)
+
+        return [lines[i] for i in range(start, stop) if i in lines]
+
+
+    def _fit_rows(self, rows):
+        '''
+        Widens columns to fit the given rows
+
+        Parameters:
+            rows (list<list<str>>): Rows of text
+        '''
+        widths = self._item_widths
+        changed = False
+        for row in rows:
+            for i, item in enumerate(row[:len(widths)]):
+                if len(item) > widths[i]:
+                    widths[i] = len(item)
+                    changed = True
+        if changed:
+            self._set_widths(widths)
+
+
+    def _set_widths(self, widths):
+        '''
+        Sets the length of the longest item of each column, and updates the
+        span of each column accordingly
+
+        Parameters:
+            widths (list<int>): Lengths in characters
+        '''
+        self._item_widths = widths
+        self._col_widths = [width + 4 for width in widths]
+        if self._col_widths:
+            self._col_widths[-1] -= 4
+
+        # Formatted lines are only valid for the previous widths.
+        self._header_line = None
+        self._line_cache.clear()